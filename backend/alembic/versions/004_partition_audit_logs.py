@@ -0,0 +1,144 @@
+"""partition_audit_logs
+
+Revision ID: 004_partition_audit_logs
+Revises: 003_documents
+Create Date: 2026-01-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_partition_audit_logs'
+down_revision: Union[str, Sequence[str], None] = '003_documents'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Number of monthly partitions created ahead of the current month
+PARTITIONS_AHEAD = 3
+
+
+def upgrade() -> None:
+    """Convert audit_logs into a table range-partitioned by month on created_at."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_old;")
+    # Free the constraint name for the new table's primary key
+    op.execute("ALTER TABLE audit_logs_old RENAME CONSTRAINT audit_logs_pkey TO audit_logs_old_pkey;")
+    for name in (
+        'idx_audit_logs_action_entity',
+        'idx_audit_logs_created_at',
+        'idx_audit_logs_entity_type',
+        'idx_audit_logs_role_id',
+        'idx_audit_logs_target_user_id',
+        'idx_audit_logs_user_id',
+        'idx_audit_logs_user_target',
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {name};")
+
+    # Partition key must be part of every unique constraint, including the PK
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            action VARCHAR(50) NOT NULL,
+            entity_type VARCHAR(50) NOT NULL,
+            entity_id VARCHAR(255) NOT NULL,
+            user_id UUID NOT NULL,
+            target_user_id UUID,
+            role_id UUID,
+            details TEXT,
+            ip_address VARCHAR(45),
+            user_agent TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at);
+    """)
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;")
+
+    # Creates the monthly partition containing the given date; called by
+    # scheduled maintenance to stay ahead of incoming rows
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_audit_logs_partition(month date) RETURNS void AS $$
+        DECLARE
+            start_date date := date_trunc('month', month)::date;
+            end_date date := (date_trunc('month', month) + interval '1 month')::date;
+            partition_name text := 'audit_logs_' || to_char(start_date, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                partition_name, start_date, end_date
+            );
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+        SELECT create_audit_logs_partition((date_trunc('month', now()) + make_interval(months => m))::date)
+        FROM generate_series(0, {PARTITIONS_AHEAD}) AS m;
+    """)
+
+    op.create_index('idx_audit_logs_action_entity', 'audit_logs', ['action', 'entity_type'], unique=False)
+    op.create_index('idx_audit_logs_entity_type', 'audit_logs', ['entity_type'], unique=False)
+    op.create_index('idx_audit_logs_role_id', 'audit_logs', ['role_id'], unique=False)
+    op.create_index('idx_audit_logs_target_user_id', 'audit_logs', ['target_user_id'], unique=False)
+    op.create_index('idx_audit_logs_user_id', 'audit_logs', ['user_id'], unique=False)
+    op.create_index('idx_audit_logs_user_target', 'audit_logs', ['user_id', 'target_user_id'], unique=False)
+    op.create_index(
+        'idx_audit_logs_created_at_brin',
+        'audit_logs',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin'
+    )
+
+    op.execute("""
+        INSERT INTO audit_logs (
+            id, action, entity_type, entity_id, user_id, target_user_id, role_id,
+            details, ip_address, user_agent, created_at
+        )
+        SELECT
+            id, action, entity_type, entity_id, user_id, target_user_id, role_id,
+            details, ip_address, user_agent, created_at
+        FROM audit_logs_old;
+    """)
+    op.execute("DROP TABLE audit_logs_old;")
+
+
+def downgrade() -> None:
+    """Restore audit_logs as a regular table."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned;")
+    op.execute(
+        "ALTER TABLE audit_logs_partitioned "
+        "RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey;"
+    )
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL,
+            action VARCHAR(50) NOT NULL,
+            entity_type VARCHAR(50) NOT NULL,
+            entity_id VARCHAR(255) NOT NULL,
+            user_id UUID NOT NULL,
+            target_user_id UUID,
+            role_id UUID,
+            details TEXT,
+            ip_address VARCHAR(45),
+            user_agent TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id)
+        );
+    """)
+    op.execute("""
+        INSERT INTO audit_logs
+        SELECT
+            id, action, entity_type, entity_id, user_id, target_user_id, role_id,
+            details, ip_address, user_agent, created_at
+        FROM audit_logs_partitioned;
+    """)
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE;")
+    op.execute("DROP FUNCTION IF EXISTS create_audit_logs_partition(date);")
+
+    op.create_index('idx_audit_logs_action_entity', 'audit_logs', ['action', 'entity_type'], unique=False)
+    op.create_index('idx_audit_logs_created_at', 'audit_logs', ['created_at'], unique=False)
+    op.create_index('idx_audit_logs_entity_type', 'audit_logs', ['entity_type'], unique=False)
+    op.create_index('idx_audit_logs_role_id', 'audit_logs', ['role_id'], unique=False)
+    op.create_index('idx_audit_logs_target_user_id', 'audit_logs', ['target_user_id'], unique=False)
+    op.create_index('idx_audit_logs_user_id', 'audit_logs', ['user_id'], unique=False)
+    op.create_index('idx_audit_logs_user_target', 'audit_logs', ['user_id', 'target_user_id'], unique=False)
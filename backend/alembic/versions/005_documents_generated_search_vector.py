@@ -0,0 +1,77 @@
+"""documents_generated_search_vector
+
+Revision ID: 005_generated_search_vector
+Revises: 004_partition_audit_logs
+Create Date: 2026-01-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005_generated_search_vector'
+down_revision: Union[str, Sequence[str], None] = '004_partition_audit_logs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Replace the trigger-maintained search_vector with a STORED generated column."""
+    op.execute("DROP TRIGGER IF EXISTS documents_search_vector_trigger ON documents;")
+    op.execute("DROP FUNCTION IF EXISTS documents_search_vector_update();")
+
+    # Dropping the column also drops idx_documents_search_vector
+    op.drop_column('documents', 'search_vector')
+    op.execute(f"""
+        ALTER TABLE documents
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED;
+    """)
+
+    op.create_index(
+        'idx_documents_search_vector',
+        'documents',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain search_vector column maintained by a trigger."""
+    op.drop_column('documents', 'search_vector')
+    op.add_column('documents', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION documents_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER documents_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, content ON documents
+        FOR EACH ROW
+        EXECUTE FUNCTION documents_search_vector_update();
+    """)
+    op.execute(f"UPDATE documents SET search_vector = {SEARCH_VECTOR_EXPRESSION};")
+
+    op.create_index(
+        'idx_documents_search_vector',
+        'documents',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin'
+    )
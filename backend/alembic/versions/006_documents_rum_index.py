@@ -0,0 +1,50 @@
+"""documents_rum_index
+
+Revision ID: 006_rum_index
+Revises: 005_generated_search_vector
+Create Date: 2026-01-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = '006_rum_index'
+down_revision: Union[str, Sequence[str], None] = '005_generated_search_vector'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the search_vector GIN index for RUM when enabled."""
+    if not settings.SEARCH_USE_RUM:
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS rum;")
+    op.drop_index('idx_documents_search_vector', table_name='documents')
+    op.create_index(
+        'idx_documents_search_vector',
+        'documents',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='rum',
+        postgresql_ops={'search_vector': 'rum_tsvector_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Restore the GIN index on search_vector."""
+    if not settings.SEARCH_USE_RUM:
+        return
+
+    op.drop_index('idx_documents_search_vector', table_name='documents')
+    op.create_index(
+        'idx_documents_search_vector',
+        'documents',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin'
+    )
@@ -0,0 +1,105 @@
+"""user_permissions_mv
+
+Revision ID: 007_user_permissions_mv
+Revises: 006_rum_index
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_user_permissions_mv'
+down_revision: Union[str, Sequence[str], None] = '006_rum_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables feeding the view, with the row and statement events that can
+# change it
+REFRESH_TRIGGER_EVENTS = (
+    (
+        'user_roles',
+        'INSERT OR UPDATE OF user_id, role_id OR DELETE',
+        'INSERT OR UPDATE OF user_id, role_id OR DELETE OR TRUNCATE',
+    ),
+    (
+        'role_permissions',
+        'INSERT OR UPDATE OF role_id, permission_id OR DELETE',
+        'INSERT OR UPDATE OF role_id, permission_id OR DELETE OR TRUNCATE',
+    ),
+    (
+        'permissions',
+        'UPDATE OF resource, action, scope',
+        'UPDATE OF resource, action, scope',
+    ),
+)
+
+
+def upgrade() -> None:
+    """Create the user_permissions_mv materialized view and its refresh triggers."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW user_permissions_mv AS
+        SELECT DISTINCT
+            ur.user_id,
+            p.id AS permission_id,
+            p.resource,
+            p.action,
+            p.scope,
+            p.resource || ':' || p.action || ':' || p.scope AS permission_string
+        FROM user_roles ur
+        JOIN role_permissions rp ON rp.role_id = ur.role_id
+        JOIN permissions p ON p.id = rp.permission_id;
+    """)
+
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY;
+    # its leading user_id column also serves the per-user lookup
+    op.execute("""
+        CREATE UNIQUE INDEX idx_user_permissions_mv_user_permission
+        ON user_permissions_mv (user_id, permission_id);
+    """)
+
+    # A refresh rebuilds the whole view and concurrent refreshes serialize,
+    # so writers pay for it once per transaction: deferred row triggers fire
+    # at commit, the first one refreshes and the rest skip on a
+    # transaction-local flag. Statement triggers clear the flag so rows
+    # changed after an early refresh (SET CONSTRAINTS ... IMMEDIATE) get
+    # another one; TRUNCATE has no row triggers and refreshes right away.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION refresh_user_permissions_mv() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                REFRESH MATERIALIZED VIEW CONCURRENTLY user_permissions_mv;
+            ELSIF TG_LEVEL = 'STATEMENT' THEN
+                PERFORM set_config('rbac.user_permissions_mv_refreshed', '', true);
+            ELSIF current_setting('rbac.user_permissions_mv_refreshed', true)
+                    IS DISTINCT FROM 'on' THEN
+                PERFORM set_config('rbac.user_permissions_mv_refreshed', 'on', true);
+                REFRESH MATERIALIZED VIEW CONCURRENTLY user_permissions_mv;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for table, row_events, statement_events in REFRESH_TRIGGER_EVENTS:
+        op.execute(f"""
+            CREATE CONSTRAINT TRIGGER {table}_refresh_permissions_mv
+            AFTER {row_events} ON {table}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv();
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_refresh_permissions_mv_statement
+            AFTER {statement_events} ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv();
+        """)
+
+
+def downgrade() -> None:
+    """Drop the user_permissions_mv materialized view and its refresh triggers."""
+    for table, _, _ in reversed(REFRESH_TRIGGER_EVENTS):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_refresh_permissions_mv_statement ON {table};")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_refresh_permissions_mv ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS refresh_user_permissions_mv();")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS user_permissions_mv;")
@@ -0,0 +1,118 @@
+"""native_enums
+
+Revision ID: 008_native_enums
+Revises: 007_user_permissions_mv
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_native_enums'
+down_revision: Union[str, Sequence[str], None] = '007_user_permissions_mv'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values, original varchar length)
+ENUM_COLUMNS = (
+    ('permissions', 'scope', 'permission_scope', ('own', 'team', 'all'), 20),
+    ('users', 'auth_provider', 'auth_provider_enum', ('local', 'oidc', 'google', 'microsoft'), 50),
+    (
+        'audit_logs',
+        'action',
+        'audit_action_enum',
+        (
+            'role_assigned',
+            'role_removed',
+            'role_created',
+            'role_updated',
+            'role_deleted',
+            'permission_assigned',
+            'permission_removed',
+        ),
+        50,
+    ),
+)
+
+USER_PERMISSIONS_MV_SQL = """
+    CREATE MATERIALIZED VIEW user_permissions_mv AS
+    SELECT DISTINCT
+        ur.user_id,
+        p.id AS permission_id,
+        p.resource,
+        p.action,
+        p.scope,
+        p.resource || ':' || p.action || ':' || p.scope AS permission_string
+    FROM user_roles ur
+    JOIN role_permissions rp ON rp.role_id = ur.role_id
+    JOIN permissions p ON p.id = rp.permission_id;
+"""
+
+USER_PERMISSIONS_MV_INDEX_SQL = """
+    CREATE UNIQUE INDEX idx_user_permissions_mv_user_permission
+    ON user_permissions_mv (user_id, permission_id);
+"""
+
+# permissions refresh triggers from 007_user_permissions_mv; their UPDATE OF
+# column list pins the type of permissions.scope
+PERMISSIONS_REFRESH_TRIGGERS_SQL = (
+    """
+    CREATE CONSTRAINT TRIGGER permissions_refresh_permissions_mv
+    AFTER UPDATE OF resource, action, scope ON permissions
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+    """
+    CREATE TRIGGER permissions_refresh_permissions_mv_statement
+    AFTER UPDATE OF resource, action, scope ON permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+)
+
+
+def _drop_permissions_refresh_triggers() -> None:
+    """Drop the triggers that keep permissions.scope from changing type."""
+    op.execute("DROP TRIGGER IF EXISTS permissions_refresh_permissions_mv ON permissions;")
+    op.execute(
+        "DROP TRIGGER IF EXISTS permissions_refresh_permissions_mv_statement ON permissions;"
+    )
+
+
+def upgrade() -> None:
+    """Convert scope, auth_provider and audit action columns to native enums."""
+    # The materialized view and its refresh triggers depend on permissions.scope
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS user_permissions_mv;")
+    _drop_permissions_refresh_triggers()
+
+    for table, column, enum_name, values, _ in ENUM_COLUMNS:
+        labels = ", ".join(f"'{value}'" for value in values)
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({labels});")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING {column}::{enum_name};"
+        )
+
+    op.execute(USER_PERMISSIONS_MV_SQL)
+    op.execute(USER_PERMISSIONS_MV_INDEX_SQL)
+    for statement in PERMISSIONS_REFRESH_TRIGGERS_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Convert enum columns back to varchar."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS user_permissions_mv;")
+    _drop_permissions_refresh_triggers()
+
+    for table, column, enum_name, _, length in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR({length}) USING {column}::text;"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {enum_name};")
+
+    op.execute(USER_PERMISSIONS_MV_SQL)
+    op.execute(USER_PERMISSIONS_MV_INDEX_SQL)
+    for statement in PERMISSIONS_REFRESH_TRIGGERS_SQL:
+        op.execute(statement)
@@ -0,0 +1,48 @@
+"""audit_logs_jsonb_details
+
+Revision ID: 009_audit_jsonb_details
+Revises: 008_native_enums
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009_audit_jsonb_details'
+down_revision: Union[str, Sequence[str], None] = '008_native_enums'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store audit details as JSONB and drop redundant single-column indexes."""
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN details TYPE jsonb USING details::jsonb;")
+
+    # Covered by idx_audit_logs_action_entity / idx_audit_logs_user_target or unused
+    op.drop_index('idx_audit_logs_user_id', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_target_user_id', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_role_id', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_entity_type', table_name='audit_logs')
+
+    op.create_index(
+        'idx_audit_logs_details_gin',
+        'audit_logs',
+        ['details'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'details': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Restore TEXT audit details and single-column indexes."""
+    op.drop_index('idx_audit_logs_details_gin', table_name='audit_logs')
+
+    op.create_index('idx_audit_logs_entity_type', 'audit_logs', ['entity_type'], unique=False)
+    op.create_index('idx_audit_logs_role_id', 'audit_logs', ['role_id'], unique=False)
+    op.create_index('idx_audit_logs_target_user_id', 'audit_logs', ['target_user_id'], unique=False)
+    op.create_index('idx_audit_logs_user_id', 'audit_logs', ['user_id'], unique=False)
+
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN details TYPE text USING details::text;")
@@ -0,0 +1,118 @@
+"""rbac_id_arrays
+
+Revision ID: 010_rbac_id_arrays
+Revises: 009_audit_jsonb_details
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '010_rbac_id_arrays'
+down_revision: Union[str, Sequence[str], None] = '009_audit_jsonb_details'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Mirror user_roles / role_permissions into UUID[] columns on users / roles."""
+    op.add_column(
+        'users',
+        sa.Column(
+            'role_ids',
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        )
+    )
+    op.add_column(
+        'roles',
+        sa.Column(
+            'permission_ids',
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        )
+    )
+
+    # Backfill from the junction tables
+    op.execute("""
+        UPDATE users u SET role_ids = ARRAY(
+            SELECT role_id FROM user_roles WHERE user_id = u.id ORDER BY role_id
+        );
+    """)
+    op.execute("""
+        UPDATE roles r SET permission_ids = ARRAY(
+            SELECT permission_id FROM role_permissions WHERE role_id = r.id ORDER BY permission_id
+        );
+    """)
+
+    op.create_index('idx_users_role_ids', 'users', ['role_ids'], unique=False, postgresql_using='gin')
+    op.create_index('idx_roles_permission_ids', 'roles', ['permission_ids'], unique=False, postgresql_using='gin')
+
+    # Junction tables stay the write side; triggers keep the arrays current
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_user_role_ids() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE users SET role_ids = ARRAY(
+                    SELECT role_id FROM user_roles WHERE user_id = NEW.user_id ORDER BY role_id
+                ) WHERE id = NEW.user_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE users SET role_ids = ARRAY(
+                    SELECT role_id FROM user_roles WHERE user_id = OLD.user_id ORDER BY role_id
+                ) WHERE id = OLD.user_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER user_roles_sync_role_ids
+        AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE ON user_roles
+        FOR EACH ROW EXECUTE FUNCTION sync_user_role_ids();
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_role_permission_ids() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE roles SET permission_ids = ARRAY(
+                    SELECT permission_id FROM role_permissions
+                    WHERE role_id = NEW.role_id ORDER BY permission_id
+                ) WHERE id = NEW.role_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE roles SET permission_ids = ARRAY(
+                    SELECT permission_id FROM role_permissions
+                    WHERE role_id = OLD.role_id ORDER BY permission_id
+                ) WHERE id = OLD.role_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER role_permissions_sync_permission_ids
+        AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE ON role_permissions
+        FOR EACH ROW EXECUTE FUNCTION sync_role_permission_ids();
+    """)
+
+
+def downgrade() -> None:
+    """Drop the sync triggers and the denormalized id arrays."""
+    op.execute("DROP TRIGGER IF EXISTS role_permissions_sync_permission_ids ON role_permissions;")
+    op.execute("DROP FUNCTION IF EXISTS sync_role_permission_ids();")
+    op.execute("DROP TRIGGER IF EXISTS user_roles_sync_role_ids ON user_roles;")
+    op.execute("DROP FUNCTION IF EXISTS sync_user_role_ids();")
+
+    op.drop_index('idx_roles_permission_ids', table_name='roles')
+    op.drop_index('idx_users_role_ids', table_name='users')
+
+    op.drop_column('roles', 'permission_ids')
+    op.drop_column('users', 'role_ids')
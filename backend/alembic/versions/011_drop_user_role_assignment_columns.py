@@ -0,0 +1,101 @@
+"""drop_user_role_assignment_columns
+
+Revision ID: 011_user_role_assignments
+Revises: 010_rbac_id_arrays
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011_user_role_assignments'
+down_revision: Union[str, Sequence[str], None] = '010_rbac_id_arrays'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Serve role assignment metadata from audit_logs instead of user_roles."""
+    op.create_index(
+        'idx_audit_logs_role_assignments',
+        'audit_logs',
+        ['target_user_id', 'role_id', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text("action = 'role_assigned'")
+    )
+
+    op.execute("""
+        CREATE VIEW user_role_assignments AS
+        SELECT ur.user_id, ur.role_id, a.created_at AS assigned_at, a.user_id AS assigned_by
+        FROM user_roles ur
+        LEFT JOIN LATERAL (
+            SELECT al.created_at, al.user_id
+            FROM audit_logs al
+            WHERE al.action = 'role_assigned'
+              AND al.target_user_id = ur.user_id
+              AND al.role_id = ur.role_id
+            ORDER BY al.created_at DESC
+            LIMIT 1
+        ) a ON true;
+    """)
+
+    # Assignments made without an audit row (seeded or pre-audit ones) would
+    # lose their metadata with the columns; record them first. Unattributed
+    # assignments keep no actor rather than an invented one.
+    op.alter_column('audit_logs', 'user_id', nullable=True)
+    op.execute("""
+        INSERT INTO audit_logs (
+            action, entity_type, entity_id, user_id, target_user_id, role_id, details, created_at
+        )
+        SELECT
+            'role_assigned',
+            'user_role',
+            ur.user_id::text,
+            ur.assigned_by,
+            ur.user_id,
+            ur.role_id,
+            jsonb_build_object('role_id', ur.role_id, 'target_user_id', ur.user_id),
+            ur.assigned_at
+        FROM user_roles ur
+        WHERE NOT EXISTS (
+            SELECT 1
+            FROM audit_logs al
+            WHERE al.action = 'role_assigned'
+              AND al.target_user_id = ur.user_id
+              AND al.role_id = ur.role_id
+        );
+    """)
+
+    # Also drops the user_roles.assigned_by -> users.id foreign key
+    op.drop_column('user_roles', 'assigned_by')
+    op.drop_column('user_roles', 'assigned_at')
+
+
+def downgrade() -> None:
+    """Restore assigned_at / assigned_by on user_roles from the audit trail."""
+    op.add_column(
+        'user_roles',
+        sa.Column('assigned_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    )
+    op.add_column('user_roles', sa.Column('assigned_by', sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        'user_roles_assigned_by_fkey', 'user_roles', 'users', ['assigned_by'], ['id'], ondelete='SET NULL'
+    )
+
+    op.execute("""
+        UPDATE user_roles ur
+        SET assigned_at = COALESCE(ura.assigned_at, ur.assigned_at),
+            assigned_by = ura.assigned_by
+        FROM user_role_assignments ura
+        WHERE ura.user_id = ur.user_id AND ura.role_id = ur.role_id;
+    """)
+
+    op.execute("DROP VIEW IF EXISTS user_role_assignments;")
+    # Actor-less rows only come from the upgrade backfill; their assignments
+    # now carry assigned_at / assigned_by (NULL) again
+    op.execute("DELETE FROM audit_logs WHERE user_id IS NULL;")
+    op.alter_column('audit_logs', 'user_id', nullable=False)
+    op.drop_index('idx_audit_logs_role_assignments', table_name='audit_logs')
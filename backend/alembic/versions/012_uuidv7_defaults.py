@@ -0,0 +1,54 @@
+"""uuidv7_defaults
+
+Revision ID: 012_uuidv7_defaults
+Revises: 011_user_role_assignments
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012_uuidv7_defaults'
+down_revision: Union[str, Sequence[str], None] = '011_user_role_assignments'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Generate time-ordered UUIDv7 keys for server-defaulted primary keys."""
+    # postgres:16 has no built-in uuidv7(); derive one from gen_random_uuid()
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(
+                                    floor(
+                                        extract(epoch FROM clock_timestamp()) * 1000
+                                    )::bigint
+                                )
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE;
+    """)
+
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT uuid_generate_v7();")
+
+
+def downgrade() -> None:
+    """Restore random UUIDv4 server defaults."""
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT gen_random_uuid();")
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7();")
@@ -0,0 +1,28 @@
+"""users_email_citext
+
+Revision ID: 013_users_email_citext
+Revises: 012_uuidv7_defaults
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013_users_email_citext'
+down_revision: Union[str, Sequence[str], None] = '012_uuidv7_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store users.email as citext so ix_users_email is case-insensitive."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext;")
+    # Fails if case-only duplicates already exist; resolve those first
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE citext;")
+
+
+def downgrade() -> None:
+    """Restore VARCHAR(255) email."""
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE varchar(255);")
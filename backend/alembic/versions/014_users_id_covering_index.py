@@ -0,0 +1,32 @@
+"""users_id_covering_index
+
+Revision ID: 014_users_id_covering
+Revises: 013_users_email_citext
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '014_users_id_covering'
+down_revision: Union[str, Sequence[str], None] = '013_users_email_citext'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Cover document owner lookups (id, username, email) from the index."""
+    op.create_index(
+        'idx_users_id_covering',
+        'users',
+        ['id'],
+        unique=False,
+        postgresql_include=['username', 'email']
+    )
+
+
+def downgrade() -> None:
+    """Drop the covering index."""
+    op.drop_index('idx_users_id_covering', table_name='users')
@@ -0,0 +1,29 @@
+"""drop_permission_single_column_indexes
+
+Revision ID: 015_drop_permission_indexes
+Revises: 014_users_id_covering
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '015_drop_permission_indexes'
+down_revision: Union[str, Sequence[str], None] = '014_users_id_covering'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop single-column permission indexes dominated by the composites."""
+    # resource lookups use idx_permissions_resource_action; nothing filters on action alone
+    op.drop_index('ix_permissions_resource', table_name='permissions')
+    op.drop_index('ix_permissions_action', table_name='permissions')
+
+
+def downgrade() -> None:
+    """Restore single-column permission indexes."""
+    op.create_index('ix_permissions_action', 'permissions', ['action'], unique=False)
+    op.create_index('ix_permissions_resource', 'permissions', ['resource'], unique=False)
@@ -0,0 +1,45 @@
+"""audit_logs_bigint_id
+
+Revision ID: 016_audit_logs_bigint_id
+Revises: 015_drop_permission_indexes
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '016_audit_logs_bigint_id'
+down_revision: Union[str, Sequence[str], None] = '015_drop_permission_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the UUID audit log id with a bigint and key rows by (created_at, id)."""
+    op.execute("ALTER TABLE audit_logs DROP CONSTRAINT audit_logs_pkey;")
+    op.execute("ALTER TABLE audit_logs DROP COLUMN id;")
+
+    # IDENTITY is not supported on partitioned tables before PG 17
+    op.execute("CREATE SEQUENCE audit_logs_id_seq AS bigint;")
+    op.execute("""
+        ALTER TABLE audit_logs
+        ADD COLUMN id bigint NOT NULL DEFAULT nextval('audit_logs_id_seq');
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id;")
+
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (created_at, id);")
+
+
+def downgrade() -> None:
+    """Restore the UUID audit log id and (id, created_at) primary key."""
+    op.execute("ALTER TABLE audit_logs DROP CONSTRAINT audit_logs_pkey;")
+    op.execute("ALTER TABLE audit_logs DROP COLUMN id;")
+
+    op.execute("""
+        ALTER TABLE audit_logs
+        ADD COLUMN id uuid NOT NULL DEFAULT uuid_generate_v7();
+    """)
+
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at);")
@@ -0,0 +1,235 @@
+"""smallint_rbac_keys
+
+Revision ID: 017_smallint_rbac_keys
+Revises: 016_audit_logs_bigint_id
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '017_smallint_rbac_keys'
+down_revision: Union[str, Sequence[str], None] = '016_audit_logs_bigint_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_PERMISSIONS_MV_SQL = """
+    CREATE MATERIALIZED VIEW user_permissions_mv AS
+    SELECT DISTINCT
+        ur.user_id,
+        p.id AS permission_id,
+        p.resource,
+        p.action,
+        p.scope,
+        p.resource || ':' || p.action || ':' || p.scope AS permission_string
+    FROM user_roles ur
+    JOIN role_permissions rp ON rp.role_id = ur.role_id
+    JOIN permissions p ON p.id = rp.permission_id;
+"""
+
+USER_PERMISSIONS_MV_INDEX_SQL = """
+    CREATE UNIQUE INDEX idx_user_permissions_mv_user_permission
+    ON user_permissions_mv (user_id, permission_id);
+"""
+
+USER_ROLE_ASSIGNMENTS_VIEW_SQL = """
+    CREATE VIEW user_role_assignments AS
+    SELECT ur.user_id, ur.role_id, a.created_at AS assigned_at, a.user_id AS assigned_by
+    FROM user_roles ur
+    LEFT JOIN LATERAL (
+        SELECT al.created_at, al.user_id
+        FROM audit_logs al
+        WHERE al.action = 'role_assigned'
+          AND al.target_user_id = ur.user_id
+          AND al.role_id = ur.role_id
+        ORDER BY al.created_at DESC
+        LIMIT 1
+    ) a ON true;
+"""
+
+SYNC_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER user_roles_sync_role_ids
+    AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE ON user_roles
+    FOR EACH ROW EXECUTE FUNCTION sync_user_role_ids();
+    """,
+    """
+    CREATE TRIGGER role_permissions_sync_permission_ids
+    AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE ON role_permissions
+    FOR EACH ROW EXECUTE FUNCTION sync_role_permission_ids();
+    """,
+)
+
+# Refresh triggers from 007_user_permissions_mv; they refresh the view, so
+# they go and come back together with it
+REFRESH_TRIGGERS_SQL = (
+    """
+    CREATE CONSTRAINT TRIGGER user_roles_refresh_permissions_mv
+    AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE ON user_roles
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+    """
+    CREATE TRIGGER user_roles_refresh_permissions_mv_statement
+    AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE OR TRUNCATE ON user_roles
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+    """
+    CREATE CONSTRAINT TRIGGER role_permissions_refresh_permissions_mv
+    AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE ON role_permissions
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+    """
+    CREATE TRIGGER role_permissions_refresh_permissions_mv_statement
+    AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE OR TRUNCATE ON role_permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+    """
+    CREATE CONSTRAINT TRIGGER permissions_refresh_permissions_mv
+    AFTER UPDATE OF resource, action, scope ON permissions
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+    """
+    CREATE TRIGGER permissions_refresh_permissions_mv_statement
+    AFTER UPDATE OF resource, action, scope ON permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv();
+    """,
+)
+
+
+def _rekey(new_key_column: str, key_type: str) -> None:
+    """
+    Replace roles.id / permissions.id and every column referencing them.
+
+    New keys are added next to the old ones, references are remapped through
+    a join on the old key, then the old columns are dropped and the new ones
+    renamed into place.
+
+    Args:
+        new_key_column: Column definition for the new roles/permissions id
+        key_type: SQL type of the new key, used for referencing columns
+    """
+    # Dependent objects that pin the old column types
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS user_permissions_mv;")
+    op.execute("DROP VIEW IF EXISTS user_role_assignments;")
+    op.execute("DROP TRIGGER IF EXISTS user_roles_sync_role_ids ON user_roles;")
+    op.execute("DROP TRIGGER IF EXISTS role_permissions_sync_permission_ids ON role_permissions;")
+    # Would refresh the dropped view on the remapping UPDATEs below
+    for table in ('user_roles', 'role_permissions', 'permissions'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_refresh_permissions_mv ON {table};")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_refresh_permissions_mv_statement ON {table};")
+
+    # New keys, filled for existing rows
+    op.execute(f"ALTER TABLE roles ADD COLUMN new_id {new_key_column};")
+    op.execute(f"ALTER TABLE permissions ADD COLUMN new_id {new_key_column};")
+
+    # Remap references through the old keys
+    op.execute(f"ALTER TABLE user_roles ADD COLUMN new_role_id {key_type};")
+    op.execute("""
+        UPDATE user_roles ur SET new_role_id = r.new_id
+        FROM roles r WHERE r.id = ur.role_id;
+    """)
+    op.execute(f"""
+        ALTER TABLE role_permissions
+        ADD COLUMN new_role_id {key_type},
+        ADD COLUMN new_permission_id {key_type};
+    """)
+    op.execute("""
+        UPDATE role_permissions rp SET new_role_id = r.new_id, new_permission_id = p.new_id
+        FROM roles r, permissions p
+        WHERE r.id = rp.role_id AND p.id = rp.permission_id;
+    """)
+    # Rows for roles deleted since they were logged keep the id in details only
+    op.execute(f"ALTER TABLE audit_logs ADD COLUMN new_role_id {key_type};")
+    op.execute("""
+        UPDATE audit_logs al SET new_role_id = r.new_id
+        FROM roles r WHERE r.id = al.role_id;
+    """)
+
+    # Swap columns; dropping the old ones also drops their PK/FK constraints
+    # and indexes
+    op.execute("ALTER TABLE user_roles DROP COLUMN role_id;")
+    op.execute("ALTER TABLE user_roles RENAME COLUMN new_role_id TO role_id;")
+    op.execute("ALTER TABLE user_roles ALTER COLUMN role_id SET NOT NULL;")
+
+    op.execute("ALTER TABLE role_permissions DROP COLUMN role_id, DROP COLUMN permission_id;")
+    op.execute("ALTER TABLE role_permissions RENAME COLUMN new_role_id TO role_id;")
+    op.execute("ALTER TABLE role_permissions RENAME COLUMN new_permission_id TO permission_id;")
+    op.execute("""
+        ALTER TABLE role_permissions
+        ALTER COLUMN role_id SET NOT NULL,
+        ALTER COLUMN permission_id SET NOT NULL;
+    """)
+
+    op.execute("ALTER TABLE audit_logs DROP COLUMN role_id;")
+    op.execute("ALTER TABLE audit_logs RENAME COLUMN new_role_id TO role_id;")
+
+    for table in ('roles', 'permissions'):
+        op.execute(f"ALTER TABLE {table} DROP COLUMN id;")
+        op.execute(f"ALTER TABLE {table} RENAME COLUMN new_id TO id;")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id);")
+
+    op.execute("""
+        ALTER TABLE user_roles
+        ADD CONSTRAINT user_roles_pkey PRIMARY KEY (user_id, role_id),
+        ADD CONSTRAINT user_roles_role_id_fkey
+            FOREIGN KEY (role_id) REFERENCES roles (id) ON DELETE CASCADE;
+    """)
+    op.execute("""
+        ALTER TABLE role_permissions
+        ADD CONSTRAINT role_permissions_pkey PRIMARY KEY (role_id, permission_id),
+        ADD CONSTRAINT role_permissions_role_id_fkey
+            FOREIGN KEY (role_id) REFERENCES roles (id) ON DELETE CASCADE,
+        ADD CONSTRAINT role_permissions_permission_id_fkey
+            FOREIGN KEY (permission_id) REFERENCES permissions (id) ON DELETE CASCADE;
+    """)
+
+    # Denormalized id arrays (010_rbac_id_arrays) follow the key type
+    op.execute("ALTER TABLE users DROP COLUMN role_ids;")
+    op.execute(f"ALTER TABLE users ADD COLUMN role_ids {key_type}[] NOT NULL DEFAULT '{{}}';")
+    op.execute("""
+        UPDATE users u SET role_ids = ARRAY(
+            SELECT role_id FROM user_roles WHERE user_id = u.id ORDER BY role_id
+        );
+    """)
+    op.execute("ALTER TABLE roles DROP COLUMN permission_ids;")
+    op.execute(f"ALTER TABLE roles ADD COLUMN permission_ids {key_type}[] NOT NULL DEFAULT '{{}}';")
+    op.execute("""
+        UPDATE roles r SET permission_ids = ARRAY(
+            SELECT permission_id FROM role_permissions WHERE role_id = r.id ORDER BY permission_id
+        );
+    """)
+    op.create_index('idx_users_role_ids', 'users', ['role_ids'], unique=False, postgresql_using='gin')
+    op.create_index('idx_roles_permission_ids', 'roles', ['permission_ids'], unique=False, postgresql_using='gin')
+
+    op.execute(
+        "CREATE INDEX idx_audit_logs_role_assignments "
+        "ON audit_logs (target_user_id, role_id, created_at) "
+        "WHERE action = 'role_assigned';"
+    )
+
+    for statement in SYNC_TRIGGERS_SQL:
+        op.execute(statement)
+    op.execute(USER_ROLE_ASSIGNMENTS_VIEW_SQL)
+    op.execute(USER_PERMISSIONS_MV_SQL)
+    op.execute(USER_PERMISSIONS_MV_INDEX_SQL)
+    # The unique index must exist before anything refreshes CONCURRENTLY
+    for statement in REFRESH_TRIGGERS_SQL:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    """Switch roles and permissions to SMALLINT identity keys."""
+    _rekey('smallint GENERATED BY DEFAULT AS IDENTITY', 'smallint')
+
+
+def downgrade() -> None:
+    """Restore UUID keys for roles and permissions (new UUIDs are generated)."""
+    _rekey('uuid NOT NULL DEFAULT uuid_generate_v7()', 'uuid')
+    # UUID keys were generated client-side before this migration
+    op.execute("ALTER TABLE roles ALTER COLUMN id DROP DEFAULT;")
+    op.execute("ALTER TABLE permissions ALTER COLUMN id DROP DEFAULT;")
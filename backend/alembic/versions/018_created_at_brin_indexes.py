@@ -0,0 +1,55 @@
+"""created_at_brin_indexes
+
+Revision ID: 018_created_at_brin
+Revises: 017_smallint_rbac_keys
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018_created_at_brin'
+down_revision: Union[str, Sequence[str], None] = '017_smallint_rbac_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the documents.created_at btree with BRIN and tighten the audit_logs one."""
+    op.create_index(
+        'idx_documents_created_at_brin',
+        'documents',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    # Replaced by the BRIN index; the btree only added write amplification
+    op.drop_index('idx_documents_created_at', table_name='documents')
+
+    op.drop_index('idx_audit_logs_created_at_brin', table_name='audit_logs')
+    op.create_index(
+        'idx_audit_logs_created_at_brin',
+        'audit_logs',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    """Restore the default-range audit_logs BRIN index and the documents btree."""
+    op.drop_index('idx_audit_logs_created_at_brin', table_name='audit_logs')
+    op.create_index(
+        'idx_audit_logs_created_at_brin',
+        'audit_logs',
+        ['created_at'],
+        unique=False,
+        postgresql_using='brin'
+    )
+
+    op.drop_index('idx_documents_created_at_brin', table_name='documents')
+    op.create_index('idx_documents_created_at', 'documents', ['created_at'], unique=False)
@@ -0,0 +1,36 @@
+"""users_is_oidc_user
+
+Revision ID: 019_users_is_oidc_user
+Revises: 018_created_at_brin
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019_users_is_oidc_user'
+down_revision: Union[str, Sequence[str], None] = '018_created_at_brin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a generated is_oidc_user column with a partial index."""
+    op.execute("""
+        ALTER TABLE users
+        ADD COLUMN is_oidc_user boolean
+        GENERATED ALWAYS AS (auth_provider <> 'local') STORED NOT NULL;
+    """)
+    op.execute("CREATE INDEX idx_users_oidc_true ON users (id) WHERE is_oidc_user;")
+
+    op.drop_index('idx_users_auth_provider', table_name='users')
+
+
+def downgrade() -> None:
+    """Drop is_oidc_user and restore the auth_provider index."""
+    op.create_index('idx_users_auth_provider', 'users', ['auth_provider'], unique=False)
+
+    op.drop_index('idx_users_oidc_true', table_name='users')
+    op.drop_column('users', 'is_oidc_user')
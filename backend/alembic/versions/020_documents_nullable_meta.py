@@ -0,0 +1,41 @@
+"""documents_nullable_meta
+
+Revision ID: 020_documents_nullable_meta
+Revises: 019_users_is_oidc_user
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '020_documents_nullable_meta'
+down_revision: Union[str, Sequence[str], None] = '019_users_is_oidc_user'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store empty document metadata as NULL and index meta for containment."""
+    op.execute("ALTER TABLE documents ALTER COLUMN meta DROP DEFAULT;")
+    op.execute("ALTER TABLE documents ALTER COLUMN meta DROP NOT NULL;")
+    op.execute("UPDATE documents SET meta = NULL WHERE meta = '{}'::jsonb;")
+
+    op.create_index(
+        'idx_documents_meta_gin',
+        'documents',
+        ['meta'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'meta': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Restore non-null '{}' default metadata."""
+    op.drop_index('idx_documents_meta_gin', table_name='documents')
+
+    op.execute("UPDATE documents SET meta = '{}'::jsonb WHERE meta IS NULL;")
+    op.execute("ALTER TABLE documents ALTER COLUMN meta SET NOT NULL;")
+    op.execute("ALTER TABLE documents ALTER COLUMN meta SET DEFAULT '{}'::jsonb;")
@@ -0,0 +1,38 @@
+"""documents_title_content_trgm
+
+Revision ID: 021_title_content_trgm
+Revises: 020_documents_nullable_meta
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '021_title_content_trgm'
+down_revision: Union[str, Sequence[str], None] = '020_documents_nullable_meta'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the content trigram index with one over title + content."""
+    op.execute("""
+        CREATE INDEX idx_documents_title_content_trgm ON documents
+        USING gin ((title || ' ' || coalesce(content, '')) gin_trgm_ops);
+    """)
+    op.drop_index('idx_documents_content_trgm', table_name='documents')
+
+
+def downgrade() -> None:
+    """Restore the separate content trigram index."""
+    op.create_index(
+        'idx_documents_content_trgm',
+        'documents',
+        ['content'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'content': 'gin_trgm_ops'}
+    )
+    op.drop_index('idx_documents_title_content_trgm', table_name='documents')
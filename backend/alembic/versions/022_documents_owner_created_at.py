@@ -0,0 +1,34 @@
+"""documents_owner_created_at
+
+Revision ID: 022_documents_owner_created_at
+Revises: 021_title_content_trgm
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '022_documents_owner_created_at'
+down_revision: Union[str, Sequence[str], None] = '021_title_content_trgm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the keyset pagination index; it supersedes the owner_id index."""
+    op.create_index(
+        'idx_documents_owner_created_at',
+        'documents',
+        ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.drop_index('idx_documents_owner_id', table_name='documents')
+
+
+def downgrade() -> None:
+    """Restore the plain owner_id index."""
+    op.create_index('idx_documents_owner_id', 'documents', ['owner_id'], unique=False)
+    op.drop_index('idx_documents_owner_created_at', table_name='documents')
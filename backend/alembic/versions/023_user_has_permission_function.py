@@ -0,0 +1,42 @@
+"""user_has_permission_function
+
+Revision ID: 023_user_has_permission
+Revises: 022_documents_owner_created_at
+Create Date: 2026-01-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '023_user_has_permission'
+down_revision: Union[str, Sequence[str], None] = '022_documents_owner_created_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the user_has_permission() predicate over user_permissions_mv."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION user_has_permission(
+            p_user_id uuid,
+            p_resource text,
+            p_action text,
+            p_scope permission_scope DEFAULT 'own'
+        ) RETURNS boolean AS $$
+            SELECT EXISTS (
+                SELECT 1
+                FROM user_permissions_mv
+                WHERE user_id = p_user_id
+                  AND resource IN (p_resource, '*')
+                  AND action IN (p_action, '*')
+                  AND scope >= p_scope
+            )
+        $$ LANGUAGE sql STABLE;
+    """)
+
+
+def downgrade() -> None:
+    """Drop the user_has_permission() predicate."""
+    op.execute("DROP FUNCTION IF EXISTS user_has_permission(uuid, text, text, permission_scope);")
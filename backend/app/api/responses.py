@@ -0,0 +1,27 @@
+"""Response helpers shared by API endpoints."""
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_response(payload: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize an already-built response model in one pass.
+
+    Returning the model itself would make FastAPI validate it again against
+    response_model and serialize it through a Python dict; model_dump_json
+    writes JSON straight from the model. Keep response_model on the route
+    for the OpenAPI schema.
+
+    Args:
+        payload: Validated (or trusted, model_construct-ed) response model
+        status_code: HTTP status code of the response
+
+    Returns:
+        Response: JSON response with the serialized model
+    """
+    return Response(
+        content=payload.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,16 +1,17 @@
 """Authentication API endpoints."""
 
-from datetime import datetime, timezone
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
-from sqlalchemy import func, select
+from sqlalchemy import any_, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentActiveUser
 from app.core.cookies import REFRESH_TOKEN_COOKIE, clear_auth_cookies, set_auth_cookies
 from app.core.database import get_db
+from app.core.login_writer import last_login_writer
+from app.core.query_cache import PrecompiledQueries
 from app.core.rate_limit import (
     login_rate_limiter,
     password_reset_rate_limiter,
@@ -43,7 +44,11 @@ from app.services.password_reset import (
     invalidate_password_reset_token,
     verify_password_reset_token,
 )
-from app.services.security import hash_password, verify_password
+from app.services.security import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -67,7 +72,9 @@ async def register(
     - **password**: Password (minimum 8 characters)
     """
     # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
+    result = await db.execute(
+        PrecompiledQueries.user_by_email, {"email": user_data.email}
+    )
     if result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -75,8 +82,7 @@ async def register(
         )
 
     # Check if username already exists
-    result = await db.execute(select(User).where(User.username == user_data.username))
-    if result.scalar_one_or_none():
+    if await db.scalar(select(exists().where(User.username == user_data.username))):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken",
@@ -86,7 +92,7 @@ async def register(
     user = User(
         email=user_data.email,
         username=user_data.username,
-        password_hash=hash_password(user_data.password),
+        password_hash=await hash_password_async(user_data.password),
         auth_provider=AuthProvider.LOCAL.value,
         is_active=True,
         is_verified=False,  # Email verification not implemented yet
@@ -120,7 +126,9 @@ async def login(
     Returns access token and refresh token.
     """
     # Find user by email
-    result = await db.execute(select(User).where(User.email == credentials.email))
+    result = await db.execute(
+        PrecompiledQueries.user_by_email, {"email": credentials.email}
+    )
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -144,15 +152,18 @@ async def login(
         )
 
     # Verify password
-    if not verify_password(credentials.password, user.password_hash):
+    if not await verify_password_async(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
-    # Update last login
-    user.last_login_at = datetime.now(timezone.utc)
-    await db.commit()
+    # Upgrade legacy bcrypt (or outdated argon2) hashes while the password is at hand
+    if needs_rehash(user.password_hash):
+        user.password_hash = await hash_password_async(credentials.password)
+
+    # Update last login (written in the background batch)
+    last_login_writer.record(user.id)
 
     # Create tokens
     access_token, refresh_token, expires_in = create_tokens(user.id)
@@ -327,35 +338,32 @@ async def get_my_permissions(
     """
     from app.models.permission import Permission
     from app.models.role import Role
-    from app.models.role_permission import RolePermission
-    from app.models.user_role import UserRole
-
-    # Get user's roles
-    roles_result = await db.execute(
-        select(Role)
-        .join(UserRole, UserRole.role_id == Role.id)
-        .where(UserRole.user_id == current_user.id)
-    )
-    user_roles = roles_result.scalars().all()
-    role_names = [role.name for role in user_roles]
 
-    # Get permissions for all user's roles
-    if user_roles:
-        role_ids = [role.id for role in user_roles]
+    # Roles and permissions come from the users.role_ids / roles.permission_ids
+    # arrays, so neither lookup touches the junction tables
+    role_ids = current_user.role_ids
+    if role_ids:
+        roles_result = await db.execute(
+            select(Role.name).where(Role.id == any_(role_ids))
+        )
+        role_names = list(roles_result.scalars().all())
+
         permissions_result = await db.execute(
-            select(Permission)
-            .join(RolePermission, RolePermission.permission_id == Permission.id)
-            .where(RolePermission.role_id.in_(role_ids))
-            .distinct()
+            select(Permission).where(
+                Permission.id.in_(
+                    select(func.unnest(Role.permission_ids)).where(Role.id == any_(role_ids))
+                )
+            )
         )
         permissions = permissions_result.scalars().all()
     else:
+        role_names = []
         permissions = []
 
     return {
         "permissions": [
             {
-                "id": str(p.id),
+                "id": p.id,
                 "resource": p.resource,
                 "action": p.action,
                 "scope": p.scope,
@@ -392,14 +400,16 @@ async def change_password(
         )
 
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not await verify_password_async(
+        password_data.current_password, current_user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Update password
-    current_user.password_hash = hash_password(password_data.new_password)
+    current_user.password_hash = await hash_password_async(password_data.new_password)
     await db.commit()
 
     # Invalidate all refresh tokens (force re-login)
@@ -427,7 +437,9 @@ async def request_password_reset(
     even if the email doesn't exist in the system.
     """
     # Find user by email
-    result = await db.execute(select(User).where(User.email == reset_request.email))
+    result = await db.execute(
+        PrecompiledQueries.user_by_email, {"email": reset_request.email}
+    )
     user = result.scalar_one_or_none()
 
     if user is not None:
@@ -493,7 +505,7 @@ async def confirm_password_reset(
         )
 
     # Update password
-    user.password_hash = hash_password(request.new_password)
+    user.password_hash = await hash_password_async(request.new_password)
     await db.commit()
 
     # Invalidate reset token
@@ -3,7 +3,7 @@
 import math
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
@@ -11,6 +11,7 @@ from app.api.deps import (
     RBACServiceDep,
     require_permission,
 )
+from app.api.responses import model_response
 from app.core.database import get_db
 from app.models.permission import PermissionScope
 from app.schemas.auth import MessageResponse
@@ -23,7 +24,9 @@ from app.schemas.document import (
 from app.services.document import (
     check_document_ownership,
     create_document,
+    decode_cursor,
     delete_document,
+    encode_cursor,
     get_document,
     list_documents,
     update_document,
@@ -43,13 +46,25 @@ async def list_user_documents(
     db: AsyncSession = Depends(get_db),
     page: int = 1,
     page_size: int = 20,
-) -> DocumentListResponse:
+    cursor: str | None = None,
+) -> Response:
     """
-    List documents.
+    List documents, newest first.
 
     - Users with documents:read:all can see all documents
     - Users with documents:read:own can only see their own documents
+
+    Pass `next_cursor` from the previous response as `cursor` to fetch the
+    next page; unlike `page`, its cost does not grow with depth.
     """
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
     # Check if user can read all documents
     can_read_all = await rbac.has_permission(
         current_user, "documents", "read", PermissionScope.ALL.value
@@ -64,16 +79,21 @@ async def list_user_documents(
         page=page,
         page_size=page_size,
         include_owner=True,
+        cursor=position,
     )
     
     pages = math.ceil(total / page_size) if total > 0 else 1
-    
-    return DocumentListResponse(
-        items=[DocumentResponse.model_validate(doc) for doc in documents],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages,
+    next_cursor = encode_cursor(documents[-1]) if len(documents) == page_size else None
+    
+    return model_response(
+        DocumentListResponse.model_construct(
+            items=[DocumentResponse.model_validate(doc) for doc in documents],
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=pages,
+            next_cursor=next_cursor,
+        )
     )
 
 
@@ -88,7 +108,7 @@ async def create_new_document(
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("documents", "create", PermissionScope.OWN.value)),
-) -> DocumentResponse:
+) -> Response:
     """
     Create a new document.
 
@@ -104,7 +124,10 @@ async def create_new_document(
     # Reload with owner relationship
     document = await get_document(db, document.id, include_owner=True)
     
-    return DocumentResponse.model_validate(document)
+    return model_response(
+        DocumentResponse.model_validate(document),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
@@ -117,7 +140,7 @@ async def get_document_details(
     current_user: CurrentActiveUser,
     rbac: RBACServiceDep,
     db: AsyncSession = Depends(get_db),
-) -> DocumentResponse:
+) -> Response:
     """
     Get document details by ID.
 
@@ -143,7 +166,7 @@ async def get_document_details(
             detail="You don't have permission to access this document",
         )
     
-    return DocumentResponse.model_validate(document)
+    return model_response(DocumentResponse.model_validate(document))
 
 
 @router.put(
@@ -157,7 +180,7 @@ async def update_existing_document(
     current_user: CurrentActiveUser,
     rbac: RBACServiceDep,
     db: AsyncSession = Depends(get_db),
-) -> DocumentResponse:
+) -> Response:
     """
     Update a document.
 
@@ -183,11 +206,11 @@ async def update_existing_document(
             detail="You don't have permission to update this document",
         )
     
+    # The owner was joined-loaded above and cannot change, so no refresh
     document = await update_document(db, document, document_data)
     await db.commit()
-    await db.refresh(document)
     
-    return DocumentResponse.model_validate(document)
+    return model_response(DocumentResponse.model_validate(document))
 
 
 @router.delete(
@@ -1,17 +1,18 @@
 """OIDC (OpenID Connect) authentication endpoints."""
 
 import secrets
-from datetime import datetime, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import RedirectResponse
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.cookies import set_auth_cookies
 from app.core.database import get_db
+from app.core.login_writer import last_login_writer
+from app.core.query_cache import PrecompiledQueries
 from app.core.redis import RedisCache, redis_client
 from app.models.user import AuthProvider, User
 from app.schemas.auth import TokenResponse
@@ -120,7 +121,7 @@ async def oidc_callback(
         )
 
         # Extract user info from ID token
-        user_info = oidc_service.extract_user_info(token_response)
+        user_info = await oidc_service.extract_user_info(token_response, nonce=nonce)
 
     except Exception as e:
         raise HTTPException(
@@ -144,9 +145,9 @@ async def oidc_callback(
     # Find or create user
     user = await _find_or_create_oidc_user(db, user_info)
 
-    # Update last login
-    user.last_login_at = datetime.now(timezone.utc)
+    # Persist a newly created or linked user; last login is written in the background batch
     await db.commit()
+    last_login_writer.record(user.id)
 
     # Create tokens
     access_token, refresh_token, expires_in = create_tokens(user.id)
@@ -196,7 +197,7 @@ async def _find_or_create_oidc_user(
         return user
 
     # Try to find by email (for linking existing accounts)
-    result = await db.execute(select(User).where(User.email == email))
+    result = await db.execute(PrecompiledQueries.user_by_email, {"email": email})
     user = result.scalar_one_or_none()
 
     if user:
@@ -223,8 +224,7 @@ async def _find_or_create_oidc_user(
     base_username = username
     counter = 1
     while True:
-        result = await db.execute(select(User).where(User.username == username))
-        if result.scalar_one_or_none() is None:
+        if not await db.scalar(select(exists().where(User.username == username))):
             break
         username = f"{base_username}{counter}"
         counter += 1
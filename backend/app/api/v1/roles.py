@@ -1,7 +1,5 @@
 """Role management API endpoints."""
 
-from uuid import UUID
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -91,6 +89,7 @@ async def create_new_role(
     )
     await db.commit()
     await db.refresh(role)
+    await db.refresh(role, attribute_names=["permissions"])
 
     return RoleResponse.model_validate(role)
 
@@ -101,7 +100,7 @@ async def create_new_role(
     summary="Get role details",
 )
 async def get_role(
-    role_id: UUID,
+    role_id: int,
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("roles", "read", PermissionScope.ALL.value)),
@@ -127,7 +126,7 @@ async def get_role(
     summary="Update a role",
 )
 async def update_existing_role(
-    role_id: UUID,
+    role_id: int,
     role_data: RoleUpdate,
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
@@ -162,6 +161,7 @@ async def update_existing_role(
     )
     await db.commit()
     await db.refresh(role)
+    await db.refresh(role, attribute_names=["permissions"])
 
     # Invalidate cache for all users with this role
     rbac = RBACService(db)
@@ -176,7 +176,7 @@ async def update_existing_role(
     summary="Delete a role",
 )
 async def delete_existing_role(
-    role_id: UUID,
+    role_id: int,
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("roles", "delete", PermissionScope.ALL.value)),
@@ -220,7 +220,7 @@ async def delete_existing_role(
     summary="Assign permissions to a role",
 )
 async def assign_permissions(
-    role_id: UUID,
+    role_id: int,
     permission_data: PermissionAssign,
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
@@ -250,6 +250,7 @@ async def assign_permissions(
 
     await db.commit()
     await db.refresh(role)
+    await db.refresh(role, attribute_names=["permissions"])
 
     # Invalidate cache for all users with this role
     rbac = RBACService(db)
@@ -264,8 +265,8 @@ async def assign_permissions(
     summary="Remove a permission from a role",
 )
 async def remove_permission(
-    role_id: UUID,
-    permission_id: UUID,
+    role_id: int,
+    permission_id: int,
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("roles", "update", PermissionScope.ALL.value)),
@@ -292,6 +293,7 @@ async def remove_permission(
     await remove_permission_from_role(db, role, permission)
     await db.commit()
     await db.refresh(role)
+    await db.refresh(role, attribute_names=["permissions"])
 
     # Invalidate cache for all users with this role
     rbac = RBACService(db)
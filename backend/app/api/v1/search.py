@@ -3,15 +3,16 @@
 import math
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentActiveUser, RBACServiceDep
+from app.api.responses import model_response
 from app.core.database import get_db
 from app.models.permission import PermissionScope
 from app.schemas.document import DocumentResponse
 from app.schemas.search import (
-    SearchHighlight,
+    SearchFilters,
     SearchMode,
     SearchRequest,
     SearchResponse,
@@ -34,7 +35,7 @@ async def search_documents(
     current_user: CurrentActiveUser,
     rbac: RBACServiceDep,
     db: AsyncSession = Depends(get_db),
-) -> SearchResponse:
+) -> Response:
     """
     Search documents with various modes.
 
@@ -60,19 +61,14 @@ async def search_documents(
     )
     
     # Apply owner filter if user can only read own documents
+    # (the request was validated already, so the filters are not re-validated)
     filters = search_request.filters
     if not can_read_all:
-        from app.schemas.search import SearchFilters
         if filters is None:
-            filters = SearchFilters(owner_id=current_user.id)
+            filters = SearchFilters.model_construct(owner_id=current_user.id)
         else:
             # Override owner_id to current user
-            filters = SearchFilters(
-                owner_id=current_user.id,
-                date_from=filters.date_from,
-                date_to=filters.date_to,
-                meta_filters=filters.meta_filters,
-            )
+            filters = filters.model_copy(update={"owner_id": current_user.id})
     
     search_service = SearchService(db)
     results, total = await search_service.search(
@@ -85,30 +81,27 @@ async def search_documents(
     
     pages = math.ceil(total / search_request.page_size) if total > 0 else 1
     
-    # Convert results to response format
-    items = []
-    for result in results:
-        document = result["document"]
-        highlights = [
-            SearchHighlight(field=h["field"], fragment=h["fragment"])
-            for h in result["highlights"]
-        ]
-        items.append(
-            SearchResultItem(
-                document=DocumentResponse.model_validate(document),
-                rank=result["rank"],
-                highlights=highlights,
-            )
+    # Convert results to response format. Only the ORM documents need
+    # validation; the rest comes from the service or the validated request.
+    items = [
+        SearchResultItem.model_construct(
+            document=DocumentResponse.model_validate(result.document),
+            rank=result.rank,
+            highlights=result.highlights,
         )
+        for result in results
+    ]
     
-    return SearchResponse(
-        items=items,
-        total=total,
-        page=search_request.page,
-        page_size=search_request.page_size,
-        pages=pages,
-        query=search_request.query,
-        mode=search_request.mode,
+    return model_response(
+        SearchResponse.model_construct(
+            items=items,
+            total=total,
+            page=search_request.page,
+            page_size=search_request.page_size,
+            pages=pages,
+            query=search_request.query,
+            mode=search_request.mode,
+        )
     )
 
 
@@ -123,7 +116,7 @@ async def get_search_suggestions(
     db: AsyncSession = Depends(get_db),
     q: str = Query(..., min_length=1, max_length=100, description="Search query prefix"),
     limit: int = Query(default=10, ge=1, le=50, description="Maximum number of suggestions"),
-) -> SearchSuggestionsResponse:
+) -> Response:
     """
     Get search suggestions/autocomplete based on query prefix.
 
@@ -149,7 +142,7 @@ async def get_search_suggestions(
     )
     
     suggestions = [
-        SearchSuggestion(
+        SearchSuggestion.model_construct(
             text=s["text"],
             document_id=s["document_id"],
             field=s["field"],
@@ -157,7 +150,9 @@ async def get_search_suggestions(
         for s in suggestions_data
     ]
     
-    return SearchSuggestionsResponse(
-        suggestions=suggestions,
-        query=q,
+    return model_response(
+        SearchSuggestionsResponse.model_construct(
+            suggestions=suggestions,
+            query=q,
+        )
     )
@@ -3,18 +3,20 @@
 from uuid import UUID
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.deps import (
     CurrentActiveUser,
     require_permission,
 )
+from app.api.responses import model_response
 from app.core.database import get_db
 from app.models.permission import PermissionScope
+from app.models.role import Role
 from app.models.user import User
 from app.schemas.auth import MessageResponse
 from app.schemas.user_role import (
@@ -25,7 +27,7 @@ from app.schemas.user_role import (
 )
 from app.services.audit import AuditService, get_client_ip
 from app.services.rbac import (
-    assign_role_to_user,
+    assign_role_to_users,
     get_role_by_id,
     get_users_with_role,
     remove_role_from_user,
@@ -66,6 +68,16 @@ async def get_user_by_id(db: AsyncSession, user_id: UUID) -> User | None:
     return result.scalar_one_or_none()
 
 
+def _user_roles_response(user: User) -> Response:
+    """Serialize a user's loaded roles; only the ORM roles are validated."""
+    return model_response(
+        UserRolesResponse.model_construct(
+            user_id=user.id,
+            roles=[RoleBrief.model_validate(role) for role in user.roles],
+        )
+    )
+
+
 @router.get(
     "/",
     response_model=UserListResponse,
@@ -78,13 +90,16 @@ async def list_users(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     search: str | None = Query(None, description="Search by email or username"),
-) -> UserListResponse:
+) -> Response:
     """
     List all users with pagination.
 
     Requires: users:read:all permission
     """
-    query = select(User).options(selectinload(User.roles))
+    query = select(User).options(
+        selectinload(User.roles).load_only(Role.id, Role.name, Role.description),
+        raiseload("*"),
+    )
 
     if search:
         search_pattern = f"%{search}%"
@@ -94,8 +109,7 @@ async def list_users(
 
     query = query.order_by(User.created_at.desc())
 
-    total_result = await db.execute(select(User))
-    total = len(total_result.scalars().all())
+    total = await db.scalar(select(func.count(User.id)))
 
     offset = (page - 1) * page_size
     query = query.offset(offset).limit(page_size)
@@ -103,8 +117,10 @@ async def list_users(
     result = await db.execute(query)
     users = result.scalars().all()
 
+    # Values come straight from the ORM rows, so the response models are
+    # constructed without validation and serialized once
     items = [
-        UserListItem(
+        UserListItem.model_construct(
             id=user.id,
             email=user.email,
             username=user.username,
@@ -118,12 +134,14 @@ async def list_users(
 
     total_pages = (total + page_size - 1) // page_size
 
-    return UserListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
+    return model_response(
+        UserListResponse.model_construct(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+        )
     )
 
 
@@ -137,7 +155,7 @@ async def get_user_roles(
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("users", "read", PermissionScope.ALL.value)),
-) -> UserRolesResponse:
+) -> Response:
     """
     Get all roles assigned to a user.
 
@@ -150,10 +168,7 @@ async def get_user_roles(
             detail="User not found",
         )
 
-    return UserRolesResponse(
-        user_id=user.id,
-        roles=[RoleBrief.model_validate(role) for role in user.roles],
-    )
+    return _user_roles_response(user)
 
 
 @router.post(
@@ -168,7 +183,7 @@ async def assign_user_role(
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("users", "update", PermissionScope.ALL.value)),
-) -> UserRolesResponse:
+) -> Response:
     """
     Assign a role to a user.
 
@@ -194,24 +209,20 @@ async def assign_user_role(
             detail=f"User already has the '{role.name}' role",
         )
 
-    await assign_role_to_user(db, user, role, assigned_by=current_user.id)
-
-    await AuditService.log_role_assigned(
+    # Assignment and audit entry are written by one statement
+    await assign_role_to_users(
         db,
-        user_id=current_user.id,
-        target_user_id=user.id,
-        role_id=role.id,
+        role,
+        [user.id],
+        assigned_by=current_user.id,
         ip_address=get_client_ip(request),
         user_agent=request.headers.get("user-agent"),
     )
 
     await db.commit()
-    await db.refresh(user)
+    await db.refresh(user, attribute_names=["roles"])
 
-    return UserRolesResponse(
-        user_id=user.id,
-        roles=[RoleBrief.model_validate(r) for r in user.roles],
-    )
+    return _user_roles_response(user)
 
 
 @router.delete(
@@ -221,12 +232,12 @@ async def assign_user_role(
 )
 async def remove_user_role(
     user_id: UUID,
-    role_id: UUID,
+    role_id: int,
     request: Request,
     current_user: CurrentActiveUser,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(require_permission("users", "update", PermissionScope.ALL.value)),
-) -> UserRolesResponse:
+) -> Response:
     """
     Remove a role from a user.
 
@@ -259,12 +270,9 @@ async def remove_user_role(
     )
 
     await db.commit()
-    await db.refresh(user)
+    await db.refresh(user, attribute_names=["roles"])
 
-    return UserRolesResponse(
-        user_id=user.id,
-        roles=[RoleBrief.model_validate(r) for r in user.roles],
-    )
+    return _user_roles_response(user)
 
 
 @router.post(
@@ -291,25 +299,18 @@ async def bulk_assign_role(
             detail="Role not found",
         )
 
-    assigned_count = 0
-    for user_id in bulk_data.user_ids:
-        user = await get_user_by_id(db, user_id)
-        if user:
-            await assign_role_to_user(db, user, role, assigned_by=current_user.id)
-
-            # Log audit entry for each assignment
-            await AuditService.log_role_assigned(
-                db,
-                user_id=current_user.id,
-                target_user_id=user.id,
-                role_id=role.id,
-                ip_address=get_client_ip(request),
-                user_agent=request.headers.get("user-agent"),
-            )
-            assigned_count += 1
-
+    # One statement assigns the role to every existing user that lacks it
+    # and writes their audit entries
+    assigned_user_ids = await assign_role_to_users(
+        db,
+        role,
+        bulk_data.user_ids,
+        assigned_by=current_user.id,
+        ip_address=get_client_ip(request),
+        user_agent=request.headers.get("user-agent"),
+    )
     await db.commit()
 
     return MessageResponse(
-        message=f"Role assigned to {assigned_count} users"
+        message=f"Role assigned to {len(assigned_user_ids)} users"
     )
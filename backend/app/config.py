@@ -30,6 +30,26 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis connection string",
     )
+    REDIS_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="Maximum number of connections in the Redis pool",
+    )
+    REDIS_SOCKET_KEEPALIVE: bool = Field(
+        default=True,
+        description="Enable TCP keepalive on Redis connections",
+    )
+    REDIS_KEEPALIVE_IDLE: int = Field(
+        default=60,
+        description="Seconds of idle time before keepalive probes start",
+    )
+    REDIS_KEEPALIVE_INTERVAL: int = Field(
+        default=30,
+        description="Seconds between keepalive probes",
+    )
+    REDIS_KEEPALIVE_COUNT: int = Field(
+        default=3,
+        description="Failed keepalive probes before the connection is dropped",
+    )
 
     # Security
     JWT_SECRET: str = Field(
@@ -59,6 +79,16 @@ class Settings(BaseSettings):
         description="Cookie SameSite policy (strict, lax, none)",
     )
 
+    # Rate Limiting
+    RATE_LIMIT_WHITELIST_CIDRS: list[str] = Field(
+        default=[],
+        description=(
+            "Peer (socket) networks that bypass rate limiting; X-Forwarded-For "
+            "is not trusted. Empty by default: behind a reverse proxy on the "
+            "same host every client would arrive from loopback"
+        ),
+    )
+
     # Super Admin
     SUPERADMIN_EMAIL: str | None = Field(
         default=None,
@@ -69,6 +99,36 @@ class Settings(BaseSettings):
         description="Initial super admin password (auto-generated if empty)",
     )
 
+    # Email (SMTP)
+    SMTP_HOST: str | None = Field(
+        default=None,
+        description="SMTP server host (emails are only logged if empty)",
+    )
+    SMTP_PORT: int = Field(
+        default=465,
+        description="SMTP server port",
+    )
+    SMTP_USERNAME: str | None = Field(
+        default=None,
+        description="SMTP login username",
+    )
+    SMTP_PASSWORD: str | None = Field(
+        default=None,
+        description="SMTP login password",
+    )
+    SMTP_USE_TLS: bool = Field(
+        default=True,
+        description="Connect to the SMTP server over implicit TLS",
+    )
+    SMTP_MAX_CONNECTIONS: int = Field(
+        default=5,
+        description="Maximum number of concurrent SMTP sessions",
+    )
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = Field(
+        default=100,
+        description="Messages sent over one SMTP session before it is recycled",
+    )
+
     # CORS
     CORS_ORIGINS: list[str] = Field(
         default=["http://localhost:3000", "http://127.0.0.1:3000"],
@@ -153,6 +213,18 @@ class Settings(BaseSettings):
         description="Sentry DSN for error tracking",
     )
 
+    # Search
+    SEARCH_USE_RUM: bool = Field(
+        default=False,
+        description="Use a RUM index for ranked full-text search (requires the rum extension)",
+    )
+    SEARCH_FUZZY_THRESHOLD: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=1.0,
+        description="pg_trgm similarity threshold for fuzzy search matches and highlights",
+    )
+
     # Document Processing
     THUMBNAIL_WIDTH: int = Field(
         default=300,
@@ -189,6 +261,16 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    @validator("RATE_LIMIT_WHITELIST_CIDRS", pre=True)
+    @classmethod
+    def assemble_rate_limit_whitelist(cls, v: str | list[str]) -> list[str] | str:
+        """Parse rate limit whitelist from string or list."""
+        if isinstance(v, str) and not v.startswith("["):
+            return [i.strip() for i in v.split(",") if i.strip()]
+        elif isinstance(v, list | str):
+            return v
+        raise ValueError(v)
+
     @validator("WATCH_FOLDERS_ALLOWED_PATHS", pre=True)
     @classmethod
     def assemble_watch_folder_paths(cls, v: str | list[str]) -> list[str] | str:
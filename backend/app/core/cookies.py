@@ -10,6 +10,10 @@ from app.config import settings
 ACCESS_TOKEN_COOKIE = "access_token"
 REFRESH_TOKEN_COOKIE = "refresh_token"
 
+# Default cookie lifetimes in seconds, matching the token lifetimes
+ACCESS_TOKEN_MAX_AGE = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_MAX_AGE = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
 
 def set_auth_cookies(
     response: Response,
@@ -29,10 +33,10 @@ def set_auth_cookies(
         refresh_token_max_age: Refresh token max age in seconds (default from settings).
     """
     if access_token_max_age is None:
-        access_token_max_age = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        access_token_max_age = ACCESS_TOKEN_MAX_AGE
 
     if refresh_token_max_age is None:
-        refresh_token_max_age = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        refresh_token_max_age = REFRESH_TOKEN_MAX_AGE
 
     # Determine SameSite value
     samesite: Literal["lax", "strict", "none"] = "lax"
@@ -1,8 +1,9 @@
 """Database configuration and session management."""
 
 from collections.abc import AsyncGenerator
-from typing import Annotated
+from typing import Annotated, Any
 
+import orjson
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -13,6 +14,12 @@ from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
+
+def json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (UUIDs and datetimes natively)."""
+    return orjson.dumps(value).decode()
+
+
 # Create async engine with connection pooling
 # Use NullPool for testing, otherwise use default pool
 engine = create_async_engine(
@@ -22,6 +29,15 @@ engine = create_async_engine(
     pool_size=10,  # Maximum number of connections in pool
     max_overflow=20,  # Additional connections beyond pool_size
     pool_recycle=3600,  # Recycle connections after 1 hour
+    query_cache_size=1200,  # Compiled statement cache entries
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "server_settings": {
+            # Threshold of the indexable %> operator used by fuzzy search
+            "pg_trgm.word_similarity_threshold": str(settings.SEARCH_FUZZY_THRESHOLD),
+        },
+    },
 )
 
 # Create async session factory
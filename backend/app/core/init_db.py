@@ -10,7 +10,7 @@ from app.config import settings
 from app.core.seed_rbac import get_role_by_name, seed_rbac
 from app.models.user import AuthProvider, User
 from app.models.user_role import UserRole
-from app.services.security import hash_password
+from app.services.security import hash_password_async
 
 
 async def create_superadmin(db: AsyncSession) -> None:
@@ -65,7 +65,7 @@ async def create_superadmin(db: AsyncSession) -> None:
     user = User(
         email=email,
         username="admin",
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
         auth_provider=AuthProvider.LOCAL.value,
         is_active=True,
         is_verified=True,
@@ -0,0 +1,113 @@
+"""Deferred, batched writes of users.last_login_at."""
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, column, update, values
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from app.core.database import async_session_maker
+from app.models.user import User
+
+# Seconds between flushes of pending login timestamps
+LAST_LOGIN_FLUSH_INTERVAL = 5
+
+# Maximum number of users updated by a single statement
+LAST_LOGIN_BATCH_SIZE = 1000
+
+
+class LastLoginWriter:
+    """
+    Collects login timestamps in memory and writes them in batches.
+
+    Repeated logins of the same user between flushes collapse into a single
+    row update carrying the latest timestamp, so a login burst costs one
+    UPDATE per batch instead of one per request.
+    """
+
+    def __init__(
+        self,
+        interval: float = LAST_LOGIN_FLUSH_INTERVAL,
+        batch_size: int = LAST_LOGIN_BATCH_SIZE,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._pending: dict[UUID, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    def record(self, user_id: UUID, when: datetime | None = None) -> None:
+        """Queue a login timestamp for the next flush."""
+        self._pending[user_id] = when or datetime.now(UTC)
+
+    def take_batches(self) -> list[list[tuple[UUID, datetime]]]:
+        """Drain pending timestamps into batches of at most batch_size rows."""
+        rows = list(self._pending.items())
+        self._pending.clear()
+        return [
+            rows[i : i + self.batch_size] for i in range(0, len(rows), self.batch_size)
+        ]
+
+    async def flush(self) -> None:
+        """
+        Write all pending timestamps, one UPDATE ... FROM (VALUES ...) per batch.
+
+        All batches commit together; if the write fails they are queued again
+        for the next flush, unless a newer login has been recorded meanwhile.
+        """
+        batches = self.take_batches()
+        if not batches:
+            return
+
+        try:
+            await self._write(batches)
+        except Exception:
+            for batch in batches:
+                for user_id, when in batch:
+                    self._pending[user_id] = max(when, self._pending.get(user_id, when))
+            raise
+
+    async def _write(self, batches: list[list[tuple[UUID, datetime]]]) -> None:
+        """Run the batch UPDATEs in a single transaction."""
+        async with async_session_maker() as db:
+            for batch in batches:
+                logins = values(
+                    column("id", PGUUID(as_uuid=True)),
+                    column("last_login_at", DateTime(timezone=True)),
+                    name="logins",
+                ).data(batch)
+                await db.execute(
+                    update(User)
+                    .where(User.id == logins.c.id)
+                    .values(last_login_at=logins.c.last_login_at)
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+
+    async def _run(self) -> None:
+        """Flush periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"⚠️ Last login flush failed: {e}")
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+
+# Global writer instance
+last_login_writer = LastLoginWriter()
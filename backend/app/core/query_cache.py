@@ -0,0 +1,40 @@
+"""Prebuilt statements for hot lookup queries.
+
+SQLAlchemy caches the compiled SQL of a statement keyed by its structure,
+so building each hot statement once with bindparam() placeholders skips
+both statement construction and compilation on every request.
+
+Example:
+    result = await db.execute(
+        PrecompiledQueries.user_by_email, {"email": "user@example.com"}
+    )
+    user = result.scalar_one_or_none()
+"""
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import selectinload
+
+from app.models.permission import Permission
+from app.models.role import Role
+from app.models.user import User
+
+
+class PrecompiledQueries:
+    """Module-level statements for the auth and RBAC hot paths."""
+
+    # Parameters: email
+    user_by_email = select(User).where(User.email == bindparam("email"))
+
+    # Parameters: name
+    role_by_name = (
+        select(Role)
+        .options(selectinload(Role.permissions))
+        .where(Role.name == bindparam("name"))
+    )
+
+    # Parameters: resource, action, scope
+    permission_by_triple = select(Permission).where(
+        Permission.resource == bindparam("resource"),
+        Permission.action == bindparam("action"),
+        Permission.scope == bindparam("scope"),
+    )
@@ -1,9 +1,11 @@
 """Rate limiting utilities using Redis."""
 
+import ipaddress
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, Request, status
 
+from app.config import settings
 from app.core.redis import RedisCache, redis_client
 
 # Rate limit configuration
@@ -42,34 +44,61 @@ async def check_rate_limit(
     Returns:
         tuple: (is_allowed, remaining_requests or seconds_until_unblock)
     """
-    cache = RedisCache(redis_client)
-
-    # Check if blocked
-    block_key = _get_block_key(identifier, action)
-    block_ttl = await cache.ttl(block_key)
-    if block_ttl > 0:
-        return False, block_ttl
-
-    # Get current request count
-    rate_key = _get_rate_limit_key(identifier, action)
-    current_count = await cache.get(rate_key)
-
-    if current_count is None:
-        # First request in window
-        await cache.set(rate_key, "1", expire=window_seconds)
-        return True, max_requests - 1
-
-    count = int(current_count)
+    return await check_rate_limit_keys(
+        rate_key=_get_rate_limit_key(identifier, action),
+        block_key=_get_block_key(identifier, action),
+        max_requests=max_requests,
+        window_seconds=window_seconds,
+        block_seconds=block_seconds,
+    )
+
+
+async def check_rate_limit_keys(
+    rate_key: str,
+    block_key: str,
+    max_requests: int = LOGIN_RATE_LIMIT_REQUESTS,
+    window_seconds: int = LOGIN_RATE_LIMIT_WINDOW,
+    block_seconds: int = LOGIN_RATE_LIMIT_BLOCK_TIME,
+) -> tuple[bool, int]:
+    """
+    Check rate limit using pre-built Redis keys.
 
-    if count >= max_requests:
-        # Rate limit exceeded, block the identifier
-        await cache.set(block_key, "1", expire=block_seconds)
-        await cache.delete(rate_key)
-        return False, block_seconds
+    Args:
+        rate_key: Key holding the request counter
+        block_key: Key marking the identifier as blocked
+        max_requests: Maximum requests allowed in window
+        window_seconds: Time window in seconds
+        block_seconds: Block duration after exceeding limit
 
-    # Increment counter
-    await cache.increment(rate_key)
-    return True, max_requests - count - 1
+    Returns:
+        tuple: (is_allowed, remaining_requests or seconds_until_unblock)
+    """
+    try:
+        # Block check, counter bump and window expiry in a single round trip;
+        # NX keeps the window anchored to the first request
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.ttl(block_key)
+            pipe.incr(rate_key)
+            pipe.expire(rate_key, window_seconds, nx=True)
+            block_ttl, count, _ = await pipe.execute()
+
+        if block_ttl > 0:
+            # Requests while blocked don't count towards the next window
+            await redis_client.delete(rate_key)
+            return False, block_ttl
+
+        if count > max_requests:
+            # Rate limit exceeded, block the identifier
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(block_key, "1", ex=block_seconds)
+                pipe.delete(rate_key)
+                await pipe.execute()
+            return False, block_seconds
+    except Exception:
+        # Fail open when Redis is unavailable
+        return True, max_requests
+
+    return True, max_requests - count
 
 
 async def reset_rate_limit(identifier: str, action: str) -> None:
@@ -96,25 +125,51 @@ class RateLimiter:
         max_requests: int = LOGIN_RATE_LIMIT_REQUESTS,
         window_seconds: int = LOGIN_RATE_LIMIT_WINDOW,
         block_seconds: int = LOGIN_RATE_LIMIT_BLOCK_TIME,
+        whitelist_cidrs: list[str] | None = None,
     ):
         self.action = action
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.block_seconds = block_seconds
+        # Key prefixes built once so the hot path is a single concatenation
+        self._rk_prefix = f"rate_limit:{action}:"
+        self._bk_prefix = f"rate_limit_block:{action}:"
+        if whitelist_cidrs is None:
+            whitelist_cidrs = settings.RATE_LIMIT_WHITELIST_CIDRS
+        self._whitelist = tuple(
+            ipaddress.ip_network(cidr, strict=False) for cidr in whitelist_cidrs
+        )
+
+    def is_whitelisted(self, client_ip: str) -> bool:
+        """Check if a client IP belongs to a trusted network."""
+        if not self._whitelist:
+            return False
+        try:
+            ip = ipaddress.ip_address(client_ip)
+        except ValueError:
+            return False
+        return any(ip in network for network in self._whitelist)
 
     async def __call__(self, request: Request) -> None:
         """Check rate limit for the request."""
         # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        peer_ip = request.client.host if request.client else "unknown"
+
+        # Trusted networks (health checks, internal services) skip Redis
+        # entirely. Only the socket peer is checked: X-Forwarded-For is set
+        # by the client, so whitelisting on it would let anyone bypass limits.
+        if self.is_whitelisted(peer_ip):
+            return
 
         # Also check X-Forwarded-For header for proxied requests
+        client_ip = peer_ip
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
             client_ip = forwarded_for.split(",")[0].strip()
 
-        is_allowed, remaining = await check_rate_limit(
-            identifier=client_ip,
-            action=self.action,
+        is_allowed, remaining = await check_rate_limit_keys(
+            rate_key=self._rk_prefix + client_ip,
+            block_key=self._bk_prefix + client_ip,
             max_requests=self.max_requests,
             window_seconds=self.window_seconds,
             block_seconds=self.block_seconds,
@@ -0,0 +1,352 @@
+"""Process-local cache of role permissions as interned integer codes."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import redis_client
+from app.models.permission import Permission, PermissionScope
+from app.models.role_permission import RolePermission
+
+# Reload interval so workers that missed an invalidation converge (5 minutes)
+ROLE_PERMISSIONS_MAX_AGE = 300
+
+# Process-local copies of users' cached RBAC entries; the short lifetime
+# bounds staleness if an invalidation message is missed (30 seconds)
+LOCAL_USER_CACHE_SIZE = 10_000
+LOCAL_USER_CACHE_TTL = 30
+
+# Pub/sub channel carrying "user:{id}" / "role:{id}" invalidations
+RBAC_INVALIDATION_CHANNEL = "rbac:invalidate"
+
+# Scope hierarchy (higher scope includes lower)
+SCOPE_LEVELS: dict[str, int] = {
+    PermissionScope.OWN.value: 0,
+    PermissionScope.TEAM.value: 1,
+    PermissionScope.ALL.value: 2,
+}
+_MAX_SCOPE_LEVEL = max(SCOPE_LEVELS.values())
+
+# Process-wide interning of resource/action names into small integer IDs
+_RESOURCE_IDS: dict[str, int] = {}
+_ACTION_IDS: dict[str, int] = {}
+
+
+def _pack_permission(resource_id: int, action_id: int, scope_level: int) -> int:
+    """Pack interned permission parts into a single integer code."""
+    return (resource_id << 20) | (action_id << 4) | scope_level
+
+
+def permission_code(resource: str, action: str, scope: str) -> int:
+    """
+    Intern a (resource, action, scope) triple into an integer code.
+
+    Args:
+        resource: Resource name
+        action: Action name
+        scope: Permission scope
+
+    Returns:
+        int: Packed permission code, stable for the lifetime of the process
+    """
+    resource_id = _RESOURCE_IDS.setdefault(resource, len(_RESOURCE_IDS))
+    action_id = _ACTION_IDS.setdefault(action, len(_ACTION_IDS))
+    return _pack_permission(resource_id, action_id, SCOPE_LEVELS.get(scope, 0))
+
+
+def permission_codes(permissions: list[dict]) -> frozenset[int]:
+    """Build the integer code set for a list of permission dictionaries."""
+    return frozenset(
+        permission_code(perm["resource"], perm["action"], perm["scope"])
+        for perm in permissions
+    )
+
+
+def _scope_mask(level: int) -> int:
+    """Bitmask of the scope bits a level grants (itself and every lower level)."""
+    return (1 << (level + 1)) - 1
+
+
+def permission_index(codes: Iterable[int]) -> dict[int, int]:
+    """
+    Collapse permission codes into (resource, action) -> granted scope bitmask.
+
+    Keys are the codes with the scope bits shifted out, so a check needs at
+    most one lookup per exact/wildcard resource and action combination.
+    Values have one bit per scope level with the hierarchy baked in: a
+    higher scope also sets the bits of every scope it includes.
+    """
+    index: dict[int, int] = {}
+    for code in codes:
+        pair = code >> 4
+        index[pair] = index.get(pair, 0) | _scope_mask(code & 0xF)
+    return index
+
+
+def index_grants(
+    index: dict[int, int],
+    resource: str,
+    action: str,
+    required_scope: str = PermissionScope.OWN.value,
+) -> bool:
+    """
+    Check a permission index against a required permission.
+
+    ORs the masks of the exact and wildcard resource/action IDs (at most
+    four dict lookups) and tests the required scope's bit once.
+    """
+    mask = 0
+    for resource_name in (resource, "*"):
+        resource_id = _RESOURCE_IDS.get(resource_name)
+        if resource_id is None:
+            continue
+        for action_name in (action, "*"):
+            action_id = _ACTION_IDS.get(action_name)
+            if action_id is not None:
+                mask |= index.get((resource_id << 16) | action_id, 0)
+    return bool(mask & (1 << SCOPE_LEVELS.get(required_scope, 0)))
+
+
+def codes_grant(
+    codes: frozenset[int],
+    resource: str,
+    action: str,
+    required_scope: str = PermissionScope.OWN.value,
+) -> bool:
+    """Check a permission code set against a required permission."""
+    return index_grants(permission_index(codes), resource, action, required_scope)
+
+
+class RolePermissionCache:
+    """
+    Role ID -> permission code set, loaded in one query and shared by all requests.
+
+    Roles are few and change rarely, so authorization unions a handful of
+    in-memory frozensets instead of joining role_permissions and permissions.
+
+    Other workers only learn about a change through the message published by
+    RBACService.invalidate_role_cache. Role permissions written any other way
+    (seeding, direct RolePermission inserts, SQL) reach them on the next
+    reload, up to max_age seconds later.
+    """
+
+    def __init__(self, max_age: float = ROLE_PERMISSIONS_MAX_AGE):
+        self.max_age = max_age
+        self._codes: dict[int, frozenset[int]] = {}
+        # Permission indexes per role combination; users mostly share a few
+        self._indexes: dict[frozenset[int], dict[int, int]] = {}
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def _is_stale(self) -> bool:
+        """Check whether the cache needs a reload."""
+        return (
+            self._loaded_at is None or time.monotonic() - self._loaded_at > self.max_age
+        )
+
+    async def load(self, db: AsyncSession) -> None:
+        """Load all role permissions from the database."""
+        result = await db.execute(
+            select(
+                RolePermission.role_id,
+                Permission.resource,
+                Permission.action,
+                Permission.scope,
+            ).join(Permission, Permission.id == RolePermission.permission_id)
+        )
+
+        codes: dict[int, set[int]] = {}
+        for role_id, resource, action, scope in result.all():
+            codes.setdefault(role_id, set()).add(
+                permission_code(resource, action, scope)
+            )
+
+        self._codes = {
+            role_id: frozenset(role_codes) for role_id, role_codes in codes.items()
+        }
+        self._indexes = {}
+        self._loaded_at = time.monotonic()
+
+    async def get_codes(
+        self, db: AsyncSession, role_ids: Iterable[int]
+    ) -> frozenset[int]:
+        """
+        Get the union of permission codes for the given roles.
+
+        Args:
+            db: Database session used if the cache must be (re)loaded
+            role_ids: Role IDs
+
+        Returns:
+            frozenset[int]: Permission codes granted by any of the roles
+        """
+        await self._ensure_loaded(db)
+        codes = self._codes
+        return frozenset().union(*(codes.get(role_id, ()) for role_id in role_ids))
+
+    async def get_index(
+        self, db: AsyncSession, role_ids: Iterable[int]
+    ) -> dict[int, int]:
+        """
+        Get the permission index (see permission_index) for the given roles.
+
+        Indexes are memoized per role combination until the next reload.
+
+        Args:
+            db: Database session used if the cache must be (re)loaded
+            role_ids: Role IDs
+
+        Returns:
+            dict[int, int]: (resource, action) key -> granted scope bitmask
+        """
+        await self._ensure_loaded(db)
+        key = frozenset(role_ids)
+        index = self._indexes.get(key)
+        if index is None:
+            codes = self._codes
+            index = permission_index(
+                code for role_id in key for code in codes.get(role_id, ())
+            )
+            self._indexes[key] = index
+        return index
+
+    async def _ensure_loaded(self, db: AsyncSession) -> None:
+        """Reload the cache if it is stale, once across concurrent callers."""
+        if self._is_stale():
+            async with self._lock:
+                if self._is_stale():
+                    await self.load(db)
+
+    def invalidate(self) -> None:
+        """Force a reload on next access (call after role permission changes)."""
+        self._loaded_at = None
+
+
+role_permission_cache = RolePermissionCache()
+
+
+class LocalUserCache:
+    """
+    In-process stage in front of the Redis copy of users' RBAC entries.
+
+    Repeated checks for the same user within a worker skip the Redis round
+    trip. Workers evict entries when an invalidation is published on
+    RBAC_INVALIDATION_CHANNEL; entries also expire after a few seconds in
+    case a message is lost.
+    """
+
+    def __init__(
+        self,
+        max_size: int = LOCAL_USER_CACHE_SIZE,
+        ttl: float = LOCAL_USER_CACHE_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        # User ID -> (expires at, role IDs, entries, revisions), least recently used first
+        self._entries: dict[
+            UUID, tuple[float, frozenset[int], dict[str, Any], list[int]]
+        ] = {}
+        self._task: asyncio.Task | None = None
+
+    def get(
+        self, user_id: UUID, role_ids: Iterable[int]
+    ) -> tuple[dict[str, Any], list[int]] | None:
+        """
+        Get a user's entries if they are fresh and built for the same roles.
+
+        Returns:
+            Tuple of (entries, revisions), or None on a miss
+        """
+        cached = self._entries.pop(user_id, None)
+        if cached is None:
+            return None
+        expires_at, cached_role_ids, entries, revisions = cached
+        if expires_at <= time.monotonic() or cached_role_ids != frozenset(role_ids):
+            return None
+        self._entries[user_id] = cached
+        return entries, revisions
+
+    def set(
+        self,
+        user_id: UUID,
+        role_ids: Iterable[int],
+        entries: dict[str, Any],
+        revisions: list[int],
+    ) -> None:
+        """Store a user's entries, evicting the least recently used user if full."""
+        self._entries.pop(user_id, None)
+        if len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+        self._entries[user_id] = (
+            time.monotonic() + self.ttl,
+            frozenset(role_ids),
+            entries,
+            revisions,
+        )
+
+    def evict_user(self, user_id: UUID) -> None:
+        """Drop one user's entries."""
+        self._entries.pop(user_id, None)
+
+    def evict_role(self, role_id: int) -> None:
+        """Drop the entries of every user holding a role."""
+        for user_id in [
+            user_id for user_id, cached in self._entries.items() if role_id in cached[1]
+        ]:
+            del self._entries[user_id]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def handle_message(self, message: bytes | str) -> None:
+        """Apply an invalidation received from another worker."""
+        if isinstance(message, bytes):
+            message = message.decode()
+        kind, _, value = message.partition(":")
+        if kind == "user":
+            self.evict_user(UUID(value))
+        elif kind == "role":
+            self.evict_role(int(value))
+            role_permission_cache.invalidate()
+
+    async def _run(self) -> None:
+        """Apply published invalidations until cancelled, resubscribing on errors."""
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(RBAC_INVALIDATION_CHANNEL)
+                # Messages may have been missed while (re)connecting
+                self.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ RBAC invalidation listener failed: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        """Start listening for invalidations."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+local_user_cache = LocalUserCache()
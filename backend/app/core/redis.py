@@ -1,20 +1,41 @@
 """Redis connection and cache management."""
 
+import socket
 from collections.abc import AsyncGenerator
 from typing import Any
 from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 from fastapi import Depends
+from redis.asyncio.client import Pipeline
 
 from app.config import settings
 
+
+def _keepalive_options() -> dict[int, int]:
+    """Build TCP keepalive options supported by the current platform."""
+    options = {
+        "TCP_KEEPIDLE": settings.REDIS_KEEPALIVE_IDLE,
+        "TCP_KEEPINTVL": settings.REDIS_KEEPALIVE_INTERVAL,
+        "TCP_KEEPCNT": settings.REDIS_KEEPALIVE_COUNT,
+    }
+    return {
+        getattr(socket, name): value
+        for name, value in options.items()
+        if hasattr(socket, name)
+    }
+
+
 # Redis connection pool
+# Responses are kept as raw bytes; RedisCache decodes only where a str is needed.
+# TCP_NODELAY is already enabled by asyncio for stream connections.
 redis_pool = redis.ConnectionPool.from_url(
     settings.REDIS_URL,
-    encoding="utf-8",
-    decode_responses=True,
-    max_connections=20,  # Maximum number of connections in pool
+    decode_responses=False,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    socket_keepalive=settings.REDIS_SOCKET_KEEPALIVE,
+    socket_keepalive_options=_keepalive_options(),
     retry_on_timeout=True,
     socket_timeout=5,
     socket_connect_timeout=5,
@@ -80,7 +101,8 @@ class RedisCache:
     async def get(self, key: str) -> str | None:
         """Get value from cache."""
         try:
-            return await self.client.get(key)
+            value = await self.client.get(key)
+            return value.decode() if value is not None else None
         except Exception:
             return None
 
@@ -92,11 +114,9 @@ class RedisCache:
     ) -> bool:
         """Set value in cache with optional expiration."""
         try:
-            # Convert non-string values to JSON string
+            # Convert non-string values to JSON
             if not isinstance(value, str):
-                import json
-
-                value = json.dumps(value)
+                value = orjson.dumps(value)
 
             return await self.client.set(key, value, ex=expire)
         except Exception:
@@ -150,20 +170,14 @@ class RedisCache:
             value = await self.client.get(key)
             if value is None:
                 return None
-
-            import json
-
-            return json.loads(value)
+            return orjson.loads(value)
         except Exception:
             return None
 
     async def set_json(self, key: str, value: Any, expire: int | None = None) -> bool:
-        """Set JSON value with serialization."""
+        """Set JSON value with serialization (UUIDs and datetimes supported)."""
         try:
-            import json
-
-            json_value = json.dumps(value)
-            return await self.client.set(key, json_value, ex=expire)
+            return await self.client.set(key, orjson.dumps(value), ex=expire)
         except Exception:
             return False
 
@@ -177,10 +191,26 @@ class RedisCache:
         except Exception:
             return 0
 
+    async def publish(self, channel: str, message: str) -> int | None:
+        """Publish a message, returning the number of subscribers reached."""
+        try:
+            return await self.client.publish(channel, message)
+        except Exception:
+            return None
+
+    def pipeline(self, transaction: bool = True) -> Pipeline:
+        """
+        Start a pipeline that sends queued commands in one round trip.
+
+        Unlike the other helpers, errors are not swallowed: they surface
+        from execute().
+        """
+        return self.client.pipeline(transaction=transaction)
+
     async def get_keys(self, pattern: str = "*") -> list[str]:
         """Get keys matching pattern."""
         try:
-            return await self.client.keys(pattern)
+            return [key.decode() for key in await self.client.keys(pattern)]
         except Exception:
             return []
 
@@ -1,5 +1,7 @@
 """Seed default roles and permissions for RBAC."""
 
+from collections import defaultdict
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -11,7 +13,7 @@ from app.models.role_permission import RolePermission
 
 # Default permissions definition
 # Format: (resource, action, scope, description)
-DEFAULT_PERMISSIONS = [
+DEFAULT_PERMISSIONS: tuple[tuple[str, str, str, str], ...] = (
     # Users permissions
     ("users", "create", PermissionScope.ALL.value, "Create new users"),
     ("users", "read", PermissionScope.OWN.value, "Read own user profile"),
@@ -60,7 +62,12 @@ DEFAULT_PERMISSIONS = [
     
     # System/Admin permissions
     ("system", "*", PermissionScope.ALL.value, "Full system access (wildcard)"),
-]
+)
+
+# (resource, action, scope) keys of all default permissions
+_PERM_KEYS: frozenset[tuple[str, str, str]] = frozenset(
+    (resource, action, scope) for resource, action, scope, _ in DEFAULT_PERMISSIONS
+)
 
 # Default roles definition
 # Format: (name, description, is_system, permission_patterns)
@@ -135,6 +142,24 @@ DEFAULT_ROLES = [
 ]
 
 
+def _validate_role_patterns() -> None:
+    """
+    Check that every non-wildcard role pattern refers to a default permission.
+
+    Raises:
+        ValueError: If a role references an unknown permission
+    """
+    for name, _, _, permission_patterns in DEFAULT_ROLES:
+        for resource, action, scope in permission_patterns:
+            if resource == "*" or action == "*":
+                continue
+            if (resource, action, scope) not in _PERM_KEYS:
+                raise ValueError(
+                    f"Role '{name}' references unknown permission: "
+                    f"{resource}:{action}:{scope}"
+                )
+
+
 async def seed_permissions(db: AsyncSession) -> dict[tuple[str, str, str], Permission]:
     """
     Seed default permissions.
@@ -181,7 +206,16 @@ async def seed_roles(
     Returns:
         Dictionary mapping role name to Role objects
     """
+    _validate_role_patterns()
+
     roles_map: dict[str, Role] = {}
+
+    # Index permissions by resource once so wildcard patterns only touch
+    # the permissions they actually match
+    all_perms = list(permissions_map.values())
+    perms_by_resource: dict[str, list[Permission]] = defaultdict(list)
+    for (perm_resource, _, _), perm in permissions_map.items():
+        perms_by_resource[perm_resource].append(perm)
     
     for name, description, is_system, permission_patterns in DEFAULT_ROLES:
         # Check if role already exists (with permissions loaded)
@@ -216,7 +250,7 @@ async def seed_roles(
             # Handle wildcard permissions
             if resource == "*" and action == "*":
                 # Full wildcard - assign ALL permissions
-                for perm in permissions_map.values():
+                for perm in all_perms:
                     if perm.id not in existing_perm_ids:
                         role_perm = RolePermission(
                             role_id=role.id,
@@ -226,15 +260,14 @@ async def seed_roles(
                         existing_perm_ids.add(perm.id)
             elif action == "*":
                 # Wildcard action - assign all permissions for this resource
-                for perm_key, perm in permissions_map.items():
-                    if perm_key[0] == resource:
-                        if perm.id not in existing_perm_ids:
-                            role_perm = RolePermission(
-                                role_id=role.id,
-                                permission_id=perm.id,
-                            )
-                            db.add(role_perm)
-                            existing_perm_ids.add(perm.id)
+                for perm in perms_by_resource.get(resource, ()):
+                    if perm.id not in existing_perm_ids:
+                        role_perm = RolePermission(
+                            role_id=role.id,
+                            permission_id=perm.id,
+                        )
+                        db.add(role_perm)
+                        existing_perm_ids.add(perm.id)
             else:
                 # Specific permission
                 perm_key = (resource, action, scope)
@@ -1,5 +1,6 @@
 """FastAPI application main entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -12,7 +13,18 @@ from app.api.v1 import api_v1_router
 from app.config import settings
 from app.core.database import async_session_maker, close_db, engine
 from app.core.init_db import init_database
+from app.core.login_writer import last_login_writer
+from app.core.rbac_cache import local_user_cache, role_permission_cache
 from app.core.redis import close_redis, init_redis
+from app.services.email import email_service
+from app.services.oidc import oidc_service
+
+
+async def _check_db() -> None:
+    """Test database connectivity."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    print("✅ Database connection: OK")
 
 
 @asynccontextmanager
@@ -23,31 +35,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     print(f"📊 Environment: {settings.ENVIRONMENT}")
     print(f"🔧 Debug mode: {settings.DEBUG}")
 
-    # Test database connection
-    try:
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-        print("✅ Database connection: OK")
-    except Exception as e:
-        print(f"❌ Database connection failed: {e}")
-
-    # Initialize Redis connection
-    try:
-        await init_redis()
-    except Exception as e:
-        print(f"❌ Redis initialization failed: {e}")
+    # Test database and Redis connections concurrently
+    db_result, redis_result = await asyncio.gather(
+        _check_db(), init_redis(), return_exceptions=True
+    )
+    if isinstance(db_result, Exception):
+        print(f"❌ Database connection failed: {db_result}")
+    if isinstance(redis_result, Exception):
+        print(f"❌ Redis initialization failed: {redis_result}")
 
     # Initialize database (create super admin, etc.)
     try:
         async with async_session_maker() as db:
             await init_database(db)
+            await role_permission_cache.load(db)
     except Exception as e:
         print(f"⚠️ Database initialization warning: {e}")
 
+    last_login_writer.start()
+    local_user_cache.start()
+
     yield
 
     # Shutdown
     print("🛑 Shutting down Enterprise Boilerplate Backend...")
+    await last_login_writer.stop()
+    await local_user_cache.stop()
+    await email_service.close()
+    await oidc_service.aclose()
     await close_db()
     await close_redis()
     print("✅ Database and Redis connections closed")
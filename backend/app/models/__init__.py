@@ -7,6 +7,7 @@ from app.models.permission import Permission, PermissionScope
 from app.models.role import Role
 from app.models.role_permission import RolePermission
 from app.models.user import AuthProvider, User
+from app.models.user_permission_mv import UserPermissionMV
 from app.models.user_role import UserRole
 
 __all__ = [
@@ -20,6 +21,7 @@ __all__ = [
     "PermissionScope",
     "RolePermission",
     "UserRole",
+    "UserPermissionMV",
     "AuditLog",
     "AuditAction",
     "Document",
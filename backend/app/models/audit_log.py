@@ -1,11 +1,25 @@
 """Audit log model for tracking role changes."""
 
 from datetime import datetime
-from enum import Enum
-from typing import TYPE_CHECKING
+from enum import Enum as PyEnum
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    DateTime,
+    Enum,
+    Index,
+    PrimaryKeyConstraint,
+    Sequence,
+    SmallInteger,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,8 +28,12 @@ from app.core.database import Base
 if TYPE_CHECKING:
     from app.models.user import User
 
+# Plain sequence default rather than IDENTITY: postgres:16 does not support
+# identity columns on partitioned tables
+audit_logs_id_seq = Sequence("audit_logs_id_seq", metadata=Base.metadata)
 
-class AuditAction(str, Enum):
+
+class AuditAction(str, PyEnum):
     """Audit action types."""
 
     ROLE_ASSIGNED = "role_assigned"
@@ -31,11 +49,19 @@ class AuditLog(Base):
     """
     Audit log for tracking role and permission changes.
 
+    The table is range-partitioned by month on created_at, so the partition
+    key is part of the primary key. Rows outside the pre-created monthly
+    partitions land in audit_logs_default.
+
+    Rows are keyed by (created_at, id) to match the partition key; id is a
+    bigint from audit_logs_id_seq and is only unique together with created_at.
+
     Attributes:
         action: Type of action performed
         entity_type: Type of entity affected (user, role, permission)
         entity_id: ID of the affected entity
-        user_id: ID of the user who performed the action
+        user_id: ID of the user who performed the action (None for role
+            assignments recorded before audit logging, with no known actor)
         target_user_id: ID of the target user (for role assignments)
         role_id: ID of the role involved
         details: Additional details as JSON
@@ -45,42 +71,43 @@ class AuditLog(Base):
 
     __tablename__ = "audit_logs"
 
-    id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True),
-        primary_key=True,
-        server_default="gen_random_uuid()",
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        audit_logs_id_seq,
+        server_default=audit_logs_id_seq.next_value(),
+        nullable=False,
     )
-    action: Mapped[str] = mapped_column(
-        String(50),
+    action: Mapped[AuditAction] = mapped_column(
+        Enum(
+            AuditAction,
+            name="audit_action_enum",
+            native_enum=True,
+            values_callable=lambda enum: [member.value for member in enum],
+        ),
         nullable=False,
-        index=True,
     )
     entity_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
     )
     entity_id: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
     )
-    user_id: Mapped[UUID] = mapped_column(
+    user_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
-        nullable=False,
-        index=True,
+        nullable=True,
     )
     target_user_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=True,
-        index=True,
     )
-    role_id: Mapped[UUID | None] = mapped_column(
-        PGUUID(as_uuid=True),
+    role_id: Mapped[int | None] = mapped_column(
+        SmallInteger,
         nullable=True,
-        index=True,
     )
-    details: Mapped[str | None] = mapped_column(
-        Text,
+    details: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB,
         nullable=True,
     )
     ip_address: Mapped[str | None] = mapped_column(
@@ -93,17 +120,49 @@ class AuditLog(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default="now()",
+        server_default=text("now()"),
         nullable=False,
-        index=True,
     )
 
     # Indexes
     __table_args__ = (
+        PrimaryKeyConstraint("created_at", "id", name="audit_logs_pkey"),
         Index("idx_audit_logs_action_entity", "action", "entity_type"),
         Index("idx_audit_logs_user_target", "user_id", "target_user_id"),
+        # Serves UserRole.assigned_at / user_role_assignments lookups
+        Index(
+            "idx_audit_logs_role_assignments",
+            "target_user_id",
+            "role_id",
+            "created_at",
+            postgresql_where=text("action = 'role_assigned'"),
+        ),
+        # BRIN stays tiny on append-only, time-ordered data
+        Index(
+            "idx_audit_logs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "idx_audit_logs_details_gin",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<AuditLog(action={self.action}, entity_type={self.entity_type}, entity_id={self.entity_id})>"
+
+
+# Catch-all partition so inserts succeed on tables built from metadata (tests)
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT"
+    ),
+)
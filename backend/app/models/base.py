@@ -1,15 +1,59 @@
 """Base model with common fields for all database models."""
 
+import os
+import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DDL, DateTime, event, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
+# Server-side UUIDv7 generator for columns defaulted in SQL. Overlays the
+# 48-bit millisecond timestamp onto a random v4 UUID and flips the version
+# nibble from 4 to 7.
+UUID_GENERATE_V7_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid
+    $$ LANGUAGE sql VOLATILE
+"""
+
+
+def uuid7() -> UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so keys
+    generated close together land on neighboring B-tree pages.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(
+        os.urandom(10), "big"
+    )
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # variant
+    return UUID(int=value)
+
 
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamps."""
@@ -33,11 +77,29 @@ class UUIDMixin:
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
         nullable=False,
     )
 
 
+def _make_to_dict(column_names: list[str]) -> Callable[[Any], dict[str, Any]]:
+    """
+    Generate a to_dict function specialized for a fixed set of columns.
+
+    The generated body is a single dict literal of plain attribute loads,
+    e.g. ``return {"id": self.id, "created_at": self.created_at}``.
+    """
+    if not all(name.isidentifier() for name in column_names):
+        return lambda self: {name: getattr(self, name) for name in column_names}
+
+    items = ", ".join(f"{name!r}: self.{name}" for name in column_names)
+    namespace: dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)  # noqa: S102
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert model to dictionary."
+    return to_dict
+
+
 class BaseModel(Base, UUIDMixin, TimestampMixin):
     """
     Base model class with UUID primary key and timestamps.
@@ -57,12 +119,27 @@ class BaseModel(Base, UUIDMixin, TimestampMixin):
 
     __abstract__ = True
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Specialize to_dict and __repr__ once the subclass is mapped."""
+        super().__init_subclass__(**kwargs)
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            cls.to_dict = _make_to_dict([column.name for column in table.columns])
+        cls._repr_format = f"<{cls.__name__}(id={{}})>".format
+
     def __repr__(self) -> str:
         """Return string representation of model."""
-        return f"<{self.__class__.__name__}(id={self.id})>"
+        return self._repr_format(self.id)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
         return {
             column.name: getattr(self, column.name) for column in self.__table__.columns
         }
+
+
+# Must exist before tables whose server defaults call it are created
+event.listen(Base.metadata, "before_create", DDL(UUID_GENERATE_V7_FUNCTION_SQL))
+event.listen(
+    Base.metadata, "after_drop", DDL("DROP FUNCTION IF EXISTS uuid_generate_v7()")
+)
@@ -3,15 +3,26 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy import Computed, ForeignKey, Index, String, Text, literal_column, text
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.config import settings
 from app.models.base import BaseModel
 
 if TYPE_CHECKING:
     from app.models.user import User
 
+# Weighted tsvector: title ranks above content
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
+# Title and content as one string for trigram matching. Fuzzy search must use
+# this exact expression for the planner to pick idx_documents_title_content_trgm.
+TRIGRAM_TEXT_EXPRESSION = "(title || ' ' || coalesce(content, ''))"
+
 
 class Document(BaseModel):
     """
@@ -20,7 +31,7 @@ class Document(BaseModel):
     Attributes:
         title: Document title (weighted 'A' in search)
         content: Document content (weighted 'B' in search)
-        meta: Additional metadata as JSONB
+        meta: Additional metadata as JSONB (NULL when empty)
         owner_id: Foreign key to the document owner
         search_vector: PostgreSQL tsvector for full-text search (generated column)
     """
@@ -37,43 +48,48 @@ class Document(BaseModel):
         Text,
         nullable=True,
     )
-    meta: Mapped[dict] = mapped_column(
+    meta: Mapped[dict | None] = mapped_column(
         JSONB,
-        default=dict,
-        server_default="{}",
-        nullable=False,
+        default=None,
+        nullable=True,
     )
 
     # Owner relationship
     owner_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    # Full-text search vector
-    # Note: This is a generated column in PostgreSQL, created via migration
-    # The actual generation expression is defined in the migration
+    # Full-text search vector (STORED generated column, never written directly)
     search_vector: Mapped[str | None] = mapped_column(
         TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
         nullable=True,
     )
 
     # Relationships
     owner: Mapped["User"] = relationship(
         "User",
-        lazy="selectin",
     )
 
-    # Indexes for full-text search
+    # Indexes for full-text search and date filtering
     __table_args__ = (
-        # GIN index for full-text search
+        # Full-text search index; RUM keeps positions in the index so ranked
+        # top-N queries are answered without heap fetches
         Index(
+            "idx_documents_search_vector",
+            "search_vector",
+            postgresql_using="rum",
+            postgresql_ops={"search_vector": "rum_tsvector_ops"},
+        )
+        if settings.SEARCH_USE_RUM
+        else Index(
             "idx_documents_search_vector",
             "search_vector",
             postgresql_using="gin",
         ),
-        # Trigram indexes for fuzzy search
+        # Trigram indexes: title alone for suggestion lookups, title + content
+        # for fuzzy search
         Index(
             "idx_documents_title_trgm",
             "title",
@@ -81,13 +97,41 @@ class Document(BaseModel):
             postgresql_ops={"title": "gin_trgm_ops"},
         ),
         Index(
-            "idx_documents_content_trgm",
-            "content",
+            "idx_documents_title_content_trgm",
+            literal_column(TRIGRAM_TEXT_EXPRESSION).label("title_content"),
             postgresql_using="gin",
-            postgresql_ops={"content": "gin_trgm_ops"},
+            postgresql_ops={"title_content": "gin_trgm_ops"},
+        ),
+        # Serves meta_filters containment (@>) queries; jsonb_path_ops is
+        # about half the size of the default jsonb_ops
+        Index(
+            "idx_documents_meta_gin",
+            "meta",
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+        ),
+        # Rows arrive in created_at order, so BRIN serves date_from/date_to
+        # range filters at a fraction of a btree's size
+        Index(
+            "idx_documents_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Keyset pagination of a user's documents (newest first); the leading
+        # owner_id also serves owner lookups and FK cascades
+        Index(
+            "idx_documents_owner_created_at",
+            "owner_id",
+            text("created_at DESC"),
+            text("id DESC"),
         ),
     )
 
+    # Server-generated columns (timestamps, search_vector) come back through
+    # RETURNING on INSERT and UPDATE, so no refresh is needed after a flush
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<Document(id={self.id}, title={self.title})>"
@@ -1,9 +1,9 @@
 """Permission model for RBAC."""
 
-from enum import Enum
+from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Index, String, Text
+from sqlalchemy import Enum, Identity, Index, SmallInteger, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from app.models.role import Role
 
 
-class PermissionScope(str, Enum):
+class PermissionScope(str, PyEnum):
     """Permission scope types."""
 
     OWN = "own"  # User can only access their own resources
@@ -25,6 +25,7 @@ class Permission(BaseModel):
     Permission model for fine-grained access control.
 
     Attributes:
+        id: Small integer primary key (permissions number in the tens)
         resource: Resource name, e.g., "users", "documents", "roles"
         action: Action name, e.g., "create", "read", "update", "delete", "*"
         scope: Permission scope (own, team, all)
@@ -33,19 +34,28 @@ class Permission(BaseModel):
 
     __tablename__ = "permissions"
 
+    # Overrides the UUID key from BaseModel
+    id: Mapped[int] = mapped_column(
+        SmallInteger,
+        Identity(),
+        primary_key=True,
+    )
     resource: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        index=True,
     )
     action: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
     )
-    scope: Mapped[str] = mapped_column(
-        String(20),
-        default=PermissionScope.OWN.value,
+    scope: Mapped[PermissionScope] = mapped_column(
+        Enum(
+            PermissionScope,
+            name="permission_scope",
+            native_enum=True,
+            values_callable=lambda enum: [member.value for member in enum],
+        ),
+        default=PermissionScope.OWN,
         nullable=False,
     )
     description: Mapped[str | None] = mapped_column(
@@ -58,7 +68,6 @@ class Permission(BaseModel):
         "Role",
         secondary="role_permissions",
         back_populates="permissions",
-        lazy="selectin",
     )
 
     # Indexes
@@ -76,8 +85,3 @@ class Permission(BaseModel):
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<Permission(id={self.id}, resource={self.resource}, action={self.action}, scope={self.scope})>"
-
-    @property
-    def permission_string(self) -> str:
-        """Return permission as string format: resource:action:scope."""
-        return f"{self.resource}:{self.action}:{self.scope}"
@@ -2,7 +2,8 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, String, Text
+from sqlalchemy import Boolean, Identity, Index, SmallInteger, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -17,13 +18,21 @@ class Role(BaseModel):
     Role model for Role-Based Access Control.
 
     Attributes:
+        id: Small integer primary key (roles number in the tens)
         name: Role name (unique), e.g., "Admin", "Manager", "User"
         description: Optional description of the role
         is_system: Whether this is a system role (cannot be deleted)
+        permission_ids: Granted permission IDs, kept in sync with role_permissions by trigger
     """
 
     __tablename__ = "roles"
 
+    # Overrides the UUID key from BaseModel
+    id: Mapped[int] = mapped_column(
+        SmallInteger,
+        Identity(),
+        primary_key=True,
+    )
     name: Mapped[str] = mapped_column(
         String(100),
         unique=True,
@@ -40,12 +49,24 @@ class Role(BaseModel):
         nullable=False,
     )
 
+    # Denormalized copy of role_permissions; written only by the sync trigger
+    permission_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(SmallInteger),
+        server_default=text("'{}'"),
+        nullable=False,
+    )
+
     # Relationships
     permissions: Mapped[list["Permission"]] = relationship(
         "Permission",
         secondary="role_permissions",
         back_populates="roles",
-        lazy="selectin",
+        lazy="raise_on_sql",
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_roles_permission_ids", "permission_ids", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
@@ -1,14 +1,39 @@
 """Role-Permission association table for RBAC."""
 
-from uuid import UUID
-
-from sqlalchemy import ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy import DDL, ForeignKey, SmallInteger, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 from app.models.base import TimestampMixin
 
+# Row-level trigger mirroring role_permissions into roles.permission_ids,
+# recomputed from the junction table like sync_user_role_ids().
+SYNC_ROLE_PERMISSION_IDS_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION sync_role_permission_ids() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE roles SET permission_ids = ARRAY(
+                SELECT permission_id FROM role_permissions
+                WHERE role_id = NEW.role_id ORDER BY permission_id
+            ) WHERE id = NEW.role_id;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE roles SET permission_ids = ARRAY(
+                SELECT permission_id FROM role_permissions
+                WHERE role_id = OLD.role_id ORDER BY permission_id
+            ) WHERE id = OLD.role_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+SYNC_ROLE_PERMISSION_IDS_TRIGGER_SQL = """
+    CREATE OR REPLACE TRIGGER role_permissions_sync_permission_ids
+    AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE ON role_permissions
+    FOR EACH ROW EXECUTE FUNCTION sync_role_permission_ids()
+"""
+
 
 class RolePermission(Base, TimestampMixin):
     """
@@ -21,13 +46,13 @@ class RolePermission(Base, TimestampMixin):
 
     __tablename__ = "role_permissions"
 
-    role_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True),
+    role_id: Mapped[int] = mapped_column(
+        SmallInteger,
         ForeignKey("roles.id", ondelete="CASCADE"),
         primary_key=True,
     )
-    permission_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True),
+    permission_id: Mapped[int] = mapped_column(
+        SmallInteger,
         ForeignKey("permissions.id", ondelete="CASCADE"),
         primary_key=True,
     )
@@ -35,3 +60,17 @@ class RolePermission(Base, TimestampMixin):
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<RolePermission(role_id={self.role_id}, permission_id={self.permission_id})>"
+
+
+# Keep metadata-built databases (tests, init_db) in sync with the migration
+event.listen(
+    RolePermission.__table__, "after_create", DDL(SYNC_ROLE_PERMISSION_IDS_FUNCTION_SQL)
+)
+event.listen(
+    RolePermission.__table__, "after_create", DDL(SYNC_ROLE_PERMISSION_IDS_TRIGGER_SQL)
+)
+event.listen(
+    RolePermission.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS sync_role_permission_ids()"),
+)
@@ -1,12 +1,25 @@
 """User model for authentication."""
 
 from datetime import datetime
-from enum import Enum
+from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Index, String, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Computed,
+    DateTime,
+    Enum,
+    Index,
+    SmallInteger,
+    String,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.database import Base
 from app.models.base import BaseModel
 from app.models.user_role import UserRole
 
@@ -14,7 +27,7 @@ if TYPE_CHECKING:
     from app.models.role import Role
 
 
-class AuthProvider(str, Enum):
+class AuthProvider(str, PyEnum):
     """Authentication provider types."""
 
     LOCAL = "local"
@@ -28,7 +41,7 @@ class User(BaseModel):
     User model for authentication and authorization.
 
     Attributes:
-        email: User's email address (unique)
+        email: User's email address (unique, case-insensitive)
         username: User's username (unique)
         password_hash: Hashed password (nullable for OIDC users)
         auth_provider: Authentication provider (local, oidc, etc.)
@@ -36,14 +49,17 @@ class User(BaseModel):
         oidc_issuer: OIDC issuer URL
         is_active: Whether the user account is active
         is_verified: Whether the user's email is verified
+        is_oidc_user: Whether the user signs in through an external provider (generated)
         last_login_at: Timestamp of last login
+        role_ids: Assigned role IDs, kept in sync with user_roles by trigger
     """
 
     __tablename__ = "users"
 
     # Core fields
+    # citext: the unique index itself rejects A@x.com vs a@x.com
     email: Mapped[str] = mapped_column(
-        String(255),
+        CITEXT(),
         unique=True,
         nullable=False,
         index=True,
@@ -60,9 +76,14 @@ class User(BaseModel):
     )
 
     # Authentication provider
-    auth_provider: Mapped[str] = mapped_column(
-        String(50),
-        default=AuthProvider.LOCAL.value,
+    auth_provider: Mapped[AuthProvider] = mapped_column(
+        Enum(
+            AuthProvider,
+            name="auth_provider_enum",
+            native_enum=True,
+            values_callable=lambda enum: [member.value for member in enum],
+        ),
+        default=AuthProvider.LOCAL,
         nullable=False,
     )
 
@@ -87,6 +108,11 @@ class User(BaseModel):
         default=False,
         nullable=False,
     )
+    is_oidc_user: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed("auth_provider <> 'local'", persisted=True),
+        nullable=False,
+    )
 
     # Tracking
     last_login_at: Mapped[datetime | None] = mapped_column(
@@ -94,31 +120,39 @@ class User(BaseModel):
         nullable=True,
     )
 
+    # Denormalized copy of user_roles; written only by the sync trigger
+    role_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(SmallInteger),
+        server_default=text("'{}'"),
+        nullable=False,
+    )
+
     # Relationships
     roles: Mapped[list["Role"]] = relationship(
         "Role",
         secondary="user_roles",
         primaryjoin="User.id == UserRole.user_id",
         secondaryjoin="foreign(UserRole.role_id) == Role.id",
-        lazy="selectin",
         viewonly=True,
     )
 
     # Indexes
     __table_args__ = (
         Index("idx_users_oidc", "oidc_issuer", "oidc_subject"),
-        Index("idx_users_auth_provider", "auth_provider"),
+        # Narrow partial index for OIDC-only queries; auth_provider alone is
+        # too low-cardinality for a full index to help
+        Index("idx_users_oidc_true", "id", postgresql_where=text("is_oidc_user")),
+        Index("idx_users_role_ids", "role_ids", postgresql_using="gin"),
+        # Index-only scans for document owner lookups (OwnerBrief)
+        Index("idx_users_id_covering", "id", postgresql_include=["username", "email"]),
     )
 
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
 
-    @property
-    def is_oidc_user(self) -> bool:
-        """Check if user authenticated via OIDC."""
-        return self.auth_provider != AuthProvider.LOCAL.value
 
-    def update_last_login(self) -> None:
-        """Update last login timestamp."""
-        self.last_login_at = func.now()
+# Keep metadata-built databases (tests, init_db) in sync with the migration
+event.listen(
+    Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS citext")
+)
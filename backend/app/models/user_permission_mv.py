@@ -0,0 +1,220 @@
+"""Materialized view of effective user permissions."""
+
+from uuid import UUID
+
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    ColumnElement,
+    SmallInteger,
+    String,
+    event,
+    func,
+    literal,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.permission import Permission, PermissionScope
+
+# Pre-joined users -> user_roles -> role_permissions -> permissions.
+# DISTINCT because a user can reach the same permission through several roles.
+USER_PERMISSIONS_MV_SQL = """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS user_permissions_mv AS
+    SELECT DISTINCT
+        ur.user_id,
+        p.id AS permission_id,
+        p.resource,
+        p.action,
+        p.scope,
+        p.resource || ':' || p.action || ':' || p.scope AS permission_string
+    FROM user_roles ur
+    JOIN role_permissions rp ON rp.role_id = ur.role_id
+    JOIN permissions p ON p.id = rp.permission_id
+"""
+
+# Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+USER_PERMISSIONS_MV_INDEX_SQL = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_user_permissions_mv_user_permission
+    ON user_permissions_mv (user_id, permission_id)
+"""
+
+# Refreshing rebuilds the whole view and concurrent refreshes serialize, so
+# writers pay for it once per transaction rather than once per statement:
+# deferred row triggers fire at commit and the first one refreshes, the rest
+# see the transaction-local flag and skip. Statement triggers clear the flag
+# so rows changed after an early refresh (SET CONSTRAINTS ... IMMEDIATE) get
+# another one; TRUNCATE has no row triggers and refreshes right away.
+REFRESH_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION refresh_user_permissions_mv() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            REFRESH MATERIALIZED VIEW CONCURRENTLY user_permissions_mv;
+        ELSIF TG_LEVEL = 'STATEMENT' THEN
+            PERFORM set_config('rbac.user_permissions_mv_refreshed', '', true);
+        ELSIF current_setting('rbac.user_permissions_mv_refreshed', true)
+                IS DISTINCT FROM 'on' THEN
+            PERFORM set_config('rbac.user_permissions_mv_refreshed', 'on', true);
+            REFRESH MATERIALIZED VIEW CONCURRENTLY user_permissions_mv;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+# Server-side permission predicate for use inside queries. Wildcards and
+# the scope hierarchy match RBACService.has_permission; permission_scope
+# labels are declared own < team < all, so enum comparison orders scopes.
+USER_HAS_PERMISSION_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION user_has_permission(
+        p_user_id uuid,
+        p_resource text,
+        p_action text,
+        p_scope permission_scope DEFAULT 'own'
+    ) RETURNS boolean AS $$
+        SELECT EXISTS (
+            SELECT 1
+            FROM user_permissions_mv
+            WHERE user_id = p_user_id
+              AND resource IN (p_resource, '*')
+              AND action IN (p_action, '*')
+              AND scope >= p_scope
+        )
+    $$ LANGUAGE sql STABLE
+"""
+
+# Deferred row triggers and statement triggers on every table feeding the
+# view, limited to the columns it reads
+REFRESH_TRIGGERS_SQL = (
+    """
+    CREATE CONSTRAINT TRIGGER user_roles_refresh_permissions_mv
+    AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE ON user_roles
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv()
+    """,
+    """
+    CREATE TRIGGER user_roles_refresh_permissions_mv_statement
+    AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE OR TRUNCATE ON user_roles
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv()
+    """,
+    """
+    CREATE CONSTRAINT TRIGGER role_permissions_refresh_permissions_mv
+    AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE ON role_permissions
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv()
+    """,
+    """
+    CREATE TRIGGER role_permissions_refresh_permissions_mv_statement
+    AFTER INSERT OR UPDATE OF role_id, permission_id OR DELETE OR TRUNCATE
+    ON role_permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv()
+    """,
+    """
+    CREATE CONSTRAINT TRIGGER permissions_refresh_permissions_mv
+    AFTER UPDATE OF resource, action, scope ON permissions
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION refresh_user_permissions_mv()
+    """,
+    """
+    CREATE TRIGGER permissions_refresh_permissions_mv_statement
+    AFTER UPDATE OF resource, action, scope ON permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_permissions_mv()
+    """,
+)
+
+
+class _ViewBase(DeclarativeBase):
+    """Separate registry so create_all/autogenerate never treat views as tables."""
+
+    pass
+
+
+class UserPermissionMV(_ViewBase):
+    """
+    Read-only mapping of the user_permissions_mv materialized view.
+
+    Attributes:
+        user_id: User holding the permission
+        permission_id: Permission ID
+        resource: Permission resource
+        action: Permission action
+        scope: Permission scope
+        permission_string: "resource:action:scope"
+    """
+
+    __tablename__ = "user_permissions_mv"
+
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    permission_id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    resource: Mapped[str] = mapped_column(String(100))
+    action: Mapped[str] = mapped_column(String(50))
+    scope: Mapped[str] = mapped_column(String(20))
+    permission_string: Mapped[str] = mapped_column(String(172))
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"<UserPermissionMV(user_id={self.user_id}, "
+            f"permission={self.permission_string})>"
+        )
+
+
+def user_has_permission(
+    user_id: UUID | ColumnElement[UUID],
+    resource: str,
+    action: str,
+    scope: str = PermissionScope.OWN.value,
+) -> ColumnElement[bool]:
+    """
+    SQL expression checking a permission inside a query.
+
+    Lets a statement filter or EXISTS on permissions, e.g. against a
+    user_id column, instead of checking rows one by one in Python.
+
+    Args:
+        user_id: User ID value or column
+        resource: Resource name
+        action: Action name
+        scope: Minimum required scope (own, team, all)
+
+    Returns:
+        Boolean SQL expression calling user_has_permission()
+    """
+    return func.user_has_permission(
+        user_id,
+        resource,
+        action,
+        literal(PermissionScope(scope), Permission.scope.type),
+        type_=Boolean,
+    )
+
+
+# Keep metadata-built databases (tests, init_db) in sync with the migration
+for _statement in (
+    USER_PERMISSIONS_MV_SQL,
+    USER_PERMISSIONS_MV_INDEX_SQL,
+    REFRESH_FUNCTION_SQL,
+    *REFRESH_TRIGGERS_SQL,
+    USER_HAS_PERMISSION_FUNCTION_SQL,
+):
+    event.listen(Base.metadata, "after_create", DDL(_statement))
+
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(
+        "DROP FUNCTION IF EXISTS "
+        "user_has_permission(uuid, text, text, permission_scope)"
+    ),
+)
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS user_permissions_mv"),
+)
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP FUNCTION IF EXISTS refresh_user_permissions_mv() CASCADE"),
+)
@@ -1,13 +1,66 @@
 """User-Role association table for RBAC."""
 
-from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy import (
+    DDL,
+    ColumnElement,
+    ForeignKey,
+    ScalarSelect,
+    SmallInteger,
+    event,
+    select,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, column_property, mapped_column
 
 from app.core.database import Base
+from app.models.audit_log import AuditAction, AuditLog
+
+# Row-level trigger mirroring user_roles into users.role_ids. The array is
+# recomputed from the junction table so it stays correct under any mix of
+# inserts, updates, deletes and ON DELETE CASCADE from roles.
+SYNC_USER_ROLE_IDS_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION sync_user_role_ids() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE users SET role_ids = ARRAY(
+                SELECT role_id FROM user_roles WHERE user_id = NEW.user_id ORDER BY role_id
+            ) WHERE id = NEW.user_id;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE users SET role_ids = ARRAY(
+                SELECT role_id FROM user_roles WHERE user_id = OLD.user_id ORDER BY role_id
+            ) WHERE id = OLD.user_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+SYNC_USER_ROLE_IDS_TRIGGER_SQL = """
+    CREATE OR REPLACE TRIGGER user_roles_sync_role_ids
+    AFTER INSERT OR UPDATE OF user_id, role_id OR DELETE ON user_roles
+    FOR EACH ROW EXECUTE FUNCTION sync_user_role_ids()
+"""
+
+# Assignment metadata is recorded once, in audit_logs; this view joins it back
+# onto user_roles for reporting queries.
+USER_ROLE_ASSIGNMENTS_VIEW_SQL = """
+    CREATE OR REPLACE VIEW user_role_assignments AS
+    SELECT ur.user_id, ur.role_id, a.created_at AS assigned_at, a.user_id AS assigned_by
+    FROM user_roles ur
+    LEFT JOIN LATERAL (
+        SELECT al.created_at, al.user_id
+        FROM audit_logs al
+        WHERE al.action = 'role_assigned'
+          AND al.target_user_id = ur.user_id
+          AND al.role_id = ur.role_id
+        ORDER BY al.created_at DESC
+        LIMIT 1
+    ) a ON true
+"""
 
 
 class UserRole(Base):
@@ -17,8 +70,8 @@ class UserRole(Base):
     Attributes:
         user_id: Foreign key to users table
         role_id: Foreign key to roles table
-        assigned_at: When the role was assigned
-        assigned_by: Who assigned the role (user ID)
+        assigned_at: When the role was assigned (deferred, from audit_logs)
+        assigned_by: Who assigned the role (deferred, from audit_logs)
     """
 
     __tablename__ = "user_roles"
@@ -28,22 +81,49 @@ class UserRole(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         primary_key=True,
     )
-    role_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True),
+    role_id: Mapped[int] = mapped_column(
+        SmallInteger,
         ForeignKey("roles.id", ondelete="CASCADE"),
         primary_key=True,
     )
-    assigned_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-    )
-    assigned_by: Mapped[UUID | None] = mapped_column(
-        PGUUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-    )
 
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<UserRole(user_id={self.user_id}, role_id={self.role_id})>"
+
+
+def _latest_assignment(column: ColumnElement[Any]) -> ScalarSelect[Any]:
+    """Correlated subquery for a column of the latest role_assigned audit row."""
+    return (
+        select(column)
+        .where(
+            AuditLog.action == AuditAction.ROLE_ASSIGNED,
+            AuditLog.target_user_id == UserRole.user_id,
+            AuditLog.role_id == UserRole.role_id,
+        )
+        .order_by(AuditLog.created_at.desc())
+        .limit(1)
+        .correlate_except(AuditLog)
+        .scalar_subquery()
+    )
+
+
+# Deferred: only loaded when requested with undefer(), never on hot reads
+UserRole.assigned_at = column_property(_latest_assignment(AuditLog.created_at), deferred=True)
+UserRole.assigned_by = column_property(_latest_assignment(AuditLog.user_id), deferred=True)
+
+
+# Keep metadata-built databases (tests, init_db) in sync with the migration
+event.listen(UserRole.__table__, "after_create", DDL(SYNC_USER_ROLE_IDS_FUNCTION_SQL))
+event.listen(UserRole.__table__, "after_create", DDL(SYNC_USER_ROLE_IDS_TRIGGER_SQL))
+event.listen(
+    UserRole.__table__,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS sync_user_role_ids()"),
+)
+event.listen(Base.metadata, "after_create", DDL(USER_ROLE_ASSIGNMENTS_VIEW_SQL))
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL("DROP VIEW IF EXISTS user_role_assignments"),
+)
@@ -1,9 +1,10 @@
 """Document schemas for request/response validation."""
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class DocumentBase(BaseModel):
@@ -74,6 +75,12 @@ class DocumentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("meta", mode="before")
+    @classmethod
+    def empty_meta_from_null(cls, value: Any) -> Any:
+        """Documents without metadata store NULL; expose it as an empty object."""
+        return {} if value is None else value
+
 
 class DocumentListResponse(BaseModel):
     """Schema for paginated document list response."""
@@ -83,3 +90,7 @@ class DocumentListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page; None on the last page",
+    )
@@ -1,7 +1,6 @@
 """Permission schemas for request/response validation."""
 
 from datetime import datetime
-from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -23,8 +22,8 @@ class PermissionBase(BaseModel):
         max_length=50,
         description="Action name (e.g., create, read, update, delete, *)",
     )
-    scope: str = Field(
-        default=PermissionScope.OWN.value,
+    scope: PermissionScope = Field(
+        default=PermissionScope.OWN,
         description="Permission scope (own, team, all)",
     )
     description: str | None = Field(
@@ -45,7 +44,7 @@ class PermissionResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: UUID
+    id: int
     resource: str
     action: str
     scope: str
@@ -53,11 +52,6 @@ class PermissionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @property
-    def permission_string(self) -> str:
-        """Return permission as string format."""
-        return f"{self.resource}:{self.action}:{self.scope}"
-
 
 class PermissionListResponse(BaseModel):
     """Schema for permission list response."""
@@ -69,7 +63,7 @@ class PermissionListResponse(BaseModel):
 class PermissionAssign(BaseModel):
     """Schema for assigning permissions to a role."""
 
-    permission_ids: list[UUID] = Field(
+    permission_ids: list[int] = Field(
         ...,
         min_length=1,
         description="List of permission IDs to assign",
@@ -1,7 +1,6 @@
 """Role schemas for request/response validation."""
 
 from datetime import datetime
-from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -49,23 +48,18 @@ class PermissionBrief(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: UUID
+    id: int
     resource: str
     action: str
     scope: str
 
-    @property
-    def permission_string(self) -> str:
-        """Return permission as string format."""
-        return f"{self.resource}:{self.action}:{self.scope}"
-
 
 class RoleResponse(BaseModel):
     """Schema for role response."""
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: UUID
+    id: int
     name: str
     description: str | None
     is_system: bool
@@ -2,9 +2,11 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Annotated, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 from app.schemas.document import DocumentResponse
 
@@ -18,6 +20,10 @@ class SearchMode(str, Enum):
     BOOLEAN = "boolean"
 
 
+# Document fields that highlights and suggestions can come from
+SearchField = Literal["title", "content"]
+
+
 class SearchFilters(BaseModel):
     """Filters for search query."""
 
@@ -69,11 +75,14 @@ class SearchRequest(BaseModel):
     )
 
 
-class SearchHighlight(BaseModel):
+# A TypedDict rather than a model: the service's highlight dicts are
+# serialized as they are, with no per-fragment object. The wire format and
+# OpenAPI schema are the same as for a model.
+class SearchHighlight(TypedDict):
     """Highlighted text fragment from search result."""
 
-    field: str = Field(description="Field name (title or content)")
-    fragment: str = Field(description="Highlighted text fragment with <b> tags")
+    field: Annotated[SearchField, Field(description="Field name (title or content)")]
+    fragment: Annotated[str, Field(description="Highlighted text fragment with <b> tags")]
 
 
 class SearchResultItem(BaseModel):
@@ -104,7 +113,7 @@ class SearchSuggestion(BaseModel):
 
     text: str = Field(description="Suggested text")
     document_id: UUID = Field(description="Document ID")
-    field: str = Field(description="Field the suggestion came from")
+    field: SearchField = Field(description="Field the suggestion came from")
 
 
 class SearchSuggestionsResponse(BaseModel):
@@ -1,9 +1,15 @@
 """User schemas for request/response validation."""
 
+import re
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Compiled once and shared by every validation
+_USERNAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+# Shape check only; full RFC validation (EmailStr) is done at registration
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 class UserUpdate(BaseModel):
@@ -13,10 +19,29 @@ class UserUpdate(BaseModel):
         default=None,
         min_length=3,
         max_length=100,
-        pattern=r"^[a-zA-Z0-9_-]+$",
         description="Username (alphanumeric, underscore, hyphen)",
     )
-    email: EmailStr | None = Field(default=None, description="User email address")
+    email: str | None = Field(
+        default=None,
+        max_length=255,
+        description="User email address",
+    )
+
+    @field_validator("username")
+    @classmethod
+    def username_charset(cls, value: str | None) -> str | None:
+        """Allow only letters, digits, underscores and hyphens."""
+        if value is not None and not _USERNAME_RE.fullmatch(value):
+            raise ValueError("Username may only contain letters, digits, underscores and hyphens")
+        return value
+
+    @field_validator("email")
+    @classmethod
+    def email_shape(cls, value: str | None) -> str | None:
+        """Require a local part, an @ and a dotted domain."""
+        if value is not None and not _EMAIL_RE.fullmatch(value):
+            raise ValueError("Invalid email address")
+        return value
 
 
 class UserProfile(BaseModel):
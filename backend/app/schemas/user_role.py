@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class UserRoleAssign(BaseModel):
     """Schema for assigning a role to a user."""
 
-    role_id: UUID = Field(..., description="Role ID to assign")
+    role_id: int = Field(..., description="Role ID to assign")
 
 
 class UserRoleBulkAssign(BaseModel):
@@ -20,7 +20,7 @@ class UserRoleBulkAssign(BaseModel):
         min_length=1,
         description="List of user IDs",
     )
-    role_id: UUID = Field(..., description="Role ID to assign")
+    role_id: int = Field(..., description="Role ID to assign")
 
 
 class RoleBrief(BaseModel):
@@ -28,7 +28,7 @@ class RoleBrief(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: UUID
+    id: int
     name: str
     description: str | None
 
@@ -39,9 +39,9 @@ class UserRoleResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     user_id: UUID
-    role_id: UUID
+    role_id: int
     role: RoleBrief
-    assigned_at: datetime
+    assigned_at: datetime | None
     assigned_by: UUID | None
 
 
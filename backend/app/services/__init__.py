@@ -1,49 +1,56 @@
-"""Business logic services."""
-
-from app.services.document import (
-    check_document_ownership,
-    create_document,
-    delete_document,
-    get_document,
-    get_document_with_owner_check,
-    get_documents_by_owner,
-    list_documents,
-    update_document,
-)
-from app.services.jwt import (
-    create_access_token,
-    create_refresh_token,
-    create_tokens,
-    decode_token,
-    invalidate_refresh_token,
-    is_token_expired,
-    store_refresh_token,
-    validate_refresh_token,
-)
-from app.services.search import SearchService
-from app.services.security import hash_password, needs_rehash, verify_password
-
-__all__ = [
-    "hash_password",
-    "verify_password",
-    "needs_rehash",
-    "create_access_token",
-    "create_refresh_token",
-    "create_tokens",
-    "decode_token",
-    "is_token_expired",
-    "store_refresh_token",
-    "invalidate_refresh_token",
-    "validate_refresh_token",
+"""Business logic services.
+
+Re-exports are resolved lazily: importing one service module (e.g.
+app.services.jwt) no longer loads every other service with the package.
+"""
+
+import importlib
+from typing import Any
+
+# Exported name -> module that defines it
+_LAZY: dict[str, str] = {
+    # Security
+    "hash_password": "app.services.security",
+    "verify_password": "app.services.security",
+    "needs_rehash": "app.services.security",
+    "hash_password_async": "app.services.security",
+    "verify_password_async": "app.services.security",
+    # JWT
+    "create_access_token": "app.services.jwt",
+    "create_refresh_token": "app.services.jwt",
+    "create_tokens": "app.services.jwt",
+    "decode_token": "app.services.jwt",
+    "is_token_expired": "app.services.jwt",
+    "store_refresh_token": "app.services.jwt",
+    "invalidate_refresh_token": "app.services.jwt",
+    "validate_refresh_token": "app.services.jwt",
     # Document
-    "create_document",
-    "get_document",
-    "get_document_with_owner_check",
-    "update_document",
-    "delete_document",
-    "list_documents",
-    "get_documents_by_owner",
-    "check_document_ownership",
+    "create_document": "app.services.document",
+    "get_document": "app.services.document",
+    "get_document_with_owner_check": "app.services.document",
+    "update_document": "app.services.document",
+    "delete_document": "app.services.document",
+    "list_documents": "app.services.document",
+    "get_documents_by_owner": "app.services.document",
+    "check_document_ownership": "app.services.document",
     # Search
-    "SearchService",
-]
+    "SearchService": "app.services.search",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining module on first access of an exported name."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazy exports in dir() and tab completion."""
+    return sorted([*globals(), *__all__])
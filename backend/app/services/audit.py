@@ -1,26 +1,154 @@
 """Audit logging service for tracking role and permission changes."""
 
-import json
-from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import CTE, Insert, cast, func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.audit_log import AuditAction, AuditLog
 from app.models.role import Role
 from app.models.user import User
 
+# Built once: every audit write reuses the same construct, so SQLAlchemy's
+# compiled cache and the driver's prepared statement are hit on each call
+_AUDIT_INSERT = insert(AuditLog)
+
 
 class AuditService:
     """Service for creating audit logs."""
 
+    @staticmethod
+    def _row(
+        action: AuditAction,
+        entity_type: str,
+        entity_id: str,
+        user_id: UUID,
+        details: dict[str, Any],
+        role_id: int | None = None,
+        target_user_id: UUID | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the column values of one audit row.
+
+        created_at is left to the column's now() default, which is the
+        transaction start time, so every entry of one request shares a
+        single timestamp without any Python-side clock call.
+        """
+        return {
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "user_id": user_id,
+            "target_user_id": target_user_id,
+            "role_id": role_id,
+            "details": details,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+
+    @staticmethod
+    def role_assigned_row(
+        user_id: UUID,
+        target_user_id: UUID,
+        role_id: int,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the audit row for a role assignment without writing it.
+
+        Args:
+            user_id: ID of the user who performed the action
+            target_user_id: ID of the user who received the role
+            role_id: ID of the assigned role
+            ip_address: IP address of the requester
+            user_agent: User agent string
+
+        Returns:
+            Column values for AuditService.log_many
+        """
+        return AuditService._row(
+            AuditAction.ROLE_ASSIGNED,
+            "user_role",
+            str(target_user_id),
+            user_id,
+            {"role_id": role_id, "target_user_id": target_user_id},
+            role_id=role_id,
+            target_user_id=target_user_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+    @staticmethod
+    def role_assigned_from(
+        assigned: CTE,
+        user_id: UUID,
+        role_id: int,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> Insert:
+        """
+        Build an INSERT ... SELECT auditing each row of a role-assignment CTE.
+
+        SQL counterpart of role_assigned_row, for assignments made by a
+        data-modifying CTE so both writes share one statement.
+
+        Args:
+            assigned: CTE returning the user_id of each new assignment
+            user_id: ID of the user who performed the action
+            role_id: ID of the assigned role
+            ip_address: IP address of the requester
+            user_agent: User agent string
+
+        Returns:
+            INSERT statement reading from the CTE
+        """
+        target_user_id = assigned.c.user_id
+        columns = AuditLog.__table__.c
+        return insert(AuditLog).from_select(
+            [
+                "action", "entity_type", "entity_id", "user_id", "target_user_id",
+                "role_id", "details", "ip_address", "user_agent",
+            ],
+            select(
+                cast(literal(AuditAction.ROLE_ASSIGNED.value), columns.action.type),
+                literal("user_role", columns.entity_type.type),
+                cast(target_user_id, columns.entity_id.type),
+                literal(user_id, columns.user_id.type),
+                target_user_id,
+                literal(role_id, columns.role_id.type),
+                func.jsonb_build_object(
+                    "role_id", role_id, "target_user_id", target_user_id
+                ),
+                literal(ip_address, columns.ip_address.type),
+                literal(user_agent, columns.user_agent.type),
+            ).select_from(assigned),
+        )
+
+    @staticmethod
+    async def log_many(db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        """
+        Write several audit rows with one executemany of the shared INSERT.
+
+        The statement text does not depend on the number of rows, so a
+        single prepared statement serves single and bulk writes alike.
+
+        Args:
+            db: Database session
+            rows: Column values, all with the same keys
+        """
+        if rows:
+            await db.execute(_AUDIT_INSERT, rows)
+
     @staticmethod
     async def log_role_assigned(
         db: AsyncSession,
         user_id: UUID,
         target_user_id: UUID,
-        role_id: UUID,
+        role_id: int,
         ip_address: str | None = None,
         user_agent: str | None = None,
     ) -> None:
@@ -35,31 +163,13 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, target_user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :target_user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService.role_assigned_row(
+                    user_id, target_user_id, role_id, ip_address, user_agent
                 )
-            """),
-            {
-                "action": AuditAction.ROLE_ASSIGNED.value,
-                "entity_type": "user_role",
-                "entity_id": str(target_user_id),
-                "user_id": user_id,
-                "target_user_id": target_user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "target_user_id": str(target_user_id),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
     @staticmethod
@@ -67,7 +177,7 @@ class AuditService:
         db: AsyncSession,
         user_id: UUID,
         target_user_id: UUID,
-        role_id: UUID,
+        role_id: int,
         ip_address: str | None = None,
         user_agent: str | None = None,
     ) -> None:
@@ -82,38 +192,28 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, target_user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :target_user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService._row(
+                    AuditAction.ROLE_REMOVED,
+                    "user_role",
+                    str(target_user_id),
+                    user_id,
+                    {"role_id": role_id, "target_user_id": target_user_id},
+                    role_id=role_id,
+                    target_user_id=target_user_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
-            """),
-            {
-                "action": AuditAction.ROLE_REMOVED.value,
-                "entity_type": "user_role",
-                "entity_id": str(target_user_id),
-                "user_id": user_id,
-                "target_user_id": target_user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "target_user_id": str(target_user_id),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
     @staticmethod
     async def log_role_created(
         db: AsyncSession,
         user_id: UUID,
-        role_id: UUID,
+        role_id: int,
         role_name: str,
         ip_address: str | None = None,
         user_agent: str | None = None,
@@ -129,37 +229,27 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService._row(
+                    AuditAction.ROLE_CREATED,
+                    "role",
+                    str(role_id),
+                    user_id,
+                    {"role_id": role_id, "role_name": role_name},
+                    role_id=role_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
-            """),
-            {
-                "action": AuditAction.ROLE_CREATED.value,
-                "entity_type": "role",
-                "entity_id": str(role_id),
-                "user_id": user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "role_name": role_name,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
     @staticmethod
     async def log_role_updated(
         db: AsyncSession,
         user_id: UUID,
-        role_id: UUID,
+        role_id: int,
         changes: dict,
         ip_address: str | None = None,
         user_agent: str | None = None,
@@ -175,37 +265,27 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService._row(
+                    AuditAction.ROLE_UPDATED,
+                    "role",
+                    str(role_id),
+                    user_id,
+                    {"role_id": role_id, "changes": changes},
+                    role_id=role_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
-            """),
-            {
-                "action": AuditAction.ROLE_UPDATED.value,
-                "entity_type": "role",
-                "entity_id": str(role_id),
-                "user_id": user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "changes": changes,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
     @staticmethod
     async def log_role_deleted(
         db: AsyncSession,
         user_id: UUID,
-        role_id: UUID,
+        role_id: int,
         role_name: str,
         ip_address: str | None = None,
         user_agent: str | None = None,
@@ -221,38 +301,28 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService._row(
+                    AuditAction.ROLE_DELETED,
+                    "role",
+                    str(role_id),
+                    user_id,
+                    {"role_id": role_id, "role_name": role_name},
+                    role_id=role_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
-            """),
-            {
-                "action": AuditAction.ROLE_DELETED.value,
-                "entity_type": "role",
-                "entity_id": str(role_id),
-                "user_id": user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "role_name": role_name,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
     @staticmethod
     async def log_permission_assigned(
         db: AsyncSession,
         user_id: UUID,
-        role_id: UUID,
-        permission_id: UUID,
+        role_id: int,
+        permission_id: int,
         ip_address: str | None = None,
         user_agent: str | None = None,
     ) -> None:
@@ -267,38 +337,28 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService._row(
+                    AuditAction.PERMISSION_ASSIGNED,
+                    "role_permission",
+                    str(role_id),
+                    user_id,
+                    {"role_id": role_id, "permission_id": permission_id},
+                    role_id=role_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
-            """),
-            {
-                "action": AuditAction.PERMISSION_ASSIGNED.value,
-                "entity_type": "role_permission",
-                "entity_id": str(role_id),
-                "user_id": user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "permission_id": str(permission_id),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
     @staticmethod
     async def log_permission_removed(
         db: AsyncSession,
         user_id: UUID,
-        role_id: UUID,
-        permission_id: UUID,
+        role_id: int,
+        permission_id: int,
         ip_address: str | None = None,
         user_agent: str | None = None,
     ) -> None:
@@ -313,30 +373,20 @@ class AuditService:
             ip_address: IP address of the requester
             user_agent: User agent string
         """
-        await db.execute(
-            text("""
-                INSERT INTO audit_logs (
-                    action, entity_type, entity_id, user_id, role_id,
-                    details, ip_address, user_agent
-                ) VALUES (
-                    :action, :entity_type, :entity_id::text, :user_id, :role_id,
-                    :details, :ip_address, :user_agent
+        await AuditService.log_many(
+            db,
+            [
+                AuditService._row(
+                    AuditAction.PERMISSION_REMOVED,
+                    "role_permission",
+                    str(role_id),
+                    user_id,
+                    {"role_id": role_id, "permission_id": permission_id},
+                    role_id=role_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
                 )
-            """),
-            {
-                "action": AuditAction.PERMISSION_REMOVED.value,
-                "entity_type": "role_permission",
-                "entity_id": str(role_id),
-                "user_id": user_id,
-                "role_id": role_id,
-                "details": json.dumps({
-                    "role_id": str(role_id),
-                    "permission_id": str(permission_id),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }),
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            }
+            ],
         )
 
 
@@ -1,15 +1,24 @@
 """Document CRUD service."""
 
+import base64
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.document import Document
 from app.models.user import User
 from app.schemas.document import DocumentCreate, DocumentUpdate
 
+# Owner columns needed by OwnerBrief, fetched in the same round trip.
+# idx_users_id_covering lets Postgres serve them with an index-only scan.
+OWNER_BRIEF_OPTION = joinedload(Document.owner, innerjoin=True).load_only(
+    User.id, User.username, User.email
+)
+
 
 async def create_document(
     db: AsyncSession,
@@ -30,12 +39,11 @@ async def create_document(
     document = Document(
         title=document_data.title,
         content=document_data.content,
-        meta=document_data.meta,
+        meta=document_data.meta or None,
         owner_id=owner_id,
     )
     db.add(document)
     await db.flush()
-    await db.refresh(document)
     return document
 
 
@@ -58,7 +66,7 @@ async def get_document(
     query = select(Document).where(Document.id == document_id)
     
     if include_owner:
-        query = query.options(selectinload(Document.owner))
+        query = query.options(OWNER_BRIEF_OPTION)
     
     result = await db.execute(query)
     return result.scalar_one_or_none()
@@ -82,7 +90,7 @@ async def get_document_with_owner_check(
     """
     result = await db.execute(
         select(Document)
-        .options(selectinload(Document.owner))
+        .options(OWNER_BRIEF_OPTION)
         .where(
             Document.id == document_id,
             Document.owner_id == owner_id,
@@ -109,11 +117,24 @@ async def update_document(
     """
     update_dict = document_data.model_dump(exclude_unset=True)
     
-    for field, value in update_dict.items():
-        setattr(document, field, value)
-    
-    await db.flush()
-    await db.refresh(document)
+    # Empty metadata is stored as NULL
+    if "meta" in update_dict:
+        update_dict["meta"] = update_dict["meta"] or None
+
+    if not update_dict:
+        return document
+
+    # One UPDATE ... RETURNING; the loaded document is patched in place
+    # rather than going through unit-of-work change tracking
+    result = await db.execute(
+        update(Document)
+        .where(Document.id == document.id)
+        .values(**update_dict)
+        .returning(Document.updated_at, Document.search_vector)
+        .execution_options(synchronize_session=False)
+    )
+    for field, value in {**update_dict, **result.one()._mapping}.items():
+        set_committed_value(document, field, value)
     return document
 
 
@@ -136,50 +157,111 @@ async def delete_document(
     return True
 
 
+def encode_cursor(document: Document) -> str:
+    """
+    Encode a document's position in the listing as an opaque cursor.
+
+    Args:
+        document: Last document of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{document.created_at.isoformat()},{document.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, document_id = base64.urlsafe_b64decode(cursor).decode().split(",")
+        return datetime.fromisoformat(created_at), UUID(document_id)
+    except ValueError as e:  # bad base64, UTF-8, timestamp or UUID
+        raise ValueError("Invalid cursor") from e
+
+
 async def list_documents(
     db: AsyncSession,
     owner_id: UUID | None = None,
     page: int = 1,
     page_size: int = 20,
     include_owner: bool = False,
+    cursor: tuple[datetime, UUID] | None = None,
 ) -> tuple[list[Document], int]:
     """
-    List documents with pagination.
+    List documents with pagination, newest first.
+
+    With a cursor the page starts right after that document (keyset
+    pagination), so deep pages cost the same as the first one; page is then
+    ignored. Offset pagination by page number remains as a fallback.
 
     Args:
         db: Database session
         owner_id: Filter by owner ID (optional)
-        page: Page number (1-indexed)
+        page: Page number (1-indexed), used when no cursor is given
         page_size: Number of items per page
         include_owner: Whether to load owner relationship
+        cursor: (created_at, id) of the last document of the previous page
 
     Returns:
         Tuple of (documents list, total count)
     """
-    # Base query
-    query = select(Document)
-    count_query = select(func.count(Document.id))
-    
-    # Apply owner filter
-    if owner_id is not None:
-        query = query.where(Document.owner_id == owner_id)
-        count_query = count_query.where(Document.owner_id == owner_id)
+    owner_filter = [Document.owner_id == owner_id] if owner_id is not None else []
+
+    # Page rows carry the total of the whole filtered set, so one statement
+    # returns both. A window count would only see rows past the cursor, so
+    # keyset pages count through a scalar subquery instead.
+    if cursor is None:
+        total_column = func.count().over()
+    else:
+        total_column = (
+            select(func.count())
+            .select_from(Document)
+            .where(*owner_filter)
+            .correlate(None)
+            .scalar_subquery()
+        )
+    query = select(Document, total_column.label("total")).where(*owner_filter)
     
-    # Include owner if requested
+    # Include owner if requested; anything else must be loaded explicitly
     if include_owner:
-        query = query.options(selectinload(Document.owner))
-    
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        query = query.options(OWNER_BRIEF_OPTION, raiseload("*"))
+    else:
+        query = query.options(raiseload("*"))
     
-    # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    query = query.order_by(Document.created_at.desc()).offset(offset).limit(page_size)
+    # Apply pagination; id breaks created_at ties so pages never overlap
+    offset = 0
+    if cursor is not None:
+        query = query.where(tuple_(Document.created_at, Document.id) < cursor)
+    else:
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+    query = query.order_by(Document.created_at.desc(), Document.id.desc()).limit(page_size)
     
     # Execute query
     result = await db.execute(query)
-    documents = list(result.scalars().all())
+    rows = result.all()
+    documents = [row[0] for row in rows]
+    
+    if rows:
+        total = rows[0].total
+    elif offset or cursor is not None:
+        # Past the last page no row carries the total; count separately
+        count_query = select(func.count(Document.id)).where(*owner_filter)
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
     
     return documents, total
 
@@ -222,12 +304,15 @@ async def check_document_ownership(
     Returns:
         True if user owns the document, False otherwise
     """
+    # EXISTS stops at the first matching row
     result = await db.execute(
-        select(func.count(Document.id))
-        .where(
-            Document.id == document_id,
-            Document.owner_id == user_id,
+        select(
+            select(Document.id)
+            .where(
+                Document.id == document_id,
+                Document.owner_id == user_id,
+            )
+            .exists()
         )
     )
-    count = result.scalar() or 0
-    return count > 0
+    return bool(result.scalar())
@@ -1,38 +1,204 @@
 """Email service for sending transactional emails.
 
-This is a placeholder implementation that logs emails instead of sending them.
-Replace with actual email provider (SendGrid, AWS SES, SMTP, etc.) in production.
+Emails are delivered over pooled SMTP sessions when SMTP_HOST is configured;
+otherwise they are only logged (and printed in development).
 """
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Iterable
+from email.message import EmailMessage
+from email.utils import formataddr
+from functools import lru_cache
+from typing import Any, NotRequired, TypedDict
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; settings do not change at runtime
+_IS_DEVELOPMENT = settings.is_development
+
+# Maximum number of emails send_bulk builds and sends at once
+EMAIL_BULK_CONCURRENCY = 20
+
+
+class OutgoingEmail(TypedDict):
+    """Arguments of EmailService.send_email for one email of a bulk send."""
+
+    to_email: str
+    subject: str
+    html_content: bytes
+    text_content: NotRequired[str | None]
+
+
+class SMTPPool:
+    """
+    Pool of reusable SMTP sessions.
+
+    At most max_connections sessions are open at once; each is returned to
+    the pool after a send and closed once it has carried max_messages
+    messages, so the TLS handshake and login are paid once per session
+    instead of once per email.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = settings.SMTP_MAX_CONNECTIONS,
+        max_messages: int = settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+    ):
+        self.max_messages = max_messages
+        self._semaphore = asyncio.Semaphore(max_connections)
+        # Idle sessions with the number of messages they have sent
+        self._idle: list[tuple[Any, int]] = []
+
+    async def _connect(self) -> Any:
+        """Open and authenticate a new SMTP session."""
+        import aiosmtplib
+
+        client = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            use_tls=settings.SMTP_USE_TLS,
+        )
+        await client.connect()
+        if settings.SMTP_USERNAME:
+            await client.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD or "")
+        return client
+
+    @staticmethod
+    async def _quit(client: Any) -> None:
+        """Close a session, ignoring errors from an already broken connection."""
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send a message over an idle session, opening one if none is free."""
+        async with self._semaphore:
+            client, sent = (
+                self._idle.pop() if self._idle else (await self._connect(), 0)
+            )
+            try:
+                await client.send_message(message)
+            except Exception:
+                await self._quit(client)
+                raise
+
+            sent += 1
+            if sent >= self.max_messages:
+                await self._quit(client)
+            else:
+                self._idle.append((client, sent))
+
+    async def close(self) -> None:
+        """Close all idle sessions."""
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._quit(client) for client, _ in idle))
+
 
 class EmailService:
     """
     Email service for sending transactional emails.
 
-    This is a placeholder implementation. In production, integrate with:
-    - SendGrid
-    - AWS SES
-    - Mailgun
-    - SMTP server
+    Messages go through an SMTPPool when SMTP_HOST is set. Without it the
+    service only logs what would have been sent.
     """
 
     def __init__(self) -> None:
         """Initialize email service."""
         self.from_email = "noreply@example.com"
         self.from_name = "Enterprise Boilerplate"
+        self.max_concurrency = EMAIL_BULK_CONCURRENCY
+        self.pool = SMTPPool()
+
+    def build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: bytes,
+        text_content: str | None = None,
+    ) -> EmailMessage:
+        """
+        Build a MIME message from the sender address and rendered content.
+
+        Args:
+            to_email: Recipient email address.
+            subject: Email subject.
+            html_content: UTF-8 encoded HTML content of the email.
+            text_content: Plain text content (optional).
+
+        Returns:
+            EmailMessage: Message ready to be sent.
+        """
+        message = EmailMessage()
+        message["From"] = formataddr((self.from_name, self.from_email))
+        message["To"] = to_email
+        message["Subject"] = subject
+        if text_content is not None:
+            message.set_content(text_content)
+            message.add_alternative(
+                html_content,
+                maintype="text",
+                subtype="html",
+                params={"charset": "utf-8"},
+            )
+        else:
+            message.set_content(
+                html_content,
+                maintype="text",
+                subtype="html",
+                params={"charset": "utf-8"},
+            )
+        return message
+
+    async def _deliver(self, message: EmailMessage) -> bool:
+        """Send one message through the pool, or log it if SMTP is not configured."""
+        if settings.SMTP_HOST is None:
+            self._log(message)
+            return True
+
+        try:
+            await self.pool.send(message)
+        except Exception:
+            logger.exception("[EMAIL] Failed to send to %s", message["To"])
+            return False
+        return True
+
+    def _log(self, message: EmailMessage) -> None:
+        """Log (and in development print) a message instead of sending it."""
+        if not (_IS_DEVELOPMENT or logger.isEnabledFor(logging.INFO)):
+            return
+
+        # Decoding the MIME body is only worth it if something shows it
+        body = message.get_body(preferencelist=("html",)).get_content()
+        logger.info(
+            "[EMAIL] To: %s\nSubject: %s\nContent: %s...",
+            message["To"],
+            message["Subject"],
+            body[:200],
+        )
+
+        if _IS_DEVELOPMENT:
+            print(
+                f"{'=' * 60}\n"
+                "📧 EMAIL (Development Mode - Not Actually Sent)\n"
+                f"{'=' * 60}\n"
+                f"To: {message['To']}\n"
+                f"Subject: {message['Subject']}\n"
+                f"{'-' * 60}\n"
+                f"{body}\n"
+                f"{'=' * 60}"
+            )
 
     async def send_email(
         self,
         to_email: str,
         subject: str,
-        html_content: str,
+        html_content: bytes,
         text_content: str | None = None,
     ) -> bool:
         """
@@ -41,45 +207,39 @@ class EmailService:
         Args:
             to_email: Recipient email address.
             subject: Email subject.
-            html_content: HTML content of the email.
+            html_content: UTF-8 encoded HTML content of the email.
             text_content: Plain text content (optional).
 
         Returns:
             bool: True if email was sent successfully.
         """
-        # Placeholder: Log email instead of sending
-        logger.info(
-            f"[EMAIL] To: {to_email}\n"
-            f"Subject: {subject}\n"
-            f"Content: {html_content[:200]}..."
-        )
+        message = self.build_message(to_email, subject, html_content, text_content)
+        return await self._deliver(message)
 
-        if settings.is_development:
-            print("=" * 60)
-            print("📧 EMAIL (Development Mode - Not Actually Sent)")
-            print("=" * 60)
-            print(f"To: {to_email}")
-            print(f"Subject: {subject}")
-            print("-" * 60)
-            print(html_content)
-            print("=" * 60)
-
-        # TODO: Implement actual email sending
-        # Example with SendGrid:
-        # from sendgrid import SendGridAPIClient
-        # from sendgrid.helpers.mail import Mail
-        #
-        # message = Mail(
-        #     from_email=self.from_email,
-        #     to_emails=to_email,
-        #     subject=subject,
-        #     html_content=html_content,
-        # )
-        # sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        # response = sg.send(message)
-        # return response.status_code == 202
+    async def send_bulk(self, emails: Iterable[OutgoingEmail]) -> list[bool]:
+        """
+        Send many emails concurrently over the pooled SMTP sessions.
 
-        return True
+        At most max_concurrency emails are built and in flight at once, so a
+        large broadcast does not materialize every MIME message up front.
+
+        Args:
+            emails: send_email arguments, one dict per email.
+
+        Returns:
+            list[bool]: Per-email success, in input order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send_one(email: OutgoingEmail) -> bool:
+            async with semaphore:
+                return await self.send_email(**email)
+
+        return list(await asyncio.gather(*(send_one(email) for email in emails)))
+
+    async def close(self) -> None:
+        """Close pooled SMTP sessions."""
+        await self.pool.close()
 
     async def send_password_reset_email(
         self,
@@ -156,7 +316,9 @@ class EmailService:
             bool: True if email was sent successfully.
         """
         # Build verification URL
-        verify_url = f"http://localhost:3000/auth/verify-email?token={verification_token}"
+        verify_url = (
+            f"http://localhost:3000/auth/verify-email?token={verification_token}"
+        )
 
         subject = "Verify Your Email Address"
         html_content = get_email_verification_template(
@@ -171,248 +333,36 @@ class EmailService:
         )
 
 
-def get_password_reset_template(username: str, reset_url: str) -> str:
+# Templates are compiled once at import; autoescape HTML-escapes every field
+_templates = Environment(
+    loader=PackageLoader("app.services", "email_templates"),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+_PASSWORD_RESET_TEMPLATE = _templates.get_template("password_reset.html")
+_WELCOME_TEMPLATE = _templates.get_template("welcome.html")
+_EMAIL_VERIFICATION_TEMPLATE = _templates.get_template("email_verification.html")
+
+
+def get_password_reset_template(username: str, reset_url: str) -> bytes:
     """Generate password reset email HTML template."""
-    return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Password Reset</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 600px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .container {{
-            background: #f9fafb;
-            border-radius: 8px;
-            padding: 32px;
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 24px;
-        }}
-        .header h1 {{
-            color: #1f2937;
-            font-size: 24px;
-            margin: 0;
-        }}
-        .content {{
-            background: white;
-            border-radius: 8px;
-            padding: 24px;
-            margin-bottom: 24px;
-        }}
-        .button {{
-            display: inline-block;
-            background: #3b82f6;
-            color: white;
-            padding: 12px 24px;
-            border-radius: 6px;
-            text-decoration: none;
-            font-weight: 500;
-            margin: 16px 0;
-        }}
-        .button:hover {{
-            background: #2563eb;
-        }}
-        .footer {{
-            text-align: center;
-            color: #6b7280;
-            font-size: 14px;
-        }}
-        .warning {{
-            background: #fef3c7;
-            border: 1px solid #f59e0b;
-            border-radius: 6px;
-            padding: 12px;
-            margin-top: 16px;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔐 Password Reset Request</h1>
-        </div>
-        <div class="content">
-            <p>Hello <strong>{username}</strong>,</p>
-            <p>We received a request to reset your password. Click the button below to create a new password:</p>
-            <p style="text-align: center;">
-                <a href="{reset_url}" class="button">Reset Password</a>
-            </p>
-            <p>Or copy and paste this link into your browser:</p>
-            <p style="word-break: break-all; color: #3b82f6;">{reset_url}</p>
-            <div class="warning">
-                ⚠️ This link will expire in 30 minutes. If you didn't request a password reset, 
-                please ignore this email or contact support if you have concerns.
-            </div>
-        </div>
-        <div class="footer">
-            <p>This email was sent by Enterprise Boilerplate</p>
-            <p>© 2024 Enterprise Boilerplate. All rights reserved.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    return _PASSWORD_RESET_TEMPLATE.render(
+        username=username, reset_url=reset_url
+    ).encode()
 
 
-def get_welcome_template(username: str) -> str:
+@lru_cache(maxsize=1024)
+def get_welcome_template(username: str) -> bytes:
     """Generate welcome email HTML template."""
-    return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Welcome</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 600px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .container {{
-            background: #f9fafb;
-            border-radius: 8px;
-            padding: 32px;
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 24px;
-        }}
-        .header h1 {{
-            color: #1f2937;
-            font-size: 24px;
-            margin: 0;
-        }}
-        .content {{
-            background: white;
-            border-radius: 8px;
-            padding: 24px;
-            margin-bottom: 24px;
-        }}
-        .footer {{
-            text-align: center;
-            color: #6b7280;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎉 Welcome to Enterprise Boilerplate!</h1>
-        </div>
-        <div class="content">
-            <p>Hello <strong>{username}</strong>,</p>
-            <p>Thank you for creating an account. We're excited to have you on board!</p>
-            <p>You can now:</p>
-            <ul>
-                <li>Access your dashboard</li>
-                <li>Manage your documents</li>
-                <li>Configure your settings</li>
-            </ul>
-            <p>If you have any questions, feel free to reach out to our support team.</p>
-        </div>
-        <div class="footer">
-            <p>This email was sent by Enterprise Boilerplate</p>
-            <p>© 2024 Enterprise Boilerplate. All rights reserved.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    return _WELCOME_TEMPLATE.render(username=username).encode()
 
 
-def get_email_verification_template(username: str, verify_url: str) -> str:
+def get_email_verification_template(username: str, verify_url: str) -> bytes:
     """Generate email verification HTML template."""
-    return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Verify Email</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 600px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .container {{
-            background: #f9fafb;
-            border-radius: 8px;
-            padding: 32px;
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 24px;
-        }}
-        .header h1 {{
-            color: #1f2937;
-            font-size: 24px;
-            margin: 0;
-        }}
-        .content {{
-            background: white;
-            border-radius: 8px;
-            padding: 24px;
-            margin-bottom: 24px;
-        }}
-        .button {{
-            display: inline-block;
-            background: #10b981;
-            color: white;
-            padding: 12px 24px;
-            border-radius: 6px;
-            text-decoration: none;
-            font-weight: 500;
-            margin: 16px 0;
-        }}
-        .footer {{
-            text-align: center;
-            color: #6b7280;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>✉️ Verify Your Email</h1>
-        </div>
-        <div class="content">
-            <p>Hello <strong>{username}</strong>,</p>
-            <p>Please verify your email address by clicking the button below:</p>
-            <p style="text-align: center;">
-                <a href="{verify_url}" class="button">Verify Email</a>
-            </p>
-            <p>Or copy and paste this link into your browser:</p>
-            <p style="word-break: break-all; color: #10b981;">{verify_url}</p>
-        </div>
-        <div class="footer">
-            <p>This email was sent by Enterprise Boilerplate</p>
-            <p>© 2024 Enterprise Boilerplate. All rights reserved.</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    return _EMAIL_VERIFICATION_TEMPLATE.render(
+        username=username, verify_url=verify_url
+    ).encode()
 
 
 # Global email service instance
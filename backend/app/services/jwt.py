@@ -1,9 +1,12 @@
 """JWT token service for authentication."""
 
-from datetime import datetime, timedelta, timezone
+import hashlib
+import hmac
+import time
 from uuid import UUID
 
-from jose import JWTError, jwt
+import jwt
+from jwt.exceptions import PyJWTError
 
 from app.config import settings
 from app.core.redis import RedisCache, redis_client, user_cache_key
@@ -14,6 +17,41 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_TYPE = "access"
 REFRESH_TOKEN_TYPE = "refresh"
 
+# Token lifetimes in seconds
+ACCESS_TOKEN_LIFETIME = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_LIFETIME = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+# Maximum number of verified tokens kept by decode_token
+DECODE_CACHE_SIZE = 10_000
+
+# Verified payloads by token, least recently used first
+_decode_cache: dict[str, TokenPayload] = {}
+
+# Shared wrapper around the global Redis client
+_cache = RedisCache(redis_client)
+
+
+def _encode_token(subject: str, token_type: str, issued_at: int, lifetime: int) -> str:
+    """
+    Encode a signed token payload.
+
+    Args:
+        subject: Token subject (the user ID as a string).
+        token_type: ACCESS_TOKEN_TYPE or REFRESH_TOKEN_TYPE.
+        issued_at: Unix timestamp of issue.
+        lifetime: Seconds until the token expires.
+
+    Returns:
+        str: Encoded JWT.
+    """
+    payload = {
+        "sub": subject,
+        "exp": issued_at + lifetime,
+        "iat": issued_at,
+        "type": token_type,
+    }
+    return jwt.encode(payload, settings.JWT_SECRET, algorithm=ALGORITHM)
+
 
 def create_access_token(user_id: UUID) -> str:
     """
@@ -25,17 +63,9 @@ def create_access_token(user_id: UUID) -> str:
     Returns:
         str: Encoded JWT access token.
     """
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    payload = {
-        "sub": str(user_id),
-        "exp": int(expire.timestamp()),
-        "iat": int(now.timestamp()),
-        "type": ACCESS_TOKEN_TYPE,
-    }
-
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=ALGORITHM)
+    return _encode_token(
+        str(user_id), ACCESS_TOKEN_TYPE, int(time.time()), ACCESS_TOKEN_LIFETIME
+    )
 
 
 def create_refresh_token(user_id: UUID) -> str:
@@ -48,40 +78,50 @@ def create_refresh_token(user_id: UUID) -> str:
     Returns:
         str: Encoded JWT refresh token.
     """
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
-
-    payload = {
-        "sub": str(user_id),
-        "exp": int(expire.timestamp()),
-        "iat": int(now.timestamp()),
-        "type": REFRESH_TOKEN_TYPE,
-    }
-
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=ALGORITHM)
+    return _encode_token(
+        str(user_id), REFRESH_TOKEN_TYPE, int(time.time()), REFRESH_TOKEN_LIFETIME
+    )
 
 
 def decode_token(token: str) -> TokenPayload | None:
     """
     Decode and validate a JWT token.
 
+    Verified payloads are cached per token until they expire, so a client
+    sending the same bearer token on every request pays for the signature
+    check once. The cache is keyed by the full token string: a hit means
+    the exact same bytes were already verified.
+
     Args:
         token: JWT token string.
 
     Returns:
         TokenPayload: Decoded token payload if valid, None otherwise.
     """
+    cached = _decode_cache.pop(token, None)
+    if cached is not None:
+        if cached.exp <= time.time():
+            return None
+        # Re-insert to mark as most recently used
+        _decode_cache[token] = cached
+        return cached
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGORITHM])
-        return TokenPayload(
+        token_payload = TokenPayload(
             sub=payload["sub"],
             exp=payload["exp"],
             iat=payload["iat"],
             type=payload["type"],
         )
-    except JWTError:
+    except PyJWTError:
         return None
 
+    if len(_decode_cache) >= DECODE_CACHE_SIZE:
+        del _decode_cache[next(iter(_decode_cache))]
+    _decode_cache[token] = token_payload
+    return token_payload
+
 
 def is_token_expired(token_payload: TokenPayload) -> bool:
     """
@@ -93,14 +133,29 @@ def is_token_expired(token_payload: TokenPayload) -> bool:
     Returns:
         bool: True if token is expired, False otherwise.
     """
-    now = datetime.now(timezone.utc)
-    exp = datetime.fromtimestamp(token_payload.exp, tz=timezone.utc)
-    return now >= exp
+    return time.time() >= token_payload.exp
+
+
+def refresh_token_digest(refresh_token: str) -> str:
+    """
+    Compute the fixed-size digest stored in place of a refresh token.
+
+    A 16-byte BLAKE2b digest (32 hex characters) identifies the token as
+    well as the full JWT does for an equality check, at a fraction of the
+    Redis value size.
+
+    Args:
+        refresh_token: Refresh token.
+
+    Returns:
+        str: Hex digest of the token.
+    """
+    return hashlib.blake2b(refresh_token.encode(), digest_size=16).hexdigest()
 
 
 async def store_refresh_token(user_id: UUID, refresh_token: str) -> bool:
     """
-    Store refresh token in Redis for validation.
+    Store refresh token digest in Redis for validation.
 
     Args:
         user_id: User's UUID.
@@ -109,25 +164,24 @@ async def store_refresh_token(user_id: UUID, refresh_token: str) -> bool:
     Returns:
         bool: True if stored successfully, False otherwise.
     """
-    cache = RedisCache(redis_client)
     key = user_cache_key(str(user_id), "refresh_token")
-    expire_seconds = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-    return await cache.set(key, refresh_token, expire=expire_seconds)
+    return await _cache.set(
+        key, refresh_token_digest(refresh_token), expire=REFRESH_TOKEN_LIFETIME
+    )
 
 
 async def get_stored_refresh_token(user_id: UUID) -> str | None:
     """
-    Get stored refresh token from Redis.
+    Get stored refresh token digest from Redis.
 
     Args:
         user_id: User's UUID.
 
     Returns:
-        str: Stored refresh token if exists, None otherwise.
+        str: Stored refresh token digest if exists, None otherwise.
     """
-    cache = RedisCache(redis_client)
     key = user_cache_key(str(user_id), "refresh_token")
-    return await cache.get(key)
+    return await _cache.get(key)
 
 
 async def invalidate_refresh_token(user_id: UUID) -> bool:
@@ -140,14 +194,13 @@ async def invalidate_refresh_token(user_id: UUID) -> bool:
     Returns:
         bool: True if deleted successfully, False otherwise.
     """
-    cache = RedisCache(redis_client)
     key = user_cache_key(str(user_id), "refresh_token")
-    return await cache.delete(key)
+    return await _cache.delete(key)
 
 
 async def validate_refresh_token(user_id: UUID, refresh_token: str) -> bool:
     """
-    Validate a refresh token against the stored token.
+    Validate a refresh token against the stored digest.
 
     Args:
         user_id: User's UUID.
@@ -156,10 +209,10 @@ async def validate_refresh_token(user_id: UUID, refresh_token: str) -> bool:
     Returns:
         bool: True if token is valid and matches stored token, False otherwise.
     """
-    stored_token = await get_stored_refresh_token(user_id)
-    if stored_token is None:
+    stored_digest = await _cache.get(user_cache_key(str(user_id), "refresh_token"))
+    if stored_digest is None:
         return False
-    return stored_token == refresh_token
+    return hmac.compare_digest(stored_digest.encode(), refresh_token_digest(refresh_token).encode())
 
 
 def create_tokens(user_id: UUID) -> tuple[str, str, int]:
@@ -172,8 +225,10 @@ def create_tokens(user_id: UUID) -> tuple[str, str, int]:
     Returns:
         tuple: (access_token, refresh_token, expires_in_seconds)
     """
-    access_token = create_access_token(user_id)
-    refresh_token = create_refresh_token(user_id)
-    expires_in = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    # Both tokens share one subject string and issue timestamp
+    subject = str(user_id)
+    issued_at = int(time.time())
+    access_token = _encode_token(subject, ACCESS_TOKEN_TYPE, issued_at, ACCESS_TOKEN_LIFETIME)
+    refresh_token = _encode_token(subject, REFRESH_TOKEN_TYPE, issued_at, REFRESH_TOKEN_LIFETIME)
 
-    return access_token, refresh_token, expires_in
+    return access_token, refresh_token, ACCESS_TOKEN_LIFETIME
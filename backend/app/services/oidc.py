@@ -1,14 +1,29 @@
 """OIDC (OpenID Connect) service for SSO authentication."""
 
+import asyncio
+import time
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 import httpx
+import orjson
 from authlib.integrations.starlette_client import OAuth
 from authlib.jose import jwt
 from authlib.oidc.core import CodeIDToken
 
 from app.config import settings
+from app.core.redis import RedisCache, redis_client
+
+# Seconds provider metadata and JWKS are reused before being revalidated
+OIDC_METADATA_CACHE_TTL = 3600
+
+# Timeouts and pool limits of the shared provider HTTP client
+OIDC_HTTP_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+OIDC_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# Redis keys shared by all workers
+OIDC_CONFIG_CACHE_KEY = "oidc:well_known"
+OIDC_JWKS_CACHE_KEY = "oidc:jwks"
 
 
 class OIDCService:
@@ -26,7 +41,13 @@ class OIDCService:
     def __init__(self) -> None:
         """Initialize OIDC service."""
         self.oauth = OAuth()
-        self._provider_config: dict[str, Any] | None = None
+        # One keep-alive client, so provider calls reuse TCP/TLS connections
+        self._http = httpx.AsyncClient(timeout=OIDC_HTTP_TIMEOUT, limits=OIDC_HTTP_LIMITS)
+        # url -> (expires at, ETag, document); memory tier of _get_cached_json
+        self._documents: dict[str, tuple[float, str | None, dict[str, Any]]] = {}
+        self._document_locks: dict[str, asyncio.Lock] = {}
+        # Authorization URL up to the per-login state/nonce parameters
+        self._auth_url_prefix: str | None = None
 
         if settings.oidc_configured:
             self._configure_provider()
@@ -43,6 +64,78 @@ class OIDCService:
             },
         )
 
+        # Build authorization URL
+        # This will be replaced with actual URL from provider config
+        auth_endpoint = f"{settings.OIDC_ISSUER_URL}/protocol/openid-connect/auth"
+        static_params = {
+            "client_id": settings.OIDC_CLIENT_ID,
+            "redirect_uri": settings.OIDC_REDIRECT_URI,
+            "response_type": "code",
+            "scope": "openid email profile",
+        }
+        self._auth_url_prefix = f"{auth_endpoint}?{urlencode(static_params)}&"
+
+    async def _get_cached_json(self, url: str, cache_key: str) -> dict[str, Any]:
+        """
+        Fetch a provider JSON document through a memory + Redis cache.
+
+        Process memory is checked first, then Redis (shared by all workers,
+        so a restarted worker does not call the provider). Once both have
+        expired the document is revalidated with If-None-Match, and a 304
+        reuses the copy already in memory.
+
+        Args:
+            url: Document URL.
+            cache_key: Redis key holding the shared copy.
+
+        Returns:
+            dict: The JSON document.
+        """
+        entry = self._documents.get(url)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[2]
+
+        # One coroutine refreshes a document; concurrent callers wait for it
+        # instead of each fetching the same document from the provider
+        async with self._document_locks.setdefault(url, asyncio.Lock()):
+            now = time.monotonic()
+            entry = self._documents.get(url)
+            if entry is not None and entry[0] > now:
+                return entry[2]
+            return await self._refresh_document(url, cache_key, entry, now)
+
+    async def _refresh_document(
+        self,
+        url: str,
+        cache_key: str,
+        entry: tuple[float, str | None, dict[str, Any]] | None,
+        now: float,
+    ) -> dict[str, Any]:
+        """Reload an expired document from Redis or, failing that, the provider."""
+        cache = RedisCache(redis_client)
+        shared = await cache.get_json(cache_key)
+        if shared is not None:
+            self._documents[url] = (now + OIDC_METADATA_CACHE_TTL, shared["etag"], shared["body"])
+            return shared["body"]
+
+        headers = {}
+        if entry is not None and entry[1]:
+            headers["If-None-Match"] = entry[1]
+
+        response = await self._http.get(url, headers=headers)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            etag, body = entry[1], entry[2]
+        else:
+            response.raise_for_status()
+            etag, body = response.headers.get("ETag"), orjson.loads(response.content)
+
+        self._documents[url] = (now + OIDC_METADATA_CACHE_TTL, etag, body)
+        await cache.set_json(
+            cache_key, {"etag": etag, "body": body}, expire=OIDC_METADATA_CACHE_TTL
+        )
+        return body
+
     async def get_provider_config(self) -> dict[str, Any]:
         """
         Fetch OIDC provider configuration from well-known endpoint.
@@ -50,20 +143,28 @@ class OIDCService:
         Returns:
             dict: Provider configuration.
         """
-        if self._provider_config is not None:
-            return self._provider_config
-
         if not settings.OIDC_ISSUER_URL:
             raise ValueError("OIDC_ISSUER_URL is not configured")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.OIDC_ISSUER_URL}/.well-known/openid-configuration"
-            )
-            response.raise_for_status()
-            self._provider_config = response.json()
+        return await self._get_cached_json(
+            f"{settings.OIDC_ISSUER_URL}/.well-known/openid-configuration",
+            OIDC_CONFIG_CACHE_KEY,
+        )
 
-        return self._provider_config
+    async def get_jwks(self) -> dict[str, Any]:
+        """
+        Fetch the provider's JSON Web Key Set used to sign ID tokens.
+
+        Returns:
+            dict: JWKS document.
+        """
+        config = await self.get_provider_config()
+        jwks_uri = config.get("jwks_uri")
+
+        if not jwks_uri:
+            raise ValueError("JWKS URI not found in provider config")
+
+        return await self._get_cached_json(jwks_uri, OIDC_JWKS_CACHE_KEY)
 
     def get_authorization_url(self, state: str, nonce: str) -> str:
         """
@@ -76,23 +177,11 @@ class OIDCService:
         Returns:
             str: Authorization URL to redirect user to.
         """
-        if not settings.oidc_configured:
+        if self._auth_url_prefix is None:
             raise ValueError("OIDC is not configured")
 
-        params = {
-            "client_id": settings.OIDC_CLIENT_ID,
-            "redirect_uri": settings.OIDC_REDIRECT_URI,
-            "response_type": "code",
-            "scope": "openid email profile",
-            "state": state,
-            "nonce": nonce,
-        }
-
-        # Build authorization URL
-        # This will be replaced with actual URL from provider config
-        auth_endpoint = f"{settings.OIDC_ISSUER_URL}/protocol/openid-connect/auth"
-
-        return f"{auth_endpoint}?{urlencode(params)}"
+        # Only state and nonce vary; the rest is encoded once at startup
+        return f"{self._auth_url_prefix}state={quote_plus(state)}&nonce={quote_plus(nonce)}"
 
     async def exchange_code_for_tokens(
         self, code: str, state: str
@@ -116,19 +205,18 @@ class OIDCService:
         if not token_endpoint:
             raise ValueError("Token endpoint not found in provider config")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                token_endpoint,
-                data={
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "redirect_uri": settings.OIDC_REDIRECT_URI,
-                    "client_id": settings.OIDC_CLIENT_ID,
-                    "client_secret": settings.OIDC_CLIENT_SECRET,
-                },
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.post(
+            token_endpoint,
+            data={
+                "grant_type": "authorization_code",
+                "code": code,
+                "redirect_uri": settings.OIDC_REDIRECT_URI,
+                "client_id": settings.OIDC_CLIENT_ID,
+                "client_secret": settings.OIDC_CLIENT_SECRET,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_user_info(self, access_token: str) -> dict[str, Any]:
         """
@@ -146,20 +234,22 @@ class OIDCService:
         if not userinfo_endpoint:
             raise ValueError("Userinfo endpoint not found in provider config")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                userinfo_endpoint,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._http.get(
+            userinfo_endpoint,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-    def decode_id_token(
+    async def decode_id_token(
         self, id_token: str, nonce: str | None = None
     ) -> dict[str, Any]:
         """
         Decode and validate ID token.
 
+        The signature is verified against the provider's JWKS, and the
+        issuer and audience must match the configured provider and client.
+
         Args:
             id_token: ID token from token exchange.
             nonce: Expected nonce for validation.
@@ -167,9 +257,16 @@ class OIDCService:
         Returns:
             dict: Decoded ID token claims.
         """
-        # In production, you should verify the token signature
-        # using the provider's public keys (JWKS)
-        claims = jwt.decode(id_token, claims_cls=CodeIDToken)
+        jwks = await self.get_jwks()
+        claims = jwt.decode(
+            id_token,
+            key=jwks,
+            claims_cls=CodeIDToken,
+            claims_options={
+                "iss": {"essential": True, "value": settings.OIDC_ISSUER_URL},
+                "aud": {"essential": True, "value": settings.OIDC_CLIENT_ID},
+            },
+        )
 
         # Validate claims
         claims.validate()
@@ -179,12 +276,15 @@ class OIDCService:
 
         return dict(claims)
 
-    def extract_user_info(self, token_response: dict[str, Any]) -> dict[str, Any]:
+    async def extract_user_info(
+        self, token_response: dict[str, Any], nonce: str | None = None
+    ) -> dict[str, Any]:
         """
         Extract user information from token response.
 
         Args:
             token_response: Response from token exchange.
+            nonce: Expected nonce for ID token validation.
 
         Returns:
             dict: Extracted user information.
@@ -194,23 +294,7 @@ class OIDCService:
         if not id_token:
             raise ValueError("No ID token in response")
 
-        # Decode ID token (without full validation for now)
-        # In production, implement proper JWT validation
-        import base64
-        import json
-
-        # Split token and decode payload
-        parts = id_token.split(".")
-        if len(parts) != 3:
-            raise ValueError("Invalid ID token format")
-
-        # Decode payload (add padding if needed)
-        payload = parts[1]
-        padding = 4 - len(payload) % 4
-        if padding != 4:
-            payload += "=" * padding
-
-        claims = json.loads(base64.urlsafe_b64decode(payload))
+        claims = await self.decode_id_token(id_token, nonce=nonce)
 
         return {
             "sub": claims.get("sub"),
@@ -224,5 +308,10 @@ class OIDCService:
         }
 
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
+
+
 # Global OIDC service instance
 oidc_service = OIDCService()
@@ -1,29 +1,71 @@
 """Password reset service for handling password recovery."""
 
+import hashlib
+import hmac
 import secrets
-from datetime import datetime, timedelta, timezone
+import time
 from uuid import UUID
 
+from app.config import settings
 from app.core.redis import RedisCache, redis_client
 
 # Password reset token configuration
 RESET_TOKEN_LENGTH = 32
 RESET_TOKEN_EXPIRE_MINUTES = 30
+RESET_TOKEN_EXPIRE_SECONDS = RESET_TOKEN_EXPIRE_MINUTES * 60
 
+# Hex characters of the HMAC kept in the token signature
+RESET_TOKEN_SIGNATURE_LENGTH = 16
 
-def generate_reset_token() -> str:
+# Shared wrapper around the global Redis client
+_cache = RedisCache(redis_client)
+
+
+def _sign(message: str) -> str:
+    """Compute the truncated HMAC-SHA256 signature of a token body."""
+    digest = hmac.new(settings.JWT_SECRET.encode(), message.encode(), hashlib.sha256)
+    return digest.hexdigest()[:RESET_TOKEN_SIGNATURE_LENGTH]
+
+
+def generate_reset_token(user_id: UUID) -> str:
     """
     Generate a secure password reset token.
 
+    The token has the form ``{user_id.hex}.{random}.{signature}``: it names
+    its user, so it can be checked against the single per-user Redis key,
+    and the signature rejects forged tokens without touching Redis.
+
+    Args:
+        user_id: User's UUID.
+
     Returns:
-        str: URL-safe random token.
+        str: URL-safe signed token.
     """
-    return secrets.token_urlsafe(RESET_TOKEN_LENGTH)
+    body = f"{user_id.hex}.{secrets.token_urlsafe(RESET_TOKEN_LENGTH)}"
+    return f"{body}.{_sign(body)}"
 
 
-def _get_reset_token_key(token: str) -> str:
-    """Get Redis key for password reset token."""
-    return f"password_reset:{token}"
+def parse_reset_token(token: str) -> UUID | None:
+    """
+    Check a reset token's signature and return the user it was issued to.
+
+    Args:
+        token: Password reset token.
+
+    Returns:
+        UUID: User ID if the token is well-formed and correctly signed,
+        None otherwise.
+    """
+    body, _, signature = token.rpartition(".")
+    user_hex, _, random_part = body.partition(".")
+    # Compare as bytes: compare_digest rejects non-ASCII str arguments
+    if not random_part or not hmac.compare_digest(signature.encode(), _sign(body).encode()):
+        return None
+
+    try:
+        return UUID(hex=user_hex)
+    except ValueError:
+        return None
 
 
 def _get_user_reset_key(user_id: UUID) -> str:
@@ -35,7 +77,8 @@ async def create_password_reset_token(user_id: UUID, email: str) -> str:
     """
     Create a password reset token for a user.
 
-    Invalidates any existing reset token for the user.
+    Invalidates any existing reset token for the user: the per-user key is
+    overwritten, so a single SET replaces the previous token.
 
     Args:
         user_id: User's UUID.
@@ -44,27 +87,16 @@ async def create_password_reset_token(user_id: UUID, email: str) -> str:
     Returns:
         str: Password reset token.
     """
-    cache = RedisCache(redis_client)
-    expire_seconds = RESET_TOKEN_EXPIRE_MINUTES * 60
-
-    # Invalidate any existing token for this user
-    existing_token = await cache.get(_get_user_reset_key(user_id))
-    if existing_token:
-        await cache.delete(_get_reset_token_key(existing_token))
-
-    # Generate new token
-    token = generate_reset_token()
-
-    # Store token -> user mapping
+    token = generate_reset_token(user_id)
     token_data = {
-        "user_id": str(user_id),
+        "token": token,
+        "user_id": user_id,
         "email": email,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": int(time.time()),
     }
-    await cache.set_json(_get_reset_token_key(token), token_data, expire=expire_seconds)
-
-    # Store user -> token mapping (for invalidation)
-    await cache.set(_get_user_reset_key(user_id), token, expire=expire_seconds)
+    await _cache.set_json(
+        _get_user_reset_key(user_id), token_data, expire=RESET_TOKEN_EXPIRE_SECONDS
+    )
 
     return token
 
@@ -79,10 +111,16 @@ async def verify_password_reset_token(token: str) -> dict | None:
     Returns:
         dict: Token data (user_id, email) if valid, None otherwise.
     """
-    cache = RedisCache(redis_client)
-    token_data = await cache.get_json(_get_reset_token_key(token))
+    user_id = parse_reset_token(token)
+    if user_id is None:
+        return None
+
+    token_data = await _cache.get_json(_get_user_reset_key(user_id))
 
-    if token_data is None:
+    # Only the user's most recent token is valid
+    if token_data is None or not hmac.compare_digest(
+        token_data.get("token", "").encode(), token.encode()
+    ):
         return None
 
     return token_data
@@ -99,13 +137,7 @@ async def invalidate_password_reset_token(token: str, user_id: UUID) -> bool:
     Returns:
         bool: True if invalidated successfully.
     """
-    cache = RedisCache(redis_client)
-
-    # Delete both keys
-    await cache.delete(_get_reset_token_key(token))
-    await cache.delete(_get_user_reset_key(user_id))
-
-    return True
+    return await _cache.delete(_get_user_reset_key(user_id))
 
 
 async def get_reset_token_ttl(token: str) -> int:
@@ -118,5 +150,8 @@ async def get_reset_token_ttl(token: str) -> int:
     Returns:
         int: TTL in seconds, -1 if token doesn't exist.
     """
-    cache = RedisCache(redis_client)
-    return await cache.ttl(_get_reset_token_key(token))
+    user_id = parse_reset_token(token)
+    if user_id is None:
+        return -1
+
+    return await _cache.ttl(_get_user_reset_key(user_id))
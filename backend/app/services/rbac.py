@@ -1,16 +1,31 @@
 """RBAC (Role-Based Access Control) service for permission checking."""
 
-import json
+from collections.abc import Iterable
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import any_, delete, func, inspect, literal, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.core.query_cache import PrecompiledQueries
+from app.core.rbac_cache import (
+    RBAC_INVALIDATION_CHANNEL,
+    index_grants,
+    local_user_cache,
+    role_permission_cache,
+)
 from app.core.redis import RedisCache, cache_key, redis_client
+from app.models.audit_log import AuditLog
 from app.models.permission import Permission, PermissionScope
 from app.models.role import Role
 from app.models.user import User
+from app.models.user_permission_mv import UserPermissionMV
+from app.models.user_role import UserRole
+from app.services.audit import AuditService
 
 # Cache TTL for permissions (5 minutes)
 PERMISSIONS_CACHE_TTL = 300
@@ -22,6 +37,10 @@ class RBACService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.cache = RedisCache(redis_client)
+        # Per-request permission indexes, keyed by user ID
+        self._permission_indexes: dict[UUID, dict[int, int]] = {}
+        # Per-request cache reads (entries, revisions), keyed by user ID
+        self._prefetched: dict[UUID, tuple[dict[str, Any], list[int] | None]] = {}
 
     def _user_permissions_cache_key(self, user_id: UUID) -> str:
         """Generate cache key for user permissions."""
@@ -31,22 +50,206 @@ class RBACService:
         """Generate cache key for user roles."""
         return cache_key("rbac", "roles", str(user_id))
 
+    def _user_role_names_key(self, user_id: UUID) -> str:
+        """Generate key of the user's role name set (kept in process only)."""
+        return cache_key("rbac", "rolenames", str(user_id))
+
+    def _user_revision_key(self, user_id: UUID) -> str:
+        """Generate key of the user's cache generation counter."""
+        return cache_key("rbac", "userrev", str(user_id))
+
+    def _role_revision_key(self, role_id: int) -> str:
+        """Generate key of the role's cache generation counter."""
+        return cache_key("rbac", "rolerev", str(role_id))
+
+    def _revision_keys(self, user_id: UUID, role_ids: Iterable[int]) -> list[str]:
+        """Get the generation counters a user's cached entries depend on."""
+        return [
+            self._user_revision_key(user_id),
+            *(self._role_revision_key(role_id) for role_id in sorted(role_ids)),
+        ]
+
+    async def _prefetch(self, user: User) -> tuple[dict[str, Any], list[int] | None]:
+        """
+        Fetch the user's cached permissions and roles in one round trip.
+
+        Entries come from the worker's local cache when fresh, otherwise
+        both entries and their generation counters come back in a single
+        MGET. An entry stamped with other revisions than the current ones
+        is stale and left out. The result is kept for the rest of the
+        request.
+
+        The cache is bypassed when the user's role_ids are not loaded: the
+        role revisions cannot be named.
+
+        Returns:
+            Tuple of (valid cached data by key, current revisions to stamp
+            on write)
+        """
+        prefetched = self._prefetched.get(user.id)
+        if prefetched is not None:
+            return prefetched
+
+        entries: dict[str, Any] = {}
+        revisions = None
+        role_ids = inspect(user).dict.get("role_ids")
+        if role_ids is not None:
+            prefetched = local_user_cache.get(user.id, role_ids)
+            if prefetched is not None:
+                self._prefetched[user.id] = prefetched
+                return prefetched
+
+            data_keys = [
+                self._user_permissions_cache_key(user.id),
+                self._user_roles_cache_key(user.id),
+            ]
+            revision_keys = self._revision_keys(user.id, role_ids)
+            try:
+                values = await self.cache.client.mget([*data_keys, *revision_keys])
+                data_values = values[: len(data_keys)]
+                revisions = [int(value or 0) for value in values[len(data_keys) :]]
+                # A short reply raises here and the cache is bypassed
+                for key, raw in zip(data_keys, data_values, strict=True):
+                    entry = orjson.loads(raw) if raw is not None else None
+                    if isinstance(entry, dict) and entry.get("revs") == revisions:
+                        entries[key] = entry["data"]
+            except Exception:
+                entries, revisions = {}, None
+            else:
+                # Entries filled from the database later land here too
+                local_user_cache.set(user.id, role_ids, entries, revisions)
+
+        self._prefetched[user.id] = (entries, revisions)
+        return entries, revisions
+
+    async def _write_cached(
+        self, data_by_key: dict[str, Any], revisions: list[int] | None
+    ) -> None:
+        """Cache entries stamped with the revisions they were built under, in one round trip."""
+        if revisions is None:
+            return
+        pipe = self.cache.pipeline(transaction=False)
+        for key, data in data_by_key.items():
+            pipe.set(
+                key,
+                orjson.dumps({"revs": revisions, "data": data}),
+                ex=PERMISSIONS_CACHE_TTL,
+            )
+        try:
+            await pipe.execute()
+        except Exception:
+            pass
+
     async def invalidate_user_cache(self, user_id: UUID) -> None:
         """Invalidate user's permission and role cache."""
-        await self.cache.delete(self._user_permissions_cache_key(user_id))
-        await self.cache.delete(self._user_roles_cache_key(user_id))
+        await self.bulk_invalidate_users([user_id])
+
+    async def bulk_invalidate_users(self, user_ids: Iterable[UUID]) -> None:
+        """
+        Invalidate the permission and role cache of several users at once.
 
-    async def invalidate_role_cache(self, role_id: UUID) -> None:
-        """Invalidate cache for all users with a specific role."""
-        # Get all users with this role
+        Every user's revision bump and invalidation message is queued on one
+        pipeline, so bulk role changes cost a single Redis round trip
+        instead of two per user.
+        """
+        pipe = self.cache.pipeline(transaction=False)
+        for user_id in user_ids:
+            self._permission_indexes.pop(user_id, None)
+            self._prefetched.pop(user_id, None)
+            local_user_cache.evict_user(user_id)
+            pipe.incrby(self._user_revision_key(user_id), 1)
+            pipe.publish(RBAC_INVALIDATION_CHANNEL, f"user:{user_id}")
+        try:
+            await pipe.execute()
+        except Exception:
+            pass
+
+    async def invalidate_role_cache(self, role_id: int) -> None:
+        """
+        Invalidate cache for all users with a specific role.
+
+        Bumps the role's generation counter: every cached entry built with
+        the old revision stops matching, with no per-user lookups or deletes.
+        Other workers drop their local copies on the published message.
+        """
+        self._permission_indexes.clear()
+        self._prefetched.clear()
+        local_user_cache.evict_role(role_id)
+        role_permission_cache.invalidate()
+        await self.cache.increment(self._role_revision_key(role_id))
+        await self.cache.publish(RBAC_INVALIDATION_CHANNEL, f"role:{role_id}")
+
+    async def _load_user_rbac(self, user: User) -> dict[str, Any]:
+        """
+        Load a user's roles and permissions from the database in one query.
+
+        Both cache entries are filled from the same round trip, so a cold
+        request that needs roles and permissions runs one query instead of
+        two. Each list is aggregated into JSON by a correlated subquery:
+        roles through users.role_ids, permissions with one index lookup on
+        user_permissions_mv (SELECT DISTINCT, so no dedup is needed here).
+
+        Returns:
+            Cached data by key for the roles and permissions entries
+        """
+        entries, revisions = await self._prefetch(user)
+
+        roles_json = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        func.jsonb_build_object(
+                            "id",
+                            Role.id,
+                            "name",
+                            Role.name,
+                            "description",
+                            Role.description,
+                            "is_system",
+                            Role.is_system,
+                        )
+                    ),
+                    literal([], JSONB),
+                    type_=JSONB,
+                )
+            )
+            .where(Role.id == any_(User.role_ids))
+            .scalar_subquery()
+        )
+        permissions_json = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        func.jsonb_build_object(
+                            "id",
+                            UserPermissionMV.permission_id,
+                            "resource",
+                            UserPermissionMV.resource,
+                            "action",
+                            UserPermissionMV.action,
+                            "scope",
+                            UserPermissionMV.scope,
+                        )
+                    ),
+                    literal([], JSONB),
+                    type_=JSONB,
+                )
+            )
+            .where(UserPermissionMV.user_id == User.id)
+            .scalar_subquery()
+        )
         result = await self.db.execute(
-            select(User)
-            .join(User.roles)
-            .where(Role.id == role_id)
+            select(roles_json, permissions_json).where(User.id == user.id)
         )
-        users = result.scalars().all()
-        for user in users:
-            await self.invalidate_user_cache(user.id)
+        roles, permissions = result.one_or_none() or ([], [])
+
+        loaded = {
+            self._user_permissions_cache_key(user.id): permissions,
+            self._user_roles_cache_key(user.id): roles,
+        }
+        entries.update(loaded)
+        await self._write_cached(loaded, revisions)
+        return loaded
 
     async def get_user_permissions(self, user: User) -> list[dict]:
         """
@@ -58,49 +261,12 @@ class RBACService:
         Returns:
             List of permission dictionaries with resource, action, scope
         """
-        # Try cache first
         cache_key_str = self._user_permissions_cache_key(user.id)
-        cached = await self.cache.get_json(cache_key_str)
+        entries, _ = await self._prefetch(user)
+        cached = entries.get(cache_key_str)
         if cached is not None:
             return cached
-
-        # Get from database - load user with roles and permissions
-        result = await self.db.execute(
-            select(User)
-            .options(
-                selectinload(User.roles).selectinload(Role.permissions)
-            )
-            .where(User.id == user.id)
-        )
-        user_with_roles = result.scalar_one_or_none()
-
-        if not user_with_roles:
-            return []
-
-        # Collect all unique permissions
-        permissions_set = set()
-        permissions_list = []
-
-        for role in user_with_roles.roles:
-            for perm in role.permissions:
-                perm_key = (perm.resource, perm.action, perm.scope)
-                if perm_key not in permissions_set:
-                    permissions_set.add(perm_key)
-                    permissions_list.append({
-                        "id": str(perm.id),
-                        "resource": perm.resource,
-                        "action": perm.action,
-                        "scope": perm.scope,
-                    })
-
-        # Cache the result
-        await self.cache.set_json(
-            cache_key_str,
-            permissions_list,
-            expire=PERMISSIONS_CACHE_TTL
-        )
-
-        return permissions_list
+        return (await self._load_user_rbac(user))[cache_key_str]
 
     async def get_user_roles(self, user: User) -> list[dict]:
         """
@@ -112,41 +278,40 @@ class RBACService:
         Returns:
             List of role dictionaries with id, name, description
         """
-        # Try cache first
         cache_key_str = self._user_roles_cache_key(user.id)
-        cached = await self.cache.get_json(cache_key_str)
+        entries, _ = await self._prefetch(user)
+        cached = entries.get(cache_key_str)
         if cached is not None:
             return cached
+        return (await self._load_user_rbac(user))[cache_key_str]
 
-        # Get from database
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.roles))
-            .where(User.id == user.id)
-        )
-        user_with_roles = result.scalar_one_or_none()
-
-        if not user_with_roles:
-            return []
-
-        roles_list = [
-            {
-                "id": str(role.id),
-                "name": role.name,
-                "description": role.description,
-                "is_system": role.is_system,
-            }
-            for role in user_with_roles.roles
-        ]
-
-        # Cache the result
-        await self.cache.set_json(
-            cache_key_str,
-            roles_list,
-            expire=PERMISSIONS_CACHE_TTL
-        )
+    async def get_user_role_names(self, user: User) -> frozenset[str]:
+        """
+        Get the names of a user's roles as a set.
 
-        return roles_list
+        The set is built once from the roles entry and stored next to it in
+        the prefetched entries, so it lives as long as the locally cached
+        roles and is never sent to Redis.
+        """
+        names_key = self._user_role_names_key(user.id)
+        entries, _ = await self._prefetch(user)
+        names = entries.get(names_key)
+        if names is None:
+            roles = await self.get_user_roles(user)
+            names = frozenset(role["name"] for role in roles)
+            entries[names_key] = names
+        return names
+
+    async def _get_permission_index(self, user: User) -> dict[int, int]:
+        """Get the user's permission index, built once per request."""
+        index = self._permission_indexes.get(user.id)
+        if index is None:
+            roles = await self.get_user_roles(user)
+            index = await role_permission_cache.get_index(
+                self.db, [role["id"] for role in roles]
+            )
+            self._permission_indexes[user.id] = index
+        return index
 
     async def has_permission(
         self,
@@ -167,29 +332,29 @@ class RBACService:
         Returns:
             True if user has the permission, False otherwise
         """
-        permissions = await self.get_user_permissions(user)
-
-        # Define scope hierarchy (higher scope includes lower)
-        scope_hierarchy = {
-            PermissionScope.OWN.value: 0,
-            PermissionScope.TEAM.value: 1,
-            PermissionScope.ALL.value: 2,
-        }
+        index = await self._get_permission_index(user)
+        return index_grants(index, resource, action, required_scope)
 
-        required_scope_level = scope_hierarchy.get(required_scope, 0)
-
-        for perm in permissions:
-            # Check for exact match or wildcard
-            resource_match = perm["resource"] == resource or perm["resource"] == "*"
-            action_match = perm["action"] == action or perm["action"] == "*"
+    async def check_permissions_bulk(
+        self,
+        user: User,
+        checks: list[tuple[str, str, str]],
+    ) -> list[bool]:
+        """
+        Evaluate many permission checks against one permission lookup.
 
-            if resource_match and action_match:
-                # Check scope hierarchy
-                perm_scope_level = scope_hierarchy.get(perm["scope"], 0)
-                if perm_scope_level >= required_scope_level:
-                    return True
+        Args:
+            user: User object
+            checks: List of (resource, action, scope) tuples
 
-        return False
+        Returns:
+            One result per check, in the same order
+        """
+        index = await self._get_permission_index(user)
+        return [
+            index_grants(index, resource, action, scope)
+            for resource, action, scope in checks
+        ]
 
     async def has_any_permission(
         self,
@@ -206,10 +371,7 @@ class RBACService:
         Returns:
             True if user has at least one permission, False otherwise
         """
-        for resource, action, scope in permissions:
-            if await self.has_permission(user, resource, action, scope):
-                return True
-        return False
+        return any(await self.check_permissions_bulk(user, permissions))
 
     async def has_all_permissions(
         self,
@@ -226,10 +388,7 @@ class RBACService:
         Returns:
             True if user has all permissions, False otherwise
         """
-        for resource, action, scope in permissions:
-            if not await self.has_permission(user, resource, action, scope):
-                return False
-        return True
+        return all(await self.check_permissions_bulk(user, permissions))
 
     async def has_role(self, user: User, role_name: str) -> bool:
         """
@@ -242,8 +401,7 @@ class RBACService:
         Returns:
             True if user has the role, False otherwise
         """
-        roles = await self.get_user_roles(user)
-        return any(role["name"] == role_name for role in roles)
+        return role_name in await self.get_user_role_names(user)
 
     async def has_any_role(self, user: User, role_names: list[str]) -> bool:
         """
@@ -256,9 +414,7 @@ class RBACService:
         Returns:
             True if user has at least one role, False otherwise
         """
-        roles = await self.get_user_roles(user)
-        user_role_names = {role["name"] for role in roles}
-        return bool(user_role_names.intersection(role_names))
+        return not (await self.get_user_role_names(user)).isdisjoint(role_names)
 
     async def is_super_admin(self, user: User) -> bool:
         """Check if user is a Super Admin."""
@@ -270,23 +426,17 @@ class RBACService:
 
 
 # Role CRUD operations
-async def get_role_by_id(db: AsyncSession, role_id: UUID) -> Role | None:
+async def get_role_by_id(db: AsyncSession, role_id: int) -> Role | None:
     """Get role by ID."""
     result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.id == role_id)
+        select(Role).options(selectinload(Role.permissions)).where(Role.id == role_id)
     )
     return result.scalar_one_or_none()
 
 
 async def get_role_by_name(db: AsyncSession, name: str) -> Role | None:
     """Get role by name."""
-    result = await db.execute(
-        select(Role)
-        .options(selectinload(Role.permissions))
-        .where(Role.name == name)
-    )
+    result = await db.execute(PrecompiledQueries.role_by_name, {"name": name})
     return result.scalar_one_or_none()
 
 
@@ -294,7 +444,7 @@ async def get_all_roles(db: AsyncSession) -> list[Role]:
     """Get all roles."""
     result = await db.execute(
         select(Role)
-        .options(selectinload(Role.permissions))
+        .options(selectinload(Role.permissions), raiseload("*"))
         .order_by(Role.name)
     )
     return list(result.scalars().all())
@@ -338,15 +488,16 @@ async def delete_role(db: AsyncSession, role: Role) -> bool:
         return False
     await db.delete(role)
     await db.flush()
+    role_permission_cache.invalidate()
     return True
 
 
 # Permission CRUD operations
-async def get_permission_by_id(db: AsyncSession, permission_id: UUID) -> Permission | None:
+async def get_permission_by_id(
+    db: AsyncSession, permission_id: int
+) -> Permission | None:
     """Get permission by ID."""
-    result = await db.execute(
-        select(Permission).where(Permission.id == permission_id)
-    )
+    result = await db.execute(select(Permission).where(Permission.id == permission_id))
     return result.scalar_one_or_none()
 
 
@@ -358,11 +509,8 @@ async def get_permission(
 ) -> Permission | None:
     """Get permission by resource, action, and scope."""
     result = await db.execute(
-        select(Permission).where(
-            Permission.resource == resource,
-            Permission.action == action,
-            Permission.scope == scope,
-        )
+        PrecompiledQueries.permission_by_triple,
+        {"resource": resource, "action": action, "scope": scope},
     )
     return result.scalar_one_or_none()
 
@@ -403,6 +551,7 @@ async def assign_permission_to_role(
     if permission not in role.permissions:
         role.permissions.append(permission)
         await db.flush()
+        role_permission_cache.invalidate()
 
 
 async def remove_permission_from_role(
@@ -414,6 +563,7 @@ async def remove_permission_from_role(
     if permission in role.permissions:
         role.permissions.remove(permission)
         await db.flush()
+        role_permission_cache.invalidate()
 
 
 # User-Role operations
@@ -421,17 +571,73 @@ async def assign_role_to_user(
     db: AsyncSession,
     user: User,
     role: Role,
-    assigned_by: UUID | None = None,
 ) -> None:
-    """Assign a role to a user."""
+    """
+    Assign a role to a user.
+
+    Who assigned the role and when is recorded by the caller's
+    AuditService.log_role_assigned entry in the same transaction.
+    """
     if role not in user.roles:
-        user.roles.append(role)
+        # User.roles is view-only; write the association row directly
+        db.add(UserRole(user_id=user.id, role_id=role.id))
         await db.flush()
         # Invalidate cache
         rbac = RBACService(db)
         await rbac.invalidate_user_cache(user.id)
 
 
+async def assign_role_to_users(
+    db: AsyncSession,
+    role: Role,
+    user_ids: list[UUID],
+    assigned_by: UUID,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+) -> list[UUID]:
+    """
+    Assign a role to users and audit each assignment in one statement.
+
+    The user_roles insert runs in a data-modifying CTE whose RETURNING rows
+    feed the audit_logs insert, so both writes share one round trip.
+    Unknown users and existing assignments are skipped.
+
+    Args:
+        db: Database session
+        role: Role to assign
+        user_ids: IDs of the users to receive the role
+        assigned_by: ID of the user performing the assignment
+        ip_address: IP address of the requester
+        user_agent: User agent string
+
+    Returns:
+        IDs of the users that received the role
+    """
+    assigned = (
+        pg_insert(UserRole)
+        .from_select(
+            ["user_id", "role_id"],
+            select(User.id, literal(role.id, UserRole.role_id.type)).where(
+                User.id == any_(user_ids)
+            ),
+        )
+        .on_conflict_do_nothing()
+        .returning(UserRole.user_id)
+        .cte("assigned")
+    )
+    result = await db.execute(
+        AuditService.role_assigned_from(
+            assigned, assigned_by, role.id, ip_address, user_agent
+        )
+        .add_cte(assigned)
+        .returning(AuditLog.target_user_id)
+    )
+    assigned_user_ids = list(result.scalars().all())
+
+    await RBACService(db).bulk_invalidate_users(assigned_user_ids)
+    return assigned_user_ids
+
+
 async def remove_role_from_user(
     db: AsyncSession,
     user: User,
@@ -439,18 +645,18 @@ async def remove_role_from_user(
 ) -> None:
     """Remove a role from a user."""
     if role in user.roles:
-        user.roles.remove(role)
-        await db.flush()
+        await db.execute(
+            delete(UserRole).where(
+                UserRole.user_id == user.id,
+                UserRole.role_id == role.id,
+            )
+        )
         # Invalidate cache
         rbac = RBACService(db)
         await rbac.invalidate_user_cache(user.id)
 
 
-async def get_users_with_role(db: AsyncSession, role_id: UUID) -> list[User]:
+async def get_users_with_role(db: AsyncSession, role_id: int) -> list[User]:
     """Get all users with a specific role."""
-    result = await db.execute(
-        select(User)
-        .join(User.roles)
-        .where(Role.id == role_id)
-    )
+    result = await db.execute(select(User).join(User.roles).where(Role.id == role_id))
     return list(result.scalars().all())
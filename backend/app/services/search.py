@@ -1,13 +1,142 @@
 """Full-text search service for documents."""
 
+import re
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, literal_column, select, text
+from sqlalchemy import (
+    Integer,
+    Select,
+    Text,
+    and_,
+    bindparam,
+    func,
+    literal_column,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
 
-from app.models.document import Document
-from app.schemas.search import SearchFilters, SearchMode
+from app.config import settings
+from app.models.document import TRIGRAM_TEXT_EXPRESSION, Document
+from app.schemas.search import SearchFilters, SearchHighlight, SearchMode
+from app.services.document import OWNER_BRIEF_OPTION
+
+# LIKE wildcards and the escape character itself
+LIKE_ESCAPE_RE = re.compile(r"[\\%_]")
+
+# Number of rows matching the WHERE clause, repeated on every result row
+TOTAL_MATCHES = func.count().over().label("total")
+
+
+# Full-text search filters on bound parameters named after SearchFilters fields
+_BOUND_FILTERS = {
+    "owner_id": Document.owner_id == bindparam("owner_id"),
+    "date_from": Document.created_at >= bindparam("date_from"),
+    "date_to": Document.created_at <= bindparam("date_to"),
+    "meta_filters": Document.meta.contains(bindparam("meta_filters")),
+}
+
+
+def _filter_params(filters: SearchFilters | None) -> dict[str, Any]:
+    """Collect the bound parameter values of the filters that are set."""
+    if filters is None:
+        return {}
+    return {
+        name: value
+        for name in _BOUND_FILTERS
+        if (value := getattr(filters, name)) is not None
+    }
+
+
+@cache
+def _fts_statements(
+    tsquery_function: str, filter_names: tuple[str, ...]
+) -> tuple[Select, Select]:
+    """
+    Build the full-text page and count statements for one query shape.
+
+    Everything that varies per request is a bound parameter (query, offset,
+    limit, filter values), so each combination of tsquery function and
+    active filters is built once and SQLAlchemy compiles it once.
+
+    Args:
+        tsquery_function: websearch_to_tsquery, phraseto_tsquery or to_tsquery
+        filter_names: Active filters (keys of _BOUND_FILTERS)
+
+    Returns:
+        Tuple of (page statement, count statement)
+    """
+    tsquery = getattr(func, tsquery_function)("english", bindparam("query", type_=Text))
+    search_condition = Document.search_vector.op("@@")(tsquery)
+    filter_conditions = [_BOUND_FILTERS[name] for name in filter_names]
+
+    rank = func.ts_rank(Document.search_vector, tsquery).label("rank")
+
+    # Rank and page the matches first; the window count is computed
+    # before OFFSET/LIMIT, so it carries the total number of matches
+    ranked_columns = [Document.id, rank, TOTAL_MATCHES]
+    if settings.SEARCH_USE_RUM:
+        # RUM distance operator returns rows pre-ranked from the index
+        distance = Document.search_vector.op("<=>")(tsquery).label("distance")
+        ranked_columns.append(distance)
+        order_by = distance.asc()
+    else:
+        order_by = rank.desc()
+
+    ranked = (
+        select(*ranked_columns)
+        .where(search_condition, *filter_conditions)
+        .order_by(order_by)
+        .offset(bindparam("offset", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+        .cte("ranked")
+    )
+
+    # Highlight only the rows of the returned page: ts_headline is the
+    # most expensive part of the query
+    title_headline = func.ts_headline(
+        "english",
+        Document.title,
+        tsquery,
+        "StartSel=<b>, StopSel=</b>, MaxWords=50, MinWords=10",
+    ).label("title_highlight")
+    content_headline = func.ts_headline(
+        "english",
+        func.coalesce(Document.content, ""),
+        tsquery,
+        "StartSel=<b>, StopSel=</b>, MaxWords=50, MinWords=10, MaxFragments=3",
+    ).label("content_highlight")
+
+    page_query = (
+        select(
+            Document,
+            ranked.c.rank,
+            title_headline,
+            content_headline,
+            ranked.c.total,
+        )
+        .join(ranked, Document.id == ranked.c.id)
+        .options(OWNER_BRIEF_OPTION, raiseload("*"))
+        .order_by(
+            ranked.c.distance.asc() if settings.SEARCH_USE_RUM else ranked.c.rank.desc()
+        )
+    )
+    count_query = select(func.count(Document.id)).where(
+        search_condition, *filter_conditions
+    )
+    return page_query, count_query
+
+
+@dataclass(slots=True, frozen=True)
+class SearchHit:
+    """One ranked search result handed from SearchService to the API layer."""
+
+    document: Document
+    rank: float
+    highlights: list[SearchHighlight]
 
 
 class SearchService:
@@ -23,7 +152,7 @@ class SearchService:
         filters: SearchFilters | None = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchHit], int]:
         """
         Search documents with various modes.
 
@@ -51,23 +180,23 @@ class SearchService:
     def _build_filter_conditions(self, filters: SearchFilters | None) -> list:
         """Build SQLAlchemy filter conditions from SearchFilters."""
         conditions = []
-        
+
         if filters is None:
             return conditions
-        
+
         if filters.owner_id is not None:
             conditions.append(Document.owner_id == filters.owner_id)
-        
+
         if filters.date_from is not None:
             conditions.append(Document.created_at >= filters.date_from)
-        
+
         if filters.date_to is not None:
             conditions.append(Document.created_at <= filters.date_to)
-        
+
         if filters.meta_filters is not None:
             # JSONB contains operator
             conditions.append(Document.meta.contains(filters.meta_filters))
-        
+
         return conditions
 
     async def _search_simple(
@@ -76,15 +205,14 @@ class SearchService:
         filters: SearchFilters | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchHit], int]:
         """
-        Simple search using plainto_tsquery.
-        Converts query to tsquery automatically, handling spaces as AND.
+        Simple search using websearch_to_tsquery.
+        Handles spaces as AND and accepts quoted phrases, "or" and "-word"
+        without ever raising a syntax error.
         """
-        tsquery = func.plainto_tsquery("english", query)
-        
         return await self._execute_fts_search(
-            tsquery, query, filters, page, page_size
+            "websearch_to_tsquery", query, filters, page, page_size
         )
 
     async def _search_phrase(
@@ -93,15 +221,13 @@ class SearchService:
         filters: SearchFilters | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchHit], int]:
         """
         Phrase search using phraseto_tsquery.
         Matches exact phrase order.
         """
-        tsquery = func.phraseto_tsquery("english", query)
-        
         return await self._execute_fts_search(
-            tsquery, query, filters, page, page_size
+            "phraseto_tsquery", query, filters, page, page_size
         )
 
     async def _search_boolean(
@@ -110,91 +236,38 @@ class SearchService:
         filters: SearchFilters | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchHit], int]:
         """
         Boolean search using to_tsquery.
         Supports AND (&), OR (|), NOT (!), and grouping.
         """
         # Sanitize query for to_tsquery (basic sanitization)
         # User should use proper boolean syntax: word1 & word2 | word3
-        tsquery = func.to_tsquery("english", query)
-        
         return await self._execute_fts_search(
-            tsquery, query, filters, page, page_size
+            "to_tsquery", query, filters, page, page_size
         )
 
     async def _execute_fts_search(
         self,
-        tsquery,
-        original_query: str,
+        tsquery_function: str,
+        query: str,
         filters: SearchFilters | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchHit], int]:
         """Execute full-text search with ranking and highlighting."""
-        # Build filter conditions
-        filter_conditions = self._build_filter_conditions(filters)
-        
-        # Rank calculation
-        rank = func.ts_rank(Document.search_vector, tsquery).label("rank")
-        
-        # Title highlight
-        title_headline = func.ts_headline(
-            "english",
-            Document.title,
-            tsquery,
-            "StartSel=<b>, StopSel=</b>, MaxWords=50, MinWords=10"
-        ).label("title_highlight")
-        
-        # Content highlight
-        content_headline = func.ts_headline(
-            "english",
-            func.coalesce(Document.content, ""),
-            tsquery,
-            "StartSel=<b>, StopSel=</b>, MaxWords=50, MinWords=10, MaxFragments=3"
-        ).label("content_highlight")
-        
-        # Main search query
-        search_condition = Document.search_vector.op("@@")(tsquery)
-        
-        # Count query
-        count_query = (
-            select(func.count(Document.id))
-            .where(search_condition)
+        filter_params = _filter_params(filters)
+        page_query, count_query = _fts_statements(
+            tsquery_function, tuple(filter_params)
         )
-        if filter_conditions:
-            count_query = count_query.where(and_(*filter_conditions))
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Main query with pagination
+
         offset = (page - 1) * page_size
-        
-        main_query = (
-            select(
-                Document,
-                rank,
-                title_headline,
-                content_headline,
-            )
-            .options(selectinload(Document.owner))
-            .where(search_condition)
-        )
-        
-        if filter_conditions:
-            main_query = main_query.where(and_(*filter_conditions))
-        
-        main_query = (
-            main_query
-            .order_by(rank.desc())
-            .offset(offset)
-            .limit(page_size)
-        )
-        
-        result = await self.db.execute(main_query)
+        params = {"query": query, "offset": offset, "limit": page_size, **filter_params}
+
+        result = await self.db.execute(page_query, params)
         rows = result.all()
-        
+        total = await self._page_total(rows, offset, count_query, params)
+
         # Build results with highlights
         results = []
         for row in rows:
@@ -202,124 +275,167 @@ class SearchService:
             rank_value = row[1]
             title_hl = row[2]
             content_hl = row[3]
-            
+
             highlights = []
             if title_hl and "<b>" in title_hl:
-                highlights.append({
-                    "field": "title",
-                    "fragment": title_hl,
-                })
+                highlights.append(
+                    {
+                        "field": "title",
+                        "fragment": title_hl,
+                    }
+                )
             if content_hl and "<b>" in content_hl:
-                highlights.append({
-                    "field": "content",
-                    "fragment": content_hl,
-                })
-            
-            results.append({
-                "document": document,
-                "rank": float(rank_value) if rank_value else 0.0,
-                "highlights": highlights,
-            })
-        
+                highlights.append(
+                    {
+                        "field": "content",
+                        "fragment": content_hl,
+                    }
+                )
+
+            results.append(
+                SearchHit(
+                    document=document,
+                    rank=float(rank_value) if rank_value else 0.0,
+                    highlights=highlights,
+                )
+            )
+
         return results, total
 
+    async def _page_total(
+        self,
+        rows: list,
+        offset: int,
+        count_query: Select,
+        params: dict[str, Any] | None = None,
+    ) -> int:
+        """
+        Read the total match count carried by a page of results.
+
+        Only a page past the last match has no row to read it from; that
+        case alone falls back to the COUNT query.
+        """
+        if rows:
+            return rows[0].total
+        if not offset:
+            return 0
+        return (await self.db.execute(count_query, params)).scalar() or 0
+
     async def _search_fuzzy(
         self,
         query: str,
         filters: SearchFilters | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[dict], int]:
+    ) -> tuple[list[SearchHit], int]:
         """
         Fuzzy search using pg_trgm similarity.
         Good for typo tolerance and OCR errors.
         """
-        # Similarity threshold
-        similarity_threshold = 0.3
-        
+        # Same threshold the %> operator filters with (see app.core.database)
+        similarity_threshold = settings.SEARCH_FUZZY_THRESHOLD
+
         # Build filter conditions
         filter_conditions = self._build_filter_conditions(filters)
-        
+
         # Similarity scores
         title_similarity = func.similarity(Document.title, query).label("title_sim")
         content_similarity = func.similarity(
             func.coalesce(Document.content, ""), query
         ).label("content_sim")
-        
+
+        # Per-field match strength on the scale the %> operator filters with,
+        # so every highlighted field is one that actually matched
+        title_word_similarity = func.word_similarity(query, Document.title).label(
+            "title_word_sim"
+        )
+        content_word_similarity = func.word_similarity(
+            query, func.coalesce(Document.content, "")
+        ).label("content_word_sim")
+
         # Combined similarity (weighted: title more important)
-        combined_similarity = (
-            title_similarity * 2 + content_similarity
-        ).label("combined_sim")
-        
-        # Search condition: either title or content has similarity above threshold
-        search_condition = (
-            (func.similarity(Document.title, query) > similarity_threshold) |
-            (func.similarity(func.coalesce(Document.content, ""), query) > similarity_threshold)
+        combined_similarity = (title_similarity * 2 + content_similarity).label(
+            "combined_sim"
         )
-        
-        # Count query
-        count_query = select(func.count(Document.id)).where(search_condition)
-        if filter_conditions:
-            count_query = count_query.where(and_(*filter_conditions))
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-        
-        # Main query
+
+        # Search condition: some extent of title + content is similar to the
+        # query (pg_trgm.word_similarity_threshold, set per connection). A
+        # single operator on the indexed expression is answered by one
+        # idx_documents_title_content_trgm bitmap scan; the functions above
+        # only score and highlight the matched rows.
+        search_condition = literal_column(TRIGRAM_TEXT_EXPRESSION, Text).op("%>")(query)
+
+        # Main query with the total number of matches as a window count
         offset = (page - 1) * page_size
-        
+
         main_query = (
             select(
                 Document,
                 combined_similarity,
                 title_similarity,
                 content_similarity,
+                title_word_similarity,
+                content_word_similarity,
+                TOTAL_MATCHES,
             )
-            .options(selectinload(Document.owner))
+            .options(OWNER_BRIEF_OPTION, raiseload("*"))
             .where(search_condition)
         )
-        
+
         if filter_conditions:
             main_query = main_query.where(and_(*filter_conditions))
-        
+
         main_query = (
-            main_query
-            .order_by(combined_similarity.desc())
+            main_query.order_by(combined_similarity.desc())
             .offset(offset)
             .limit(page_size)
         )
-        
+
         result = await self.db.execute(main_query)
         rows = result.all()
-        
+        count_query = select(func.count(Document.id)).where(
+            search_condition, *filter_conditions
+        )
+        total = await self._page_total(rows, offset, count_query)
+
         # Build results
         results = []
         for row in rows:
             document = row[0]
             combined_sim = row[1]
-            title_sim = row[2]
-            content_sim = row[3]
-            
+            title_sim = row.title_word_sim
+            content_sim = row.content_word_sim
+
             highlights = []
-            if title_sim and title_sim > similarity_threshold:
-                highlights.append({
-                    "field": "title",
-                    "fragment": document.title,
-                })
-            if content_sim and content_sim > similarity_threshold and document.content:
+            if title_sim and title_sim >= similarity_threshold:
+                highlights.append(
+                    {
+                        "field": "title",
+                        "fragment": document.title,
+                    }
+                )
+            if content_sim and content_sim >= similarity_threshold and document.content:
                 # Get first 200 chars of content as fragment
-                fragment = document.content[:200] + "..." if len(document.content) > 200 else document.content
-                highlights.append({
-                    "field": "content",
-                    "fragment": fragment,
-                })
-            
-            results.append({
-                "document": document,
-                "rank": float(combined_sim) if combined_sim else 0.0,
-                "highlights": highlights,
-            })
-        
+                fragment = (
+                    document.content[:200] + "..."
+                    if len(document.content) > 200
+                    else document.content
+                )
+                highlights.append(
+                    {
+                        "field": "content",
+                        "fragment": fragment,
+                    }
+                )
+
+            results.append(
+                SearchHit(
+                    document=document,
+                    rank=float(combined_sim) if combined_sim else 0.0,
+                    highlights=highlights,
+                )
+            )
+
         return results, total
 
     async def get_suggestions(
@@ -339,27 +455,28 @@ class SearchService:
         Returns:
             List of suggestions with text, document_id, and field
         """
-        suggestions = []
-        
-        # Search in titles using LIKE with prefix
-        title_query = (
-            select(Document.id, Document.title)
-            .where(Document.title.ilike(f"%{query}%"))
+        # Substring ILIKE is answered by idx_documents_title_trgm (pg_trgm
+        # indexes LIKE/ILIKE); LIKE wildcards typed by the user match literally
+        pattern = "%" + LIKE_ESCAPE_RE.sub(r"\\\g<0>", query) + "%"
+        title_query = select(Document.id, Document.title).where(
+            Document.title.ilike(pattern, escape="\\")
         )
-        
+
         if owner_id is not None:
             title_query = title_query.where(Document.owner_id == owner_id)
-        
-        title_query = title_query.limit(limit)
-        
+
+        # Closest titles first; the LIMIT is applied by Postgres
+        title_query = title_query.order_by(
+            func.similarity(Document.title, query).desc()
+        ).limit(limit)
+
         result = await self.db.execute(title_query)
-        rows = result.all()
-        
-        for row in rows:
-            suggestions.append({
-                "text": row[1],
-                "document_id": row[0],
+
+        return [
+            {
+                "text": title,
+                "document_id": document_id,
                 "field": "title",
-            })
-        
-        return suggestions[:limit]
+            }
+            for document_id, title in result.all()
+        ]
@@ -1,14 +1,55 @@
 """Security utilities for password hashing and verification."""
 
-import bcrypt
+import asyncio
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-# Cost factor for bcrypt (12 is recommended for production)
-BCRYPT_ROUNDS = 12
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError
+from argon2.low_level import ARGON2_VERSION
+
+# argon2id cost parameters: 2 passes over 64 MiB, single lane
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 65536
+ARGON2_PARALLELISM = 1
+
+# Legacy bcrypt hashes ($2a$/$2b$/$2y$) are still verified and upgraded on login
+BCRYPT_HASH_PREFIX = "$2"
+
+_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+)
+
+# Hashes made with the current parameters share this prefix and length
+# (salt and digest are unpadded base64), so the common case of
+# needs_rehash is a string comparison rather than a full parse
+_CURRENT_HASH_PREFIX = (
+    f"$argon2id$v={ARGON2_VERSION}"
+    f"$m={_hasher.memory_cost},t={_hasher.time_cost},p={_hasher.parallelism}$"
+)
+_CURRENT_HASH_LENGTH = (
+    len(_CURRENT_HASH_PREFIX)
+    + math.ceil(_hasher.salt_len * 4 / 3)
+    + 1
+    + math.ceil(_hasher.hash_len * 4 / 3)
+)
+
+# Hashing holds a core per call (argon2 and bcrypt release the GIL), so it
+# runs on its own pool sized to the CPU count instead of sharing the
+# event loop's default executor with other blocking work
+HASH_WORKERS = os.cpu_count() or 1
+_hash_executor = ThreadPoolExecutor(
+    max_workers=HASH_WORKERS, thread_name_prefix="password-hash"
+)
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
 
     Args:
         password: Plain text password to hash.
@@ -18,19 +59,18 @@ def hash_password(password: str) -> str:
 
     Example:
         >>> hashed = hash_password("mysecretpassword")
-        >>> hashed.startswith("$2b$")
+        >>> hashed.startswith("$argon2id$")
         True
     """
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
+    return _hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
 
+    Accepts argon2id hashes and legacy bcrypt hashes.
+
     Args:
         plain_password: Plain text password to verify.
         hashed_password: Hashed password to compare against.
@@ -46,9 +86,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         False
     """
     try:
-        password_bytes = plain_password.encode("utf-8")
-        hashed_bytes = hashed_password.encode("utf-8")
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        if hashed_password.startswith(BCRYPT_HASH_PREFIX):
+            return bcrypt.checkpw(
+                plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+            )
+        return _hasher.verify(hashed_password, plain_password)
     except Exception:
         return False
 
@@ -57,7 +99,8 @@ def needs_rehash(hashed_password: str) -> bool:
     """
     Check if a password hash needs to be rehashed.
 
-    This is useful when upgrading the hashing algorithm or cost factor.
+    True for legacy bcrypt hashes and for argon2 hashes made with other
+    parameters than the current ones.
 
     Args:
         hashed_password: Hashed password to check.
@@ -65,13 +108,28 @@ def needs_rehash(hashed_password: str) -> bool:
     Returns:
         bool: True if password needs rehashing, False otherwise.
     """
-    # Check if the hash uses the current cost factor
+    if (
+        len(hashed_password) == _CURRENT_HASH_LENGTH
+        and hashed_password.startswith(_CURRENT_HASH_PREFIX)
+    ):
+        return False
+    if hashed_password.startswith(BCRYPT_HASH_PREFIX):
+        return True
     try:
-        # Extract rounds from hash (format: $2b$XX$...)
-        parts = hashed_password.split("$")
-        if len(parts) >= 3:
-            current_rounds = int(parts[2])
-            return current_rounds < BCRYPT_ROUNDS
-    except (ValueError, IndexError):
-        pass
-    return True
+        return _hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool, keeping the event loop free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool, keeping the event loop free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_password, plain_password, hashed_password
+    )
@@ -9,9 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.config import settings
+from app.core.database import engine
 
 
 async def test_connection():
@@ -25,28 +25,22 @@ async def test_connection():
     print()
 
     try:
-        engine = create_async_engine(settings.DATABASE_URL, echo=False)
-
         async with engine.connect() as conn:
-            # Test basic connection
-            result = await conn.execute(text("SELECT 1"))
-            print("✓ Basic connection: OK")
-
-            # Test PostgreSQL version
-            result = await conn.execute(text("SELECT version()"))
-            version = result.scalar()
-            print(f"✓ PostgreSQL version: {version.split(',')[0]}")
-
-            # Test extensions
+            # Connection, server version and extensions in one round trip
             result = await conn.execute(
                 text(
                     """
-                SELECT extname FROM pg_extension
-                WHERE extname IN ('uuid-ossp', 'pg_trgm', 'unaccent', 'vector')
+                SELECT version(), ARRAY(
+                    SELECT extname FROM pg_extension
+                    WHERE extname IN ('uuid-ossp', 'pg_trgm', 'unaccent', 'vector')
+                    ORDER BY extname
+                )
             """
                 )
             )
-            extensions = [row[0] for row in result.fetchall()]
+            version, extensions = result.one()
+            print("✓ Basic connection: OK")
+            print(f"✓ PostgreSQL version: {version.split(',')[0]}")
             print(
                 f"✓ Installed extensions: {', '.join(extensions) if extensions else 'None'}"
             )
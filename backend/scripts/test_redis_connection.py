@@ -44,8 +44,9 @@ async def test_redis_connection():
         await redis_client.set(test_key, test_value)
         print("✓ SET operation: OK")
 
-        # GET operation
-        retrieved = await redis_client.get(test_key)
+        # GET operation (the client returns raw bytes)
+        raw = await redis_client.get(test_key)
+        retrieved = raw.decode() if raw is not None else None
         if retrieved == test_value:
             print("✓ GET operation: OK")
         else:
@@ -1,19 +1,24 @@
 """Pytest configuration and fixtures for testing."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import contextmanager
 from typing import Any
 
+import orjson
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.config import settings
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, json_serializer
+from app.core.rbac_cache import local_user_cache, role_permission_cache
+from app.core.redis import RedisCache, cache_key, redis_client
 from app.main import create_application
 
 # Test database URL - use same database but different schema or test database
@@ -28,6 +33,19 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def reset_rbac_caches() -> None:
+    """
+    Start every test with empty RBAC caches.
+
+    Role and permission IDs are reused across tests, so grants cached in
+    process or in Redis by an earlier test would leak into later ones.
+    """
+    role_permission_cache.invalidate()
+    local_user_cache.clear()
+    await RedisCache(redis_client).delete_pattern(cache_key("rbac", "*"))
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_engine() -> AsyncGenerator[Any, None]:
     """Create test database engine."""
@@ -35,6 +53,16 @@ async def test_engine() -> AsyncGenerator[Any, None]:
         TEST_DATABASE_URL,
         poolclass=NullPool,
         echo=False,
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
+        connect_args={
+            "server_settings": {
+                # Same %> threshold the application engine connects with
+                "pg_trgm.word_similarity_threshold": str(
+                    settings.SEARCH_FUZZY_THRESHOLD
+                ),
+            },
+        },
     )
 
     async with engine.begin() as conn:
@@ -63,6 +91,34 @@ async def test_session(test_engine: Any) -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest.fixture
+def count_queries(test_engine: Any) -> Callable[[], Any]:
+    """
+    Context manager factory that counts SELECT statements on the test engine.
+
+    Example:
+        with count_queries() as queries:
+            ...
+        assert queries == []
+    """
+
+    @contextmanager
+    def _count() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, *args: Any) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count
+
+
 @pytest_asyncio.fixture(scope="function")
 async def app(test_session: AsyncSession) -> FastAPI:
     """Create test application with overridden dependencies."""
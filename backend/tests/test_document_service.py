@@ -1,16 +1,20 @@
 """Unit tests for Document service."""
 
-import pytest
-from sqlalchemy import select
 from uuid import uuid4
 
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.models.document import Document
 from app.models.user import User
 from app.schemas.document import DocumentCreate, DocumentUpdate
 from app.services.document import (
     check_document_ownership,
     create_document,
+    decode_cursor,
     delete_document,
+    encode_cursor,
     get_document,
     get_document_with_owner_check,
     get_documents_by_owner,
@@ -188,6 +192,26 @@ async def test_list_documents_pagination(
     assert total == len(test_documents)
 
 
+@pytest.mark.asyncio
+async def test_list_documents_cursor_pagination(
+    test_session: AsyncSession, test_documents: list[Document]
+):
+    """Test that cursor pages continue where the previous page ended."""
+    page_size = 2
+    first_page, _ = await list_documents(test_session, page_size=page_size)
+
+    cursor = decode_cursor(encode_cursor(first_page[-1]))
+    second_page, total = await list_documents(
+        test_session,
+        page_size=page_size,
+        cursor=cursor,
+    )
+
+    offset_page, _ = await list_documents(test_session, page=2, page_size=page_size)
+    assert [d.id for d in second_page] == [d.id for d in offset_page]
+    assert total == len(test_documents)
+
+
 @pytest.mark.asyncio
 async def test_get_documents_by_owner(
     test_session: AsyncSession, test_documents: list[Document], test_user: User
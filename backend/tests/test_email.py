@@ -0,0 +1,105 @@
+"""Unit tests for the pooled SMTP transport and bulk sends."""
+
+import asyncio
+from email.message import EmailMessage
+
+import pytest
+
+from app.services.email import EmailService, SMTPPool
+
+
+class FakeSMTP:
+    """Stand-in for an aiosmtplib.SMTP session."""
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.closed = False
+
+    async def send_message(self, message: EmailMessage) -> None:
+        self.sent += 1
+
+    async def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePool(SMTPPool):
+    """Pool that hands out FakeSMTP sessions instead of connecting."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.opened: list[FakeSMTP] = []
+
+    async def _connect(self) -> FakeSMTP:
+        client = FakeSMTP()
+        self.opened.append(client)
+        return client
+
+
+class TestSMTPPool:
+    """Tests for session reuse and recycling."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_sends_reuse_session(self) -> None:
+        """Test that one session carries consecutive messages."""
+        pool = FakePool(max_connections=5, max_messages=100)
+
+        for _ in range(3):
+            await pool.send(EmailMessage())
+
+        assert len(pool.opened) == 1
+        assert pool.opened[0].sent == 3
+
+    @pytest.mark.asyncio
+    async def test_session_recycled_after_max_messages(self) -> None:
+        """Test that a session is closed once it reaches max_messages."""
+        pool = FakePool(max_connections=5, max_messages=2)
+
+        for _ in range(5):
+            await pool.send(EmailMessage())
+
+        assert [client.sent for client in pool.opened] == [2, 2, 1]
+        assert [client.closed for client in pool.opened] == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_close_quits_idle_sessions(self) -> None:
+        """Test that close() shuts down every idle session."""
+        pool = FakePool(max_connections=5, max_messages=100)
+        await pool.send(EmailMessage())
+
+        await pool.close()
+
+        assert pool.opened[0].closed
+
+
+class TestSendBulk:
+    """Tests for concurrency-bounded bulk sends."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that no more than max_concurrency sends run at once."""
+        service = EmailService()
+        service.max_concurrency = 3
+        in_flight = peak = 0
+
+        async def fake_send_email(**kwargs) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return kwargs["to_email"] != "bad@example.com"
+
+        monkeypatch.setattr(service, "send_email", fake_send_email)
+        emails = [
+            {"to_email": f"user{i}@example.com", "subject": "Hi", "html_content": b"<p>Hi</p>"}
+            for i in range(10)
+        ]
+        emails.append({"to_email": "bad@example.com", "subject": "Hi", "html_content": b""})
+
+        results = await service.send_bulk(emails)
+
+        assert peak == 3
+        assert results == [True] * 10 + [False]
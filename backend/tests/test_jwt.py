@@ -13,6 +13,7 @@ from app.services.jwt import (
     create_tokens,
     decode_token,
     is_token_expired,
+    refresh_token_digest,
 )
 
 
@@ -170,3 +171,57 @@ class TestTokenTypes:
 
         assert payload is not None
         assert payload.type == "refresh"
+
+
+class TestDecodeCache:
+    """Tests for caching of verified token payloads."""
+
+    def test_repeated_decode_returns_cached_payload(self) -> None:
+        """Test that decoding the same token twice reuses the payload."""
+        token = create_access_token(uuid4())
+
+        assert decode_token(token) is decode_token(token)
+
+    def test_expired_cached_payload_is_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cached payload is not returned after it expires."""
+        token = create_access_token(uuid4())
+        payload = decode_token(token)
+        assert payload is not None
+
+        monkeypatch.setattr("app.services.jwt.time.time", lambda: payload.exp)
+
+        assert decode_token(token) is None
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the least recently used token is evicted when full."""
+        monkeypatch.setattr("app.services.jwt.DECODE_CACHE_SIZE", 2)
+        monkeypatch.setattr("app.services.jwt._decode_cache", {})
+        from app.services import jwt as jwt_service
+
+        first, second, third = (create_access_token(uuid4()) for _ in range(3))
+        decode_token(first)
+        decode_token(second)
+        decode_token(first)
+        decode_token(third)
+
+        assert list(jwt_service._decode_cache) == [first, third]
+
+
+class TestRefreshTokenDigest:
+    """Tests for the digest stored in place of refresh tokens."""
+
+    def test_digest_is_stable_and_fixed_size(self) -> None:
+        """Test that a token always maps to the same 32-character digest."""
+        token = create_refresh_token(uuid4())
+
+        assert refresh_token_digest(token) == refresh_token_digest(token)
+        assert len(refresh_token_digest(token)) == 32
+
+    def test_different_tokens_have_different_digests(self) -> None:
+        """Test that distinct refresh tokens do not share a digest."""
+        first = create_refresh_token(uuid4())
+        second = create_refresh_token(uuid4())
+
+        assert refresh_token_digest(first) != refresh_token_digest(second)
@@ -0,0 +1,106 @@
+"""Unit tests for the deferred last-login writer."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core import login_writer
+from app.core.login_writer import LastLoginWriter
+
+
+class TestLastLoginWriter:
+    """Tests for coalescing and batching of pending logins."""
+
+    def test_repeated_logins_coalesce(self) -> None:
+        """Test that only the latest timestamp per user is kept."""
+        writer = LastLoginWriter()
+        user_id = uuid4()
+        first = datetime.now(UTC)
+        second = first + timedelta(seconds=1)
+
+        writer.record(user_id, first)
+        writer.record(user_id, second)
+
+        assert writer.take_batches() == [[(user_id, second)]]
+
+    def test_batches_respect_batch_size(self) -> None:
+        """Test that pending rows are split into batches of batch_size."""
+        writer = LastLoginWriter(batch_size=2)
+        for _ in range(5):
+            writer.record(uuid4())
+
+        batches = writer.take_batches()
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_take_batches_drains_pending(self) -> None:
+        """Test that taken rows are not written twice."""
+        writer = LastLoginWriter()
+        writer.record(uuid4())
+
+        writer.take_batches()
+
+        assert writer.take_batches() == []
+
+
+class _FailingSession:
+    """Session stand-in whose statements fail, optionally mid-flush logins."""
+
+    def __init__(self, during_write: Callable[[], None] | None = None) -> None:
+        self.during_write = during_write
+
+    def __call__(self) -> "_FailingSession":
+        return self
+
+    async def __aenter__(self) -> "_FailingSession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def execute(self, *args: object, **kwargs: object) -> None:
+        if self.during_write is not None:
+            self.during_write()
+        raise ConnectionError("database unavailable")
+
+
+class TestLastLoginWriterFlush:
+    """Tests for flush() when the write fails."""
+
+    async def test_failed_flush_requeues_batches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that rows of a failed flush are written by the next one."""
+        monkeypatch.setattr(login_writer, "async_session_maker", _FailingSession())
+        writer = LastLoginWriter(batch_size=1)
+        first_user, second_user = uuid4(), uuid4()
+        when = datetime.now(UTC)
+        writer.record(first_user, when)
+        writer.record(second_user, when)
+
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+
+        assert writer.take_batches() == [[(first_user, when)], [(second_user, when)]]
+
+    async def test_requeue_keeps_newer_login(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a login recorded during a failed flush is not overwritten."""
+        writer = LastLoginWriter()
+        user_id = uuid4()
+        older = datetime.now(UTC)
+        newer = older + timedelta(seconds=1)
+        monkeypatch.setattr(
+            login_writer,
+            "async_session_maker",
+            _FailingSession(lambda: writer.record(user_id, newer)),
+        )
+        writer.record(user_id, older)
+
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+
+        assert writer.take_batches() == [[(user_id, newer)]]
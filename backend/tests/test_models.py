@@ -0,0 +1,67 @@
+"""Unit tests for model helpers."""
+
+import time
+from uuid import uuid4
+
+from app.models.base import BaseModel, UUIDMixin, uuid7
+from app.models.document import Document
+from app.models.role import Role
+
+
+class TestGeneratedToDict:
+    """Tests for the per-class generated to_dict."""
+
+    def test_contains_every_column(self) -> None:
+        """Test that to_dict returns one entry per table column."""
+        role = Role(name="Editor", description="Edits things", is_system=False)
+
+        data = role.to_dict()
+
+        assert set(data) == {column.name for column in Role.__table__.columns}
+        assert data["name"] == "Editor"
+        assert data["description"] == "Edits things"
+
+    def test_is_specialized_per_class(self) -> None:
+        """Test that each mapped class gets its own to_dict."""
+        owner_id = uuid4()
+        document = Document(title="Report", content="Body", owner_id=owner_id)
+
+        data = document.to_dict()
+
+        assert Document.to_dict is not Role.to_dict
+        assert data["owner_id"] == owner_id
+        assert "name" not in data
+
+
+class TestRepr:
+    """Tests for the precomputed default __repr__."""
+
+    def test_default_repr(self) -> None:
+        """Test the base model repr uses the class name and id."""
+        role = Role(name="Editor")
+        role.id = uuid4()
+
+        assert BaseModel.__repr__(role) == f"<Role(id={role.id})>"
+
+
+class TestUUID7:
+    """Tests for the UUIDv7 primary key generator."""
+
+    def test_version_and_variant(self) -> None:
+        """Test that generated UUIDs are RFC 9562 version 7."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_time_ordered(self) -> None:
+        """Test that UUIDs generated in later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+    def test_default_for_new_models(self) -> None:
+        """Test that BaseModel primary keys default to UUIDv7."""
+        assert UUIDMixin.id.column.default.arg.__name__ == "uuid7"
@@ -0,0 +1,35 @@
+"""Unit tests for signed password reset tokens."""
+
+from uuid import uuid4
+
+from app.services.password_reset import generate_reset_token, parse_reset_token
+
+
+class TestResetTokenSignature:
+    """Tests for generating and parsing self-identifying reset tokens."""
+
+    def test_token_identifies_user(self) -> None:
+        """Test that a generated token parses back to its user."""
+        user_id = uuid4()
+
+        assert parse_reset_token(generate_reset_token(user_id)) == user_id
+
+    def test_tokens_are_unique(self) -> None:
+        """Test that two tokens for the same user differ."""
+        user_id = uuid4()
+
+        assert generate_reset_token(user_id) != generate_reset_token(user_id)
+
+    def test_tampered_user_is_rejected(self) -> None:
+        """Test that swapping the user part invalidates the signature."""
+        token = generate_reset_token(uuid4())
+        forged = f"{uuid4().hex}{token[32:]}"
+
+        assert parse_reset_token(forged) is None
+
+    def test_malformed_tokens_are_rejected(self) -> None:
+        """Test that tokens without the expected parts are rejected."""
+        assert parse_reset_token("") is None
+        assert parse_reset_token("not-a-token") is None
+        assert parse_reset_token("a.b") is None
+        assert parse_reset_token("a.b.ü") is None
@@ -0,0 +1,184 @@
+"""Unit tests for rate limiting utilities."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import Settings
+from app.core import rate_limit
+from app.core.rate_limit import RateLimiter
+
+
+def make_request(host: str, forwarded_for: str | None = None) -> SimpleNamespace:
+    """Build a minimal request object for the rate limiter."""
+    headers = {"X-Forwarded-For": forwarded_for} if forwarded_for else {}
+    return SimpleNamespace(client=SimpleNamespace(host=host), headers=headers)
+
+
+class TestRateLimiterWhitelist:
+    """Tests for the trusted network short-circuit."""
+
+    def test_configured_loopback_is_whitelisted(self) -> None:
+        """Test that loopback addresses are trusted once explicitly configured."""
+        limiter = RateLimiter(action="test", whitelist_cidrs=["127.0.0.1/32", "::1/128"])
+        assert limiter.is_whitelisted("127.0.0.1") is True
+        assert limiter.is_whitelisted("::1") is True
+
+    def test_whitelist_is_empty_by_default(self) -> None:
+        """Test that no network bypasses rate limiting unless configured."""
+        assert Settings.model_fields["RATE_LIMIT_WHITELIST_CIDRS"].default == []
+
+    def test_subnet_membership(self) -> None:
+        """Test that configured subnets are matched."""
+        limiter = RateLimiter(action="test", whitelist_cidrs=["10.0.0.0/8"])
+        assert limiter.is_whitelisted("10.1.2.3") is True
+        assert limiter.is_whitelisted("192.168.1.1") is False
+
+    def test_invalid_ip_is_not_whitelisted(self) -> None:
+        """Test that unparseable client identifiers are not trusted."""
+        limiter = RateLimiter(action="test", whitelist_cidrs=["127.0.0.1/32"])
+        assert limiter.is_whitelisted("unknown") is False
+
+    def test_empty_whitelist(self) -> None:
+        """Test that an empty whitelist trusts nobody."""
+        limiter = RateLimiter(action="test", whitelist_cidrs=[])
+        assert limiter.is_whitelisted("127.0.0.1") is False
+
+    @pytest.mark.asyncio
+    async def test_whitelisted_request_skips_redis(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that whitelisted clients never reach the Redis check."""
+
+        async def fail_check(*args: object, **kwargs: object) -> tuple[bool, int]:
+            raise AssertionError("rate limit check should be skipped")
+
+        monkeypatch.setattr(rate_limit, "check_rate_limit_keys", fail_check)
+        limiter = RateLimiter(action="test", whitelist_cidrs=["127.0.0.1/32"])
+        await limiter(make_request("127.0.0.1"))
+
+    @pytest.mark.asyncio
+    async def test_forwarded_for_does_not_whitelist(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a forged X-Forwarded-For can't claim a trusted address."""
+        checked: list[str] = []
+
+        async def record_check(rate_key: str, block_key: str, **kwargs: object) -> tuple[bool, int]:
+            checked.append(rate_key)
+            return True, 1
+
+        monkeypatch.setattr(rate_limit, "check_rate_limit_keys", record_check)
+        limiter = RateLimiter(action="test", whitelist_cidrs=["127.0.0.1/32"])
+        await limiter(make_request("203.0.113.7", forwarded_for="127.0.0.1"))
+
+        assert len(checked) == 1
+
+
+class TestRateLimiterKeys:
+    """Tests for pre-built rate limit keys."""
+
+    @pytest.mark.asyncio
+    async def test_keys_match_helpers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the limiter builds the same keys as the module helpers."""
+        seen: dict[str, str] = {}
+
+        async def record_check(rate_key: str, block_key: str, **kwargs: object) -> tuple[bool, int]:
+            seen["rate_key"] = rate_key
+            seen["block_key"] = block_key
+            return True, 1
+
+        monkeypatch.setattr(rate_limit, "check_rate_limit_keys", record_check)
+        limiter = RateLimiter(action="login", whitelist_cidrs=[])
+        await limiter(make_request("203.0.113.7"))
+
+        assert seen["rate_key"] == rate_limit._get_rate_limit_key("203.0.113.7", "login")
+        assert seen["block_key"] == rate_limit._get_block_key("203.0.113.7", "login")
+
+
+class FakePipeline:
+    """Minimal in-memory stand-in for a non-transactional Redis pipeline."""
+
+    def __init__(self, store: dict[str, int]):
+        self.store = store
+        self.commands: list[tuple[str, tuple[object, ...]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        def queue(*args: object, **kwargs: object) -> None:
+            self.commands.append((name, args))
+
+        return queue
+
+    async def execute(self) -> list[object]:
+        results: list[object] = []
+        for name, args in self.commands:
+            key = str(args[0])
+            if name == "ttl":
+                results.append(300 if key in self.store else -2)
+            elif name == "incr":
+                self.store[key] = self.store.get(key, 0) + 1
+                results.append(self.store[key])
+            elif name == "set":
+                self.store[key] = 1
+                results.append(True)
+            elif name == "delete":
+                results.append(int(self.store.pop(key, None) is not None))
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    """Redis client exposing only what the rate limiter uses."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self.store)
+
+    async def delete(self, key: str) -> int:
+        return int(self.store.pop(key, None) is not None)
+
+
+class TestCheckRateLimitKeys:
+    """Tests for the pipelined rate limit check."""
+
+    @pytest.mark.asyncio
+    async def test_allows_then_blocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that requests are allowed up to the limit and then blocked."""
+        fake = FakeRedis()
+        monkeypatch.setattr(rate_limit, "redis_client", fake)
+
+        results = [
+            await rate_limit.check_rate_limit_keys(
+                "rl", "bl", max_requests=3, window_seconds=60, block_seconds=300
+            )
+            for _ in range(4)
+        ]
+
+        assert results[:3] == [(True, 2), (True, 1), (True, 0)]
+        assert results[3] == (False, 300)
+        assert "bl" in fake.store
+        assert "rl" not in fake.store
+
+    @pytest.mark.asyncio
+    async def test_blocked_requests_do_not_count(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that requests during a block leave no counter behind."""
+        fake = FakeRedis()
+        fake.store["bl"] = 1
+        monkeypatch.setattr(rate_limit, "redis_client", fake)
+
+        is_allowed, remaining = await rate_limit.check_rate_limit_keys("rl", "bl")
+
+        assert is_allowed is False
+        assert remaining == 300
+        assert "rl" not in fake.store
@@ -2,7 +2,6 @@
 
 import pytest
 from httpx import AsyncClient
-from uuid import uuid4
 
 from app.models.permission import Permission, PermissionScope
 from app.models.role import Role
@@ -73,14 +72,14 @@ async def test_get_role_by_id(async_client: AsyncClient, admin_token_headers, db
     )
     assert response.status_code == 200
     data = response.json()
-    assert data["id"] == str(role.id)
+    assert data["id"] == role.id
     assert data["name"] == "GetTestRole"
 
 
 @pytest.mark.asyncio
 async def test_get_role_not_found(async_client: AsyncClient, admin_token_headers):
     """Test getting a non-existent role."""
-    fake_id = uuid4()
+    fake_id = 32000
     response = await async_client.get(
         f"/api/v1/roles/{fake_id}",
         headers=admin_token_headers,
@@ -157,7 +156,7 @@ async def test_assign_permissions_to_role(async_client: AsyncClient, admin_token
 
     # Assign permissions
     assign_data = {
-        "permission_ids": [str(perm1.id), str(perm2.id)],
+        "permission_ids": [perm1.id, perm2.id],
     }
     response = await async_client.post(
         f"/api/v1/roles/{role.id}/permissions",
@@ -262,7 +261,7 @@ async def test_assign_role_to_user(async_client: AsyncClient, admin_token_header
     await db_session.commit()
 
     # Assign role
-    assign_data = {"role_id": str(role.id)}
+    assign_data = {"role_id": role.id}
     response = await async_client.post(
         f"/api/v1/users/{user.id}/roles",
         json=assign_data,
@@ -332,7 +331,7 @@ async def test_bulk_assign_role(async_client: AsyncClient, admin_token_headers,
     # Bulk assign role
     bulk_data = {
         "user_ids": [str(user1.id), str(user2.id)],
-        "role_id": str(role.id),
+        "role_id": role.id,
     }
     response = await async_client.post(
         "/api/v1/users/bulk/roles",
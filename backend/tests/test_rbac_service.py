@@ -1,8 +1,10 @@
 """Unit tests for RBACService."""
 
-import pytest
 from uuid import uuid4
 
+import pytest
+
+from app.core.rbac_cache import local_user_cache
 from app.models.permission import Permission, PermissionScope
 from app.models.role import Role
 from app.models.user import User
@@ -37,21 +39,27 @@ async def test_has_permission_with_exact_match(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     role_perm = RolePermission(role_id=role.id, permission_id=permission.id)
     db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
 
     # Test permission check
     rbac = RBACService(db_session)
-    result = await rbac.has_permission(user, "documents", "read", PermissionScope.ALL.value)
+    result = await rbac.has_permission(
+        user, "documents", "read", PermissionScope.ALL.value
+    )
     assert result is True
 
     # Test with different action
-    result = await rbac.has_permission(user, "documents", "write", PermissionScope.ALL.value)
+    result = await rbac.has_permission(
+        user, "documents", "write", PermissionScope.ALL.value
+    )
     assert result is False
 
 
@@ -83,23 +91,31 @@ async def test_has_permission_with_wildcard(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     role_perm = RolePermission(role_id=role.id, permission_id=permission.id)
     db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
 
     # Test permission check with wildcard
     rbac = RBACService(db_session)
-    result = await rbac.has_permission(user, "documents", "read", PermissionScope.ALL.value)
+    result = await rbac.has_permission(
+        user, "documents", "read", PermissionScope.ALL.value
+    )
     assert result is True
 
-    result = await rbac.has_permission(user, "documents", "write", PermissionScope.ALL.value)
+    result = await rbac.has_permission(
+        user, "documents", "write", PermissionScope.ALL.value
+    )
     assert result is True
 
-    result = await rbac.has_permission(user, "documents", "delete", PermissionScope.ALL.value)
+    result = await rbac.has_permission(
+        user, "documents", "delete", PermissionScope.ALL.value
+    )
     assert result is True
 
 
@@ -131,25 +147,33 @@ async def test_has_permission_scope_hierarchy(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     role_perm = RolePermission(role_id=role.id, permission_id=permission.id)
     db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
 
     # Test that 'all' scope permission satisfies 'own' scope requirement
     rbac = RBACService(db_session)
-    result = await rbac.has_permission(user, "documents", "read", PermissionScope.OWN.value)
+    result = await rbac.has_permission(
+        user, "documents", "read", PermissionScope.OWN.value
+    )
     assert result is True
 
     # Test that 'all' scope permission satisfies 'team' scope requirement
-    result = await rbac.has_permission(user, "documents", "read", PermissionScope.TEAM.value)
+    result = await rbac.has_permission(
+        user, "documents", "read", PermissionScope.TEAM.value
+    )
     assert result is True
 
     # Test that 'all' scope permission satisfies 'all' scope requirement
-    result = await rbac.has_permission(user, "documents", "read", PermissionScope.ALL.value)
+    result = await rbac.has_permission(
+        user, "documents", "read", PermissionScope.ALL.value
+    )
     assert result is True
 
 
@@ -172,6 +196,7 @@ async def test_has_role(db_session):
     await db_session.flush()
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -207,6 +232,7 @@ async def test_has_any_role(db_session):
 
     # Assign only Admin role
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=admin_role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -238,6 +264,7 @@ async def test_is_admin(db_session):
     await db_session.flush()
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=admin_role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -260,11 +287,14 @@ async def test_is_super_admin(db_session):
     db_session.add(user)
     await db_session.flush()
 
-    superadmin_role = Role(name="Super Admin", description="Super Admin role", is_system=True)
+    superadmin_role = Role(
+        name="Super Admin", description="Super Admin role", is_system=True
+    )
     db_session.add(superadmin_role)
     await db_session.flush()
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=superadmin_role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -288,8 +318,12 @@ async def test_get_user_permissions(db_session):
     await db_session.flush()
 
     # Create multiple permissions
-    perm1 = Permission(resource="documents", action="read", scope=PermissionScope.OWN.value)
-    perm2 = Permission(resource="documents", action="write", scope=PermissionScope.OWN.value)
+    perm1 = Permission(
+        resource="documents", action="read", scope=PermissionScope.OWN.value
+    )
+    perm2 = Permission(
+        resource="documents", action="write", scope=PermissionScope.OWN.value
+    )
     perm3 = Permission(resource="users", action="read", scope=PermissionScope.ALL.value)
     db_session.add_all([perm1, perm2, perm3])
     await db_session.flush()
@@ -300,11 +334,13 @@ async def test_get_user_permissions(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     for perm in [perm1, perm2, perm3]:
         role_perm = RolePermission(role_id=role.id, permission_id=perm.id)
         db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -314,7 +350,9 @@ async def test_get_user_permissions(db_session):
     permissions = await rbac.get_user_permissions(user)
 
     assert len(permissions) == 3
-    permission_strings = [f"{p['resource']}:{p['action']}:{p['scope']}" for p in permissions]
+    permission_strings = [
+        f"{p['resource']}:{p['action']}:{p['scope']}" for p in permissions
+    ]
     assert "documents:read:own" in permission_strings
     assert "documents:write:own" in permission_strings
     assert "users:read:all" in permission_strings
@@ -341,6 +379,7 @@ async def test_get_user_roles(db_session):
 
     # Assign roles to user
     from app.models.user_role import UserRole
+
     user_role1 = UserRole(user_id=user.id, role_id=role1.id)
     user_role2 = UserRole(user_id=user.id, role_id=role2.id)
     db_session.add_all([user_role1, user_role2])
@@ -384,10 +423,12 @@ async def test_has_any_permission(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     role_perm = RolePermission(role_id=role.id, permission_id=permission.id)
     db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -418,8 +459,12 @@ async def test_has_all_permissions(db_session):
     await db_session.flush()
 
     # Create permissions
-    perm1 = Permission(resource="documents", action="read", scope=PermissionScope.OWN.value)
-    perm2 = Permission(resource="documents", action="write", scope=PermissionScope.OWN.value)
+    perm1 = Permission(
+        resource="documents", action="read", scope=PermissionScope.OWN.value
+    )
+    perm2 = Permission(
+        resource="documents", action="write", scope=PermissionScope.OWN.value
+    )
     db_session.add_all([perm1, perm2])
     await db_session.flush()
 
@@ -429,11 +474,13 @@ async def test_has_all_permissions(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     for perm in [perm1, perm2]:
         role_perm = RolePermission(role_id=role.id, permission_id=perm.id)
         db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -460,6 +507,88 @@ async def test_has_all_permissions(db_session):
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_check_permissions_bulk(db_session):
+    """Test check_permissions_bulk returns one ordered result per check."""
+    user = User(
+        email="test14@example.com",
+        username="testuser14",
+        password_hash="hash",
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    perm = Permission(
+        resource="documents", action="read", scope=PermissionScope.TEAM.value
+    )
+    db_session.add(perm)
+    await db_session.flush()
+
+    role = Role(name="Team Reader", description="Team reader role")
+    db_session.add(role)
+    await db_session.flush()
+
+    from app.models.role_permission import RolePermission
+    from app.models.user_role import UserRole
+
+    db_session.add(RolePermission(role_id=role.id, permission_id=perm.id))
+    db_session.add(UserRole(user_id=user.id, role_id=role.id))
+    await db_session.commit()
+
+    rbac = RBACService(db_session)
+    results = await rbac.check_permissions_bulk(
+        user,
+        [
+            ("documents", "read", PermissionScope.OWN.value),
+            ("documents", "read", PermissionScope.ALL.value),
+            ("documents", "delete", PermissionScope.OWN.value),
+            ("documents", "read", PermissionScope.TEAM.value),
+        ],
+    )
+    assert results == [True, False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_user_has_permission_sql(db_session):
+    """Test the server-side user_has_permission() predicate."""
+    from sqlalchemy import select
+
+    from app.models.role_permission import RolePermission
+    from app.models.user_permission_mv import user_has_permission
+    from app.models.user_role import UserRole
+
+    user = User(
+        email="test15@example.com",
+        username="testuser15",
+        password_hash="hash",
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    perm = Permission(resource="labels", action="*", scope=PermissionScope.TEAM.value)
+    db_session.add(perm)
+    await db_session.flush()
+
+    role = Role(name="Label Team", description="Team label role")
+    db_session.add(role)
+    await db_session.flush()
+
+    db_session.add(RolePermission(role_id=role.id, permission_id=perm.id))
+    db_session.add(UserRole(user_id=user.id, role_id=role.id))
+    await db_session.commit()
+
+    async def check(action: str, scope: str) -> bool:
+        return await db_session.scalar(
+            select(user_has_permission(user.id, "labels", action, scope))
+        )
+
+    assert await check("update", PermissionScope.OWN.value) is True
+    assert await check("update", PermissionScope.TEAM.value) is True
+    assert await check("update", PermissionScope.ALL.value) is False
+
+
 @pytest.mark.asyncio
 async def test_invalidate_user_cache(db_session):
     """Test invalidate_user_cache method."""
@@ -488,10 +617,12 @@ async def test_invalidate_user_cache(db_session):
     await db_session.flush()
 
     from app.models.role_permission import RolePermission
+
     role_perm = RolePermission(role_id=role.id, permission_id=permission.id)
     db_session.add(role_perm)
 
     from app.models.user_role import UserRole
+
     user_role = UserRole(user_id=user.id, role_id=role.id)
     db_session.add(user_role)
     await db_session.commit()
@@ -507,3 +638,444 @@ async def test_invalidate_user_cache(db_session):
     permissions2 = await rbac.get_user_permissions(user)
 
     assert len(permissions1) == len(permissions2)
+
+
+@pytest.mark.asyncio
+async def test_get_all_roles_loads_permissions_eagerly(test_session, count_queries):
+    """Test that listing roles needs no further queries to render permissions."""
+    from sqlalchemy.exc import InvalidRequestError
+
+    from app.models.role_permission import RolePermission
+    from app.schemas.role import RoleResponse
+    from app.services.rbac import get_all_roles
+
+    permission = Permission(
+        resource="documents",
+        action="read",
+        scope=PermissionScope.ALL.value,
+    )
+    role = Role(name="Reader", description="Reads documents")
+    test_session.add_all([permission, role])
+    await test_session.flush()
+    test_session.add(RolePermission(role_id=role.id, permission_id=permission.id))
+    await test_session.commit()
+    test_session.expunge_all()
+
+    roles = await get_all_roles(test_session)
+
+    with count_queries() as queries:
+        responses = [RoleResponse.model_validate(r) for r in roles]
+
+    assert queries == []
+    assert responses[0].permissions[0].resource == "documents"
+
+    # Anything not loaded explicitly fails loudly instead of lazy loading
+    with pytest.raises(InvalidRequestError):
+        assert roles[0].permissions[0].roles is not None
+
+
+class TestPermissionCodes:
+    """Tests for interned permission code checks."""
+
+    def test_exact_match(self):
+        """Test that an exact permission is granted."""
+        from app.core.rbac_cache import codes_grant, permission_codes
+
+        codes = permission_codes(
+            [
+                {
+                    "resource": "documents",
+                    "action": "read",
+                    "scope": PermissionScope.OWN.value,
+                },
+            ]
+        )
+
+        assert (
+            codes_grant(codes, "documents", "read", PermissionScope.OWN.value) is True
+        )
+        assert (
+            codes_grant(codes, "documents", "update", PermissionScope.OWN.value)
+            is False
+        )
+        assert codes_grant(codes, "labels", "read", PermissionScope.OWN.value) is False
+
+    def test_scope_hierarchy(self):
+        """Test that higher scopes include lower ones but not the reverse."""
+        from app.core.rbac_cache import codes_grant, permission_codes
+
+        codes = permission_codes(
+            [
+                {
+                    "resource": "documents",
+                    "action": "read",
+                    "scope": PermissionScope.TEAM.value,
+                },
+            ]
+        )
+
+        assert (
+            codes_grant(codes, "documents", "read", PermissionScope.OWN.value) is True
+        )
+        assert (
+            codes_grant(codes, "documents", "read", PermissionScope.TEAM.value) is True
+        )
+        assert (
+            codes_grant(codes, "documents", "read", PermissionScope.ALL.value) is False
+        )
+
+    def test_wildcards(self):
+        """Test wildcard resource and action permissions."""
+        from app.core.rbac_cache import codes_grant, permission_codes
+
+        codes = permission_codes(
+            [
+                {
+                    "resource": "system",
+                    "action": "*",
+                    "scope": PermissionScope.ALL.value,
+                },
+                {"resource": "*", "action": "read", "scope": PermissionScope.OWN.value},
+            ]
+        )
+
+        assert (
+            codes_grant(codes, "system", "restart", PermissionScope.ALL.value) is True
+        )
+        assert codes_grant(codes, "anything", "read", PermissionScope.OWN.value) is True
+        assert (
+            codes_grant(codes, "anything", "read", PermissionScope.ALL.value) is False
+        )
+        assert (
+            codes_grant(codes, "anything", "delete", PermissionScope.OWN.value) is False
+        )
+
+    def test_index_keeps_highest_scope(self):
+        """Test that the index keeps the highest scope per resource/action."""
+        from app.core.rbac_cache import index_grants, permission_codes, permission_index
+
+        index = permission_index(
+            permission_codes(
+                [
+                    {
+                        "resource": "documents",
+                        "action": "read",
+                        "scope": PermissionScope.OWN.value,
+                    },
+                    {
+                        "resource": "documents",
+                        "action": "read",
+                        "scope": PermissionScope.ALL.value,
+                    },
+                ]
+            )
+        )
+
+        assert len(index) == 1
+        assert (
+            index_grants(index, "documents", "read", PermissionScope.ALL.value) is True
+        )
+        assert (
+            index_grants(index, "documents", "read", PermissionScope.TEAM.value) is True
+        )
+        assert (
+            index_grants(index, "documents", "update", PermissionScope.OWN.value)
+            is False
+        )
+
+    def test_unknown_names_are_not_interned(self):
+        """Test that checking unknown permissions doesn't grow the intern tables."""
+        from app.core import rbac_cache
+
+        size = len(rbac_cache._RESOURCE_IDS)
+        assert (
+            rbac_cache.codes_grant(frozenset(), "never-seen-resource", "read") is False
+        )
+        assert len(rbac_cache._RESOURCE_IDS) == size
+
+
+class TestRolePermissionCache:
+    """Tests for the process-local role permission cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_codes_unions_roles(self):
+        """Test that codes from every role are combined."""
+        import time
+
+        from app.core.rbac_cache import (
+            RolePermissionCache,
+            codes_grant,
+            permission_code,
+        )
+
+        cache = RolePermissionCache()
+        cache._codes = {
+            1: frozenset({permission_code("documents", "read", "own")}),
+            2: frozenset({permission_code("labels", "create", "own")}),
+        }
+        cache._loaded_at = time.monotonic()
+
+        codes = await cache.get_codes(None, [1, 2, 99])
+
+        assert codes_grant(codes, "documents", "read") is True
+        assert codes_grant(codes, "labels", "create") is True
+        assert codes_grant(codes, "documents", "delete") is False
+
+    @pytest.mark.asyncio
+    async def test_get_index_is_memoized_per_role_set(self):
+        """Test that one index is built per role combination until reload."""
+        import time
+
+        from app.core.rbac_cache import (
+            RolePermissionCache,
+            index_grants,
+            permission_code,
+        )
+
+        cache = RolePermissionCache()
+        cache._codes = {
+            1: frozenset({permission_code("documents", "read", "own")}),
+            2: frozenset({permission_code("labels", "create", "own")}),
+        }
+        cache._loaded_at = time.monotonic()
+
+        index = await cache.get_index(None, [1, 2])
+
+        assert await cache.get_index(None, [2, 1]) is index
+        assert index_grants(index, "labels", "create") is True
+        assert index_grants(index, "documents", "delete") is False
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self, monkeypatch):
+        """Test that invalidation reloads before the next lookup."""
+        import time
+
+        from app.core.rbac_cache import RolePermissionCache
+
+        cache = RolePermissionCache()
+        cache._loaded_at = time.monotonic()
+        loads = []
+
+        async def fake_load(db):
+            loads.append(db)
+            cache._loaded_at = time.monotonic()
+
+        monkeypatch.setattr(cache, "load", fake_load)
+
+        await cache.get_codes("db", [])
+        assert loads == []
+
+        cache.invalidate()
+        await cache.get_codes("db", [])
+        assert loads == ["db"]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands the cache uses."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.published: list[tuple[str, str]] = []
+        self.executed = 0
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+
+    async def incrby(self, key, amount):
+        value = int(self.data.get(key, 0)) + amount
+        self.data[key] = str(value).encode()
+        return value
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and applies them on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((self.redis.set, (key, value)))
+
+    def incrby(self, key, amount):
+        self.commands.append((self.redis.incrby, (key, amount)))
+
+    def publish(self, channel, message):
+        self.commands.append((self.redis.publish, (channel, message)))
+
+    async def execute(self):
+        self.redis.executed += 1
+        return [await command(*args) for command, args in self.commands]
+
+
+class TestCacheRevisions:
+    """Tests for generation-stamped permission and role cache entries."""
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates_cached_entries(self):
+        """Test that bumping a role's revision makes its users' entries stale."""
+        redis = FakeRedis()
+        user = User(id=uuid4(), role_ids=[2, 1])
+
+        def service():
+            # A fresh worker: nothing cached in process
+            local_user_cache.clear()
+            rbac = RBACService(None)
+            rbac.cache.client = redis
+            return rbac
+
+        rbac = service()
+        key = rbac._user_roles_cache_key(user.id)
+        entries, revisions = await rbac._prefetch(user)
+        assert entries == {}
+        await rbac._write_cached({key: [{"id": 1}]}, revisions)
+
+        entries, _ = await service()._prefetch(user)
+        assert entries == {key: [{"id": 1}]}
+
+        await rbac.invalidate_role_cache(2)
+
+        entries, _ = await service()._prefetch(user)
+        assert entries == {}
+        assert redis.published == [("rbac:invalidate", "role:2")]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_reads_once_per_request(self):
+        """Test that permissions and roles come from a single MGET per request."""
+        redis = FakeRedis()
+        calls = []
+        mget = redis.mget
+
+        async def counting_mget(keys):
+            calls.append(keys)
+            return await mget(keys)
+
+        redis.mget = counting_mget
+        rbac = RBACService(None)
+        rbac.cache.client = redis
+        user = User(id=uuid4(), role_ids=[1])
+
+        await rbac._prefetch(user)
+        await rbac._prefetch(user)
+        # Another request in the same worker is served from the local cache
+        second = RBACService(None)
+        second.cache.client = redis
+        await second._prefetch(user)
+
+        assert len(calls) == 1
+        assert rbac._user_permissions_cache_key(user.id) in calls[0]
+        assert rbac._user_roles_cache_key(user.id) in calls[0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_invalidation_uses_one_round_trip(self):
+        """Test that invalidating many users sends a single pipeline."""
+        redis = FakeRedis()
+        rbac = RBACService(None)
+        rbac.cache.client = redis
+        user_ids = [uuid4(), uuid4(), uuid4()]
+
+        await rbac.bulk_invalidate_users(user_ids)
+
+        assert redis.executed == 1
+        for user_id in user_ids:
+            assert redis.data[rbac._user_revision_key(user_id)] == b"1"
+        assert redis.published == [
+            ("rbac:invalidate", f"user:{user_id}") for user_id in user_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_role_name_set_is_cached_with_entries(self):
+        """Test that role checks reuse one name set across requests."""
+        redis = FakeRedis()
+        user = User(id=uuid4(), role_ids=[1])
+        rbac = RBACService(None)
+        rbac.cache.client = redis
+        entries, _ = await rbac._prefetch(user)
+        entries[rbac._user_roles_cache_key(user.id)] = [{"id": 1, "name": "Admin"}]
+
+        assert await rbac.has_role(user, "Admin")
+        assert not await rbac.has_role(user, "Super Admin")
+        assert await rbac.has_any_role(user, ["Super Admin", "Admin"])
+        assert not await rbac.has_any_role(user, ["Editor"])
+
+        # Another request in the same worker gets the same set back
+        second = RBACService(None)
+        second.cache.client = redis
+        assert await second.get_user_role_names(user) is await rbac.get_user_role_names(
+            user
+        )
+
+    @pytest.mark.asyncio
+    async def test_unloaded_role_ids_bypass_cache(self):
+        """Test that the cache is skipped when role revisions can't be named."""
+        rbac = RBACService(None)
+        rbac.cache.client = FakeRedis()
+        user = User(id=uuid4())
+
+        assert await rbac._prefetch(user) == ({}, None)
+
+
+class TestLocalUserCache:
+    """Tests for the in-process stage of the RBAC user cache."""
+
+    def test_entries_are_tied_to_role_set(self):
+        """Test that a user whose roles changed misses the local entry."""
+        from app.core.rbac_cache import LocalUserCache
+
+        cache = LocalUserCache()
+        user_id = uuid4()
+        cache.set(user_id, [1, 2], {"k": "v"}, [0, 0, 0])
+
+        assert cache.get(user_id, [2, 1]) == ({"k": "v"}, [0, 0, 0])
+        assert cache.get(user_id, [1]) is None
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after the TTL."""
+        from app.core.rbac_cache import LocalUserCache
+
+        cache = LocalUserCache(ttl=0)
+        user_id = uuid4()
+        cache.set(user_id, [1], {}, [0, 0])
+
+        assert cache.get(user_id, [1]) is None
+
+    def test_messages_evict_users_and_roles(self):
+        """Test that published invalidations evict the matching entries."""
+        from app.core.rbac_cache import LocalUserCache
+
+        cache = LocalUserCache()
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.set(first, [1], {}, [0, 0])
+        cache.set(second, [1, 2], {}, [0, 0, 0])
+        cache.set(third, [3], {}, [0, 0])
+
+        cache.handle_message(b"role:1")
+        cache.handle_message(f"user:{third}".encode())
+
+        assert cache.get(first, [1]) is None
+        assert cache.get(second, [1, 2]) is None
+        assert cache.get(third, [3]) is None
+
+    def test_least_recently_used_user_is_evicted(self):
+        """Test that a full cache drops its least recently used user."""
+        from app.core.rbac_cache import LocalUserCache
+
+        cache = LocalUserCache(max_size=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.set(first, [], {}, [0])
+        cache.set(second, [], {}, [0])
+        cache.get(first, [])
+        cache.set(third, [], {}, [0])
+
+        assert cache.get(second, []) is None
+        assert cache.get(first, []) is not None
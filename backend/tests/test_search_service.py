@@ -1,7 +1,11 @@
 """Unit tests for Search service."""
 
+from datetime import datetime
+
 import pytest
-from datetime import datetime, timedelta
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.document import Document
 from app.models.user import User
@@ -23,7 +27,7 @@ async def test_search_simple(test_session: AsyncSession, test_documents: list[Do
     
     assert total > 0
     assert len(results) > 0
-    assert results[0]["rank"] >= 0
+    assert results[0].rank >= 0
 
 
 @pytest.mark.asyncio
@@ -95,7 +99,7 @@ async def test_search_with_owner_filter(
     
     # All results should belong to test_user
     for result in results:
-        assert result["document"].owner_id == test_user.id
+        assert result.document.owner_id == test_user.id
 
 
 @pytest.mark.asyncio
@@ -138,7 +142,7 @@ async def test_search_with_meta_filter(
     
     assert total >= 0
     for result in results:
-        assert result["document"].meta.get("index") == 0
+        assert result.document.meta.get("index") == 0
 
 
 @pytest.mark.asyncio
@@ -167,7 +171,29 @@ async def test_search_pagination(test_session: AsyncSession, test_documents: lis
     
     # Results should be different (different pages)
     if total > page_size:
-        assert results_1[0]["document"].id != results_2[0]["document"].id
+        assert results_1[0].document.id != results_2[0].document.id
+
+
+@pytest.mark.asyncio
+async def test_search_total_past_last_page(test_session: AsyncSession, test_documents: list[Document]):
+    """Test that a page past the last match still reports the total."""
+    search_service = SearchService(test_session)
+    
+    _, total = await search_service.search(
+        query="document",
+        mode=SearchMode.SIMPLE,
+        page=1,
+        page_size=10,
+    )
+    results, total_past_end = await search_service.search(
+        query="document",
+        mode=SearchMode.SIMPLE,
+        page=100,
+        page_size=10,
+    )
+    
+    assert results == []
+    assert total_past_end == total
 
 
 @pytest.mark.asyncio
@@ -184,11 +210,11 @@ async def test_search_highlights(test_session: AsyncSession, test_documents: lis
     
     for result in results:
         # Check that highlights are present
-        assert "highlights" in result
-        assert isinstance(result["highlights"], list)
+        assert hasattr(result, "highlights")
+        assert isinstance(result.highlights, list)
         
         # If there are highlights, they should have field and fragment
-        for highlight in result["highlights"]:
+        for highlight in result.highlights:
             assert "field" in highlight
             assert "fragment" in highlight
             assert highlight["field"] in ["title", "content"]
@@ -248,7 +274,25 @@ async def test_search_ranking(test_session: AsyncSession, test_documents: list[D
     if len(results) > 1:
         # Results should be sorted by rank (descending)
         for i in range(len(results) - 1):
-            assert results[i]["rank"] >= results[i + 1]["rank"]
+            assert results[i].rank >= results[i + 1].rank
+
+
+@pytest.mark.asyncio
+async def test_search_uses_gin_index(test_session: AsyncSession, test_documents: list[Document]):
+    """Test that full-text matches go through the search_vector index."""
+    # Tiny test tables would otherwise always be sequentially scanned
+    await test_session.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await test_session.execute(
+        text(
+            "EXPLAIN SELECT id FROM documents "
+            "WHERE search_vector @@ websearch_to_tsquery('english', :q)"
+        ),
+        {"q": "test document"},
+    )
+    plan = "\n".join(row[0] for row in result.all())
+
+    # GIN plans a bitmap scan, RUM (SEARCH_USE_RUM) may plan an index scan
+    assert "idx_documents_search_vector" in plan
 
 
 # Fixtures
@@ -14,12 +14,11 @@ class TestPasswordHashing:
         hashed = hash_password(password)
         assert isinstance(hashed, str)
 
-    def test_hash_password_returns_bcrypt_hash(self) -> None:
-        """Test that hash_password returns a bcrypt hash."""
+    def test_hash_password_returns_argon2id_hash(self) -> None:
+        """Test that hash_password returns an argon2id hash."""
         password = "mysecretpassword123"
         hashed = hash_password(password)
-        # Bcrypt hashes start with $2b$
-        assert hashed.startswith("$2b$")
+        assert hashed.startswith("$argon2id$")
 
     def test_hash_password_different_for_same_input(self) -> None:
         """Test that hashing same password twice gives different hashes (salt)."""
@@ -71,3 +70,33 @@ class TestPasswordHashing:
         password = "mysecretpassword123"
         hashed = hash_password(password)
         assert needs_rehash(hashed) is False
+
+    def test_needs_rehash_outdated_parameters(self) -> None:
+        """Test that argon2 hashes made with other parameters need rehashing."""
+        from argon2 import PasswordHasher
+
+        hashed = PasswordHasher(time_cost=1, memory_cost=8192).hash("password")
+        assert needs_rehash(hashed) is True
+
+    def test_legacy_bcrypt_hash_verifies_and_needs_rehash(self) -> None:
+        """Test that bcrypt hashes still verify and are flagged for upgrade."""
+        import bcrypt
+
+        password = "mysecretpassword123"
+        hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=4)).decode()
+        assert verify_password(password, hashed) is True
+        assert verify_password("wrong", hashed) is False
+        assert needs_rehash(hashed) is True
+
+    def test_invalid_hash_does_not_verify(self) -> None:
+        """Test that a malformed hash is rejected rather than raising."""
+        assert verify_password("password", "not-a-hash") is False
+        assert needs_rehash("not-a-hash") is True
+
+    @pytest.mark.asyncio
+    async def test_async_helpers_round_trip(self) -> None:
+        """Test hashing and verifying off the event loop."""
+        from app.services.security import hash_password_async, verify_password_async
+
+        hashed = await hash_password_async("mysecretpassword123")
+        assert await verify_password_async("mysecretpassword123", hashed) is True